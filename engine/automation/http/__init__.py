@@ -0,0 +1,14 @@
+# root/engine/automation/http/__init__.py
+"""Browserless HTTP helpers for flows that only read the document head."""
+# Why: keep one stable import path for flows/hooks, like the Playwright session package.
+
+from __future__ import annotations
+
+from .head_fetch import HeadSnapshot, browser_reason, fetch_head, new_http_client
+
+__all__ = [
+    "HeadSnapshot",
+    "browser_reason",
+    "fetch_head",
+    "new_http_client",
+]
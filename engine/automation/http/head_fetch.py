@@ -0,0 +1,173 @@
+# root/engine/automation/http/head_fetch.py
+"""Fetch a page over plain HTTP and parse <title>/<meta> until the head ends."""
+# Why: reading head tags needs neither a browser nor the page body.
+
+from __future__ import annotations
+
+import codecs
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Any, cast
+
+import httpx
+import structlog
+
+_logger = structlog.get_logger(__name__)
+
+# Desktop Chrome, same as the first seed profile: servers answer what the browser would see.
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+_HEADERS = {
+    "user-agent": USER_AGENT,
+    "accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+    "accept-language": "en-US,en;q=0.9",
+}
+
+# Tags allowed in <head>; anything else means the parser has reached the body.
+_HEAD_TAGS = frozenset(
+    {"html", "head", "title", "meta", "link", "script", "style", "base", "noscript", "template"}
+)
+# Bot walls and auth pages: the real browser may get through where a plain GET does not.
+_BROWSER_STATUSES = frozenset({401, 403, 429, 503})
+# Finish reading short leftovers so the connection returns to the pool instead of closing.
+_DRAIN_MAX_BYTES = 64 * 1024
+
+
+class _HeadParser(HTMLParser):
+    """Collect what BasePage.collect_snapshot reads; `done` once the head is over."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.title: str | None = None
+        self.meta_tags: dict[str, str] = {}
+        self.scripts = 0
+        self.done = False
+        self._title_parts: list[str] | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self.done:
+            return
+        if tag not in _HEAD_TAGS:
+            self.done = True
+        elif tag == "title" and self.title is None:
+            self._title_parts = []
+        elif tag == "meta":
+            a = dict(attrs)
+            key, value = a.get("name") or a.get("property"), a.get("content")
+            if key and value:
+                self.meta_tags[key] = value
+        elif tag == "script":
+            self.scripts += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title" and self._title_parts is not None:
+            # document.title collapses whitespace the same way.
+            self.title = " ".join("".join(self._title_parts).split())
+            self._title_parts = None
+        elif tag == "head":
+            self.done = True
+
+    def handle_data(self, data: str) -> None:
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+
+
+@dataclass(slots=True)
+class HeadSnapshot:
+    """What one GET learned about a page."""
+
+    final_url: str
+    http_status: int
+    content_type: str
+    title: str | None = None
+    meta_tags: dict[str, str] = field(default_factory=dict)
+    scripts: int = 0
+    bytes_read: int = 0
+
+    def as_snapshot(self) -> dict[str, Any]:
+        """Same keys as CommonPage.navigate_and_collect, so flows shape both alike."""
+        return {
+            "title": self.title or "",
+            "final_url": self.final_url,
+            "http_status": self.http_status,
+            "meta_tags": dict(self.meta_tags),
+        }
+
+
+def browser_reason(snap: HeadSnapshot) -> str | None:
+    """Why this page still needs the browser, or None when the GET answer is enough."""
+    if snap.http_status in _BROWSER_STATUSES:
+        return "blocked_status"
+    if "html" not in snap.content_type:
+        return "not_html"
+    if not snap.title and snap.scripts:
+        return "js_title"  # app shell: the title is set by script
+    if not snap.title and not snap.meta_tags:
+        return "empty_head"
+    return None
+
+
+def new_http_client(settings: Any) -> httpx.AsyncClient:
+    """One pooled client per job; keep-alive makes same-host items cheap."""
+    size = max(1, int(getattr(settings, "http_pool_size", 64)))
+    return httpx.AsyncClient(
+        headers=_HEADERS,
+        follow_redirects=True,
+        timeout=httpx.Timeout(30.0, connect=10.0),  # same budget as BasePage.safe_navigate
+        limits=httpx.Limits(max_connections=size, max_keepalive_connections=size),
+    )
+
+
+def _decoder(resp: httpx.Response) -> codecs.IncrementalDecoder:
+    try:
+        return codecs.getincrementaldecoder(resp.encoding or "utf-8")(errors="replace")
+    except LookupError:  # charset label Python does not know
+        return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+
+def _drainable(resp: httpx.Response) -> bool:
+    try:
+        left = int(resp.headers.get("content-length") or -1) - resp.num_bytes_downloaded
+    except ValueError:
+        return False
+    return 0 <= left <= _DRAIN_MAX_BYTES
+
+
+async def fetch_head(
+    client: httpx.AsyncClient, url: str, *, max_bytes: int = 256 * 1024
+) -> HeadSnapshot:
+    """GET url and stream-parse until </head>, the first body tag, or max_bytes.
+
+    Transport errors propagate (httpx.HTTPError); callers decide whether to fall back.
+    """
+    async with client.stream("GET", url) as resp:
+        snap = HeadSnapshot(
+            final_url=str(resp.url),
+            http_status=resp.status_code,
+            content_type=resp.headers.get("content-type", "").lower(),
+        )
+        if "html" not in snap.content_type:
+            return snap
+
+        parser = _HeadParser()
+        decoder = _decoder(resp)
+        chunks = cast(AsyncGenerator[bytes, None], resp.aiter_bytes())
+        async with aclosing(chunks):
+            async for chunk in chunks:
+                snap.bytes_read += len(chunk)
+                parser.feed(decoder.decode(chunk))
+                if parser.done or snap.bytes_read >= max_bytes:
+                    break
+            if _drainable(resp):
+                async for _ in chunks:
+                    pass
+
+    snap.title, snap.meta_tags, snap.scripts = parser.title, parser.meta_tags, parser.scripts
+    _logger.debug(
+        "head_fetched", url=url, status=snap.http_status, bytes=snap.bytes_read, done=parser.done
+    )
+    return snap
@@ -0,0 +1,44 @@
+# root/engine/automation/playwright/pages/async_base_page.py
+"""Basic async actions for flows on the async engine."""
+# Why: same surface as BasePage so flows switch engines without new concepts.
+
+from __future__ import annotations
+
+from typing import Any
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from ....core.errors import FlowTimeoutError, NavigationError
+from ....core.timing import timed_step
+from .base_page import META_TAGS_JS
+
+
+class AsyncBasePage:
+    """Thin wrapper around a playwright.async_api Page."""
+
+    def __init__(self, page: Any) -> None:
+        self._page = page
+
+    @property
+    def page(self) -> Any:
+        """Expose underlying Playwright page when flows need full power."""
+        return self._page
+
+    @timed_step("navigate")
+    async def safe_navigate(self, url: str) -> int | None:
+        """Navigate once with sane defaults; raise typed errors for runner."""
+        try:
+            resp = await self._page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            return resp.status if resp else None
+        except (TimeoutError, PlaywrightTimeoutError) as e:
+            raise FlowTimeoutError(str(e)) from e
+        except Exception as e:
+            raise NavigationError(str(e)) from e
+
+    @timed_step("snapshot")
+    async def collect_snapshot(self) -> dict[str, object]:
+        """Capture minimal SEO-ish snapshot used by CRAWL_SIMPLE."""
+        title = await self._page.title()
+        final_url = self._page.url
+        meta_map = await self._page.evaluate(META_TAGS_JS)
+        return {"title": title, "final_url": final_url, "meta_tags": meta_map}
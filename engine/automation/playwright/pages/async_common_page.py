@@ -0,0 +1,18 @@
+# root/engine/automation/playwright/pages/async_common_page.py
+"""High-level async actions composed from AsyncBasePage."""
+# Why: flows call one method instead of wiring steps each time.
+
+from __future__ import annotations
+
+from .async_base_page import AsyncBasePage
+
+
+class AsyncCommonPage(AsyncBasePage):
+    """Expose a compact surface for crawl/validate flows."""
+
+    async def navigate_and_collect(self, url: str) -> dict[str, object]:
+        """Go to url and return {title, final_url, http_status, meta_tags}."""
+        status = await self.safe_navigate(url)
+        snap = await self.collect_snapshot()
+        snap["http_status"] = status
+        return snap
@@ -7,6 +7,18 @@ from __future__ import annotations
 from typing import Any
 
 from ....core.errors import FlowTimeoutError, NavigationError
+from ....core.timing import timed_step
+
+# Meta tags: name/property → content (shared with AsyncBasePage).
+META_TAGS_JS = """() => {
+  const out = {};
+  for (const el of document.querySelectorAll('meta')) {
+    const k = el.getAttribute('name') || el.getAttribute('property');
+    const v = el.getAttribute('content');
+    if (k && v) out[k] = v;
+  }
+  return out;
+}"""
 
 
 class BasePage:
@@ -20,6 +32,7 @@ class BasePage:
         """Expose underlying Playwright page when flows need full power."""
         return self._page
 
+    @timed_step("navigate")
     def safe_navigate(self, url: str) -> int | None:
         """Navigate once with sane defaults; raise typed errors for runner."""
         try:
@@ -30,20 +43,10 @@ class BasePage:
         except Exception as e:
             raise NavigationError(str(e)) from e
 
+    @timed_step("snapshot")
     def collect_snapshot(self) -> dict[str, object]:
         """Capture minimal SEO-ish snapshot used by CRAWL_SIMPLE."""
         title = self._page.title()
         final_url = self._page.url
-        # Meta tags: name/property → content
-        meta_map = self._page.evaluate(
-            """() => {
-              const out = {};
-              for (const el of document.querySelectorAll('meta')) {
-                const k = el.getAttribute('name') || el.getAttribute('property');
-                const v = el.getAttribute('content');
-                if (k && v) out[k] = v;
-              }
-              return out;
-            }"""
-        )
+        meta_map = self._page.evaluate(META_TAGS_JS)
         return {"title": title, "final_url": final_url, "meta_tags": meta_map}
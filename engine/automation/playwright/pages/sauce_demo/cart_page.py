@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from .....core.timing import timed_step
 from ...locators import sauce_demo as L
 from .step_one_page import CheckoutStepOnePage
 
@@ -16,6 +17,7 @@ class CartPage:
     def __init__(self, page: Any) -> None:
         self.page = page
 
+    @timed_step("cart_check")
     def assert_contains(self, expected_names: list[str]) -> CartPage:
         items = self.page.locator(L.L_CART_ITEM)
         found = [
@@ -26,6 +28,7 @@ class CartPage:
             raise RuntimeError(f"Cart missing: {sorted(missing)}")
         return self
 
+    @timed_step("checkout")
     def checkout(self) -> CheckoutStepOnePage:
         self.page.click(L.L_BTN_CHECKOUT)
         self.page.wait_for_url(L.URL_STEP1)
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from .....core.timing import timed_step
 from ...locators import sauce_demo as L
 
 
@@ -15,6 +16,7 @@ class CheckoutCompletePage:
     def __init__(self, page: Any) -> None:
         self.page = page
 
+    @timed_step("assert_complete")
     def assert_success(self) -> CheckoutCompletePage:
         assert self.page.locator(L.L_COMPLETE_HEADER).first.is_visible()
         assert self.page.locator(L.L_COMPLETE_TEXT).first.is_visible()
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from .....core.timing import timed_step
 from ...locators import sauce_demo as L
 from .cart_page import CartPage
 
@@ -16,10 +17,12 @@ class InventoryPage:
     def __init__(self, page: Any) -> None:
         self.page = page
 
+    @timed_step("wait_inventory")
     def wait_loaded(self) -> InventoryPage:
         self.page.wait_for_selector(L.L_INV_LIST)
         return self
 
+    @timed_step("add_to_cart")
     def add_products_by_name(self, names: list[str]) -> InventoryPage:
         remaining = set(names)
         cards = self.page.locator(L.L_CARD)
@@ -34,6 +37,7 @@ class InventoryPage:
             raise RuntimeError(f"Can't find the inputted products: {sorted(remaining)}")
         return self
 
+    @timed_step("go_to_cart")
     def go_to_cart(self) -> CartPage:
         self.page.click(L.L_CART_ICON)
         self.page.wait_for_url("**/cart.html")
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from .....core.timing import timed_step
 from ...locators import sauce_demo as L
 from .inventory_page import InventoryPage
 
@@ -16,11 +17,13 @@ class LoginPage:
     def __init__(self, page: Any) -> None:
         self.page = page
 
+    @timed_step("open_login")
     def open(self) -> LoginPage:
         """Navigate to login URL and return self."""
         self.page.goto(L.URL_LOGIN, wait_until="domcontentloaded")
         return self
 
+    @timed_step("login")
     def login(self, username: str, password: str) -> InventoryPage:
         """Submit credentials and assert we land on Inventory."""
         self.page.fill(L.L_USERNAME_LOCATOR, username)
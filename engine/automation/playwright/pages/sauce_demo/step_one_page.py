@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from .....core.timing import timed_step
 from ...locators import sauce_demo as L
 from .step_two_page import CheckoutStepTwoPage
 
@@ -16,6 +17,7 @@ class CheckoutStepOnePage:
     def __init__(self, page: Any) -> None:
         self.page = page
 
+    @timed_step("fill_info")
     def fill_and_continue(self, first: str, last: str, zip_code: str) -> CheckoutStepTwoPage:
         self.page.fill(L.L_FIRST, first)
         self.page.fill(L.L_LAST, last)
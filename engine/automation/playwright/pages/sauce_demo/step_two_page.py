@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from .....core.timing import timed_step
 from ...locators import sauce_demo as L
 from .complete_page import CheckoutCompletePage
 
@@ -16,6 +17,7 @@ class CheckoutStepTwoPage:
     def __init__(self, page: Any) -> None:
         self.page = page
 
+    @timed_step("review_check")
     def assert_contains(self, expected_names: list[str]) -> CheckoutStepTwoPage:
         items = self.page.locator(L.L_STEP2_ITEM)
         found = [
@@ -26,6 +28,7 @@ class CheckoutStepTwoPage:
             raise RuntimeError(f"Step Two missing: {sorted(missing)}")
         return self
 
+    @timed_step("read_totals")
     def read_totals(self) -> dict[str, str]:
         return {
             "item_total": self.page.locator(L.L_SUBTOTAL).inner_text().strip(),
@@ -33,6 +36,7 @@ class CheckoutStepTwoPage:
             "grand_total": self.page.locator(L.L_TOTAL).inner_text().strip(),
         }
 
+    @timed_step("finish")
     def finish(self) -> CheckoutCompletePage:
         self.page.click(L.L_BTN_FINISH)
         self.page.wait_for_url("**/checkout-complete.html")
@@ -4,18 +4,42 @@
 
 from __future__ import annotations
 
+from .async_browser_pool import AsyncBrowserPool, get_async_browser_pool
+from .async_context_factory import (
+    AsyncSessionBundle,
+    build_session_bundle_async,
+    close_bundle_async,
+    close_page_async,
+    ensure_page_async,
+)
+from .blocking import BlockPolicy
+from .browser_pool import BrowserLease, BrowserPool, browser_pool_options, get_browser_pool
 from .context_factory import (
     FlowSessionSpec,
     SessionBundle,
     build_session_bundle,
     close_bundle,
     ensure_page,
+    take_network_stats,
 )
 
 __all__ = [
+    "AsyncBrowserPool",
+    "get_async_browser_pool",
+    "AsyncSessionBundle",
+    "build_session_bundle_async",
+    "close_bundle_async",
+    "close_page_async",
+    "ensure_page_async",
+    "BlockPolicy",
+    "BrowserLease",
+    "BrowserPool",
+    "browser_pool_options",
+    "get_browser_pool",
     "FlowSessionSpec",
     "SessionBundle",
     "build_session_bundle",
     "close_bundle",
     "ensure_page",
+    "take_network_stats",
 ]
@@ -0,0 +1,118 @@
+# root/engine/automation/playwright/session/async_browser_pool.py
+"""Async twin of browser_pool: warm playwright.async_api browsers bound to one event loop."""
+# Why: ASYNC flows would otherwise cold-launch Chromium for every job.
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import time
+
+import structlog
+from playwright.async_api import async_playwright
+
+from .browser_pool import BROWSER_LAUNCH, BrowserLease, PoolKey, _PoolRules
+
+_logger = structlog.get_logger(__name__)
+
+
+class AsyncBrowserPool(_PoolRules):
+    """Loop-bound pool; async Playwright objects only work on the loop that made them.
+
+    Browsers survive between jobs only when jobs share that loop, i.e. when the
+    runner keeps one loop per worker (see async_runner.run_on_job_loop).
+    """
+
+    def __init__(self, max_age_s: float, max_jobs: int) -> None:
+        super().__init__(max_age_s, max_jobs)
+        self.loop = asyncio.get_running_loop()
+
+    def owns_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    async def lease(self, headless: bool, browser_type: str = "chromium") -> BrowserLease:
+        """Return a healthy idle browser or launch one; records lease wait."""
+        t0 = time.perf_counter()
+        key: PoolKey = (browser_type, bool(headless))
+        idle = self._idle.setdefault(key, [])
+        while idle:
+            cand = idle.pop()
+            reason = self._recycle_reason(cand)
+            if reason is None:
+                cand.jobs += 1
+                self._observe("warm", t0)
+                return cand
+            await self._retire(cand, reason)
+
+        if self._pw is None:
+            self._pw = await async_playwright().start()
+        with BROWSER_LAUNCH.labels(mode="async_pool").time():
+            browser = await getattr(self._pw, browser_type).launch(headless=headless)
+        lease = BrowserLease(key=key, pw=self._pw, browser=browser, jobs=1)
+        self._observe("cold", t0)
+        return lease
+
+    async def release(self, lease: BrowserLease, *, healthy: bool = True) -> None:
+        """Return a browser after the job closed its context."""
+        reason = "unhealthy" if not healthy else self._recycle_reason(lease)
+        if reason is not None:
+            await self._retire(lease, reason)
+            return
+        self._idle.setdefault(lease.key, []).append(lease)
+
+    async def aclose(self) -> None:
+        """Close every idle browser and stop Playwright."""
+        for leases in self._idle.values():
+            for lease in leases:
+                await self._close_browser(lease)
+        self._idle.clear()
+        if self._pw is not None:
+            try:
+                await self._pw.stop()
+            except Exception as e:
+                _logger.error("async_browser_pool_pw_stop_failed", err=str(e))
+            self._pw = None
+
+    def close(self) -> None:
+        """Sync shutdown (atexit): only possible while the owning loop is idle."""
+        if self.loop.is_closed() or self.loop.is_running():
+            return
+        self.loop.run_until_complete(self.aclose())
+
+    async def _retire(self, lease: BrowserLease, reason: str) -> None:
+        self._count_retired(lease, reason)
+        await self._close_browser(lease)
+
+    @staticmethod
+    async def _close_browser(lease: BrowserLease) -> None:
+        try:
+            await lease.browser.close()
+        except Exception as e:
+            _logger.error("async_browser_pool_close_failed", err=str(e))
+
+
+_POOL: AsyncBrowserPool | None = None
+
+
+def get_async_browser_pool(max_age_s: float = 1800, max_jobs: int = 50) -> AsyncBrowserPool | None:
+    """Process pool bound to the first calling loop; other loops get None (cold launch)."""
+    global _POOL
+    if _POOL is not None and _POOL.loop.is_closed():
+        atexit.unregister(_POOL.close)  # its browsers went with the loop
+        _POOL = None
+    if _POOL is None:
+        _POOL = AsyncBrowserPool(max_age_s=max_age_s, max_jobs=max_jobs)
+        atexit.register(_POOL.close)
+    return _POOL if _POOL.owns_loop() else None
+
+
+async def reset_async_browser_pool() -> None:
+    """Close and forget the process pool (tests, shutdown); call on the pool's loop."""
+    global _POOL
+    pool, _POOL = _POOL, None
+    if pool is not None:
+        atexit.unregister(pool.close)
+        await pool.aclose()
@@ -0,0 +1,138 @@
+# root/engine/automation/playwright/session/async_context_factory.py
+"""Async twin of context_factory for flows declared ExecutionMode.ASYNC."""
+# Why: one browser per worker can multiplex many pages on an event loop.
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+from playwright.async_api import async_playwright
+
+from ....core.config.loader import get_settings
+from ....core.constants.session import SessionMode
+from . import injectors, policy
+from .async_browser_pool import get_async_browser_pool
+from .blocking import BlockPolicy, BlockStats, effective_policy, install_blocking_async
+from .browser_pool import BROWSER_LAUNCH, BrowserLease
+from .context_factory import FlowSessionSpec
+from .seed import make_seed
+
+_logger = structlog.get_logger(__name__)
+
+
+@dataclass(slots=True)
+class AsyncSessionBundle:
+    """Lifetime of async Playwright objects for a job."""
+
+    pw: Any
+    browser: Any
+    context: Any
+    page: Any | None = None
+    lease: BrowserLease | None = None  # set when the browser belongs to the warm pool
+    blocking: BlockPolicy | None = None
+    block_stats: dict[int, BlockStats] = field(default_factory=dict)  # id(page) -> counters
+
+
+async def build_session_bundle_async(
+    headless: bool,
+    spec: FlowSessionSpec,
+    seed_value: int | None = None,
+    pool: dict[str, Any] | None = None,
+) -> AsyncSessionBundle:
+    """Create browser+context on the running loop, inject profile/cookies.
+
+    `pool` (max_age_s/max_jobs) leases a warm browser instead of launching one;
+    on a loop other than the pool's it falls back to a cold launch.
+    """
+    browser_pool = get_async_browser_pool(**pool) if pool is not None else None
+    lease: BrowserLease | None = None
+    if browser_pool is not None:
+        lease = await browser_pool.lease(headless=headless)
+        pw, browser = lease.pw, lease.browser
+    else:
+        pw = await async_playwright().start()
+        with BROWSER_LAUNCH.labels(mode="async").time():
+            browser = await pw.chromium.launch(headless=headless)
+    profile = make_seed(seed_value)
+    context = await browser.new_context(**policy.context_options(profile))
+    init_script = profile.get("init_script")
+    if init_script:
+        await context.add_init_script(init_script)
+
+    if spec.mode == SessionMode.COOKIES_AUTH and spec.secret_names:
+        cookies = injectors.load_cookie_files(spec.secret_names)
+        if cookies:
+            await context.add_cookies(cookies)
+
+    bundle = AsyncSessionBundle(
+        pw=pw,
+        browser=browser,
+        context=context,
+        lease=lease,
+        blocking=effective_policy(getattr(spec, "blocking", None), get_settings()),
+    )
+    _logger.info(
+        "session_built_async",
+        mode=spec.mode,
+        secrets=len(spec.secret_names),
+        headless=headless,
+        pooled=lease is not None,
+    )
+    return bundle
+
+
+async def ensure_page_async(bundle: AsyncSessionBundle, reuse: bool) -> Any:
+    """Return an existing or a new blank page depending on reuse flag."""
+    if reuse and bundle.page is not None:
+        return bundle.page
+    page = await bundle.context.new_page()
+    if bundle.blocking is not None:
+        bundle.block_stats[id(page)] = await install_blocking_async(page, bundle.blocking)
+    if reuse:
+        bundle.page = page
+    return page
+
+
+async def close_page_async(page: Any) -> None:
+    """Close page safely."""
+    try:
+        await page.close()
+    except Exception as e:
+        _logger.error("close_page_async_failed", err=str(e))
+
+
+async def close_bundle_async(bundle: AsyncSessionBundle) -> None:
+    """Cleanup in reverse order; swallow close errors. Pooled browsers go back to the pool."""
+    if bundle.lease is not None:
+        await _release_to_pool(bundle)
+        return
+    try:
+        if bundle.context:
+            await bundle.context.close()
+        if bundle.browser:
+            await bundle.browser.close()
+    except Exception as e:
+        _logger.error("close_bundle_async_failed", err=str(e))
+    finally:
+        try:
+            if bundle.pw:
+                await bundle.pw.stop()
+        except Exception as e:
+            _logger.error("close_bundle_async_pw_failed", err=str(e))
+
+
+async def _release_to_pool(bundle: AsyncSessionBundle) -> None:
+    """Close only the job's context; the browser outlives the job."""
+    healthy = True
+    try:
+        if bundle.context:
+            await bundle.context.close()
+    except Exception as e:
+        healthy = False
+        _logger.error("close_bundle_async_context_failed", err=str(e))
+    pool = get_async_browser_pool()
+    if pool is not None and bundle.lease is not None:
+        await pool.release(bundle.lease, healthy=healthy)
+    bundle.lease = None
@@ -0,0 +1,120 @@
+# root/engine/automation/playwright/session/blocking.py
+"""Request blocking per page: drop resource types/URL globs a flow never reads."""
+# Why: a crawl that only needs DOM + meta tags should not download images, fonts, trackers.
+
+from __future__ import annotations
+
+import contextlib
+import fnmatch
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+_logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class BlockPolicy:
+    """What a flow never needs; empty means no routing at all (routing disables HTTP cache)."""
+
+    resource_types: frozenset[str] = frozenset()
+    url_patterns: tuple[str, ...] = ()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.resource_types or self.url_patterns)
+
+    def url_regex(self) -> re.Pattern[str] | None:
+        if not self.url_patterns:
+            return None
+        return re.compile("|".join(fnmatch.translate(p) for p in self.url_patterns))
+
+
+@dataclass(slots=True)
+class BlockStats:
+    """Per-page counters; drained into item extras after each item."""
+
+    requests: int = 0
+    bytes: int = 0  # Content-Length of responses that did load (0 when not sent)
+    blocked: Counter[str] = field(default_factory=Counter)
+
+    def on_response(self, response: Any) -> None:
+        self.requests += 1
+        with contextlib.suppress(TypeError, ValueError):
+            self.bytes += int(response.headers.get("content-length") or 0)
+
+    def drain(self) -> dict[str, Any]:
+        """Snapshot for extras["network"], then reset (reused pages serve many items)."""
+        out = {
+            "requests": self.requests,
+            "bytes": self.bytes,
+            "blocked": sum(self.blocked.values()),
+            "blocked_by_type": dict(self.blocked),
+        }
+        self.requests, self.bytes = 0, 0
+        self.blocked.clear()
+        return out
+
+
+class _Matcher:
+    def __init__(self, policy: BlockPolicy) -> None:
+        self.types = policy.resource_types
+        self.urls = policy.url_regex()
+
+    def blocks(self, request: Any) -> str | None:
+        """Blocked bucket name, or None to let the request through."""
+        rtype = str(request.resource_type)
+        if rtype in self.types:
+            return rtype
+        if self.urls is not None and self.urls.match(request.url):
+            return "url"
+        return None
+
+
+def install_blocking(page: Any, policy: BlockPolicy) -> BlockStats:
+    """Route every request of this page through the policy (sync Playwright)."""
+    stats = BlockStats()
+    matcher = _Matcher(policy)
+
+    def _handle(route: Any, request: Any) -> None:
+        bucket = matcher.blocks(request)
+        if bucket is None:
+            route.continue_()
+            return
+        stats.blocked[bucket] += 1
+        route.abort("blockedbyclient")
+
+    page.route("**/*", _handle)
+    page.on("response", stats.on_response)
+    return stats
+
+
+async def install_blocking_async(page: Any, policy: BlockPolicy) -> BlockStats:
+    """Async twin of install_blocking."""
+    stats = BlockStats()
+    matcher = _Matcher(policy)
+
+    async def _handle(route: Any, request: Any) -> None:
+        bucket = matcher.blocks(request)
+        if bucket is None:
+            await route.continue_()
+            return
+        stats.blocked[bucket] += 1
+        await route.abort("blockedbyclient")
+
+    await page.route("**/*", _handle)
+    page.on("response", stats.on_response)
+    return stats
+
+
+def effective_policy(policy: BlockPolicy | None, settings: Any) -> BlockPolicy | None:
+    """Global kill switch (debugging a page that needs everything)."""
+    if policy is None or not policy.enabled:
+        return None
+    if not getattr(settings, "pw_block_resources", True):
+        _logger.info("resource_blocking_disabled")
+        return None
+    return policy
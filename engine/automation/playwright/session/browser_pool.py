@@ -0,0 +1,189 @@
+# root/engine/automation/playwright/session/browser_pool.py
+"""Warm Chromium pool keyed by launch options; jobs lease a browser, not a process."""
+# Why: launch costs seconds per job; a fresh BrowserContext per lease keeps isolation.
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+from playwright.sync_api import sync_playwright
+from prometheus_client import Counter, Histogram
+
+_logger = structlog.get_logger(__name__)
+
+LEASE_WAIT = Histogram(
+    "autosuite_browser_lease_wait_seconds",
+    "Time to obtain a browser from the pool (warm hit or cold launch).",
+    ["outcome"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0),
+)
+BROWSER_LAUNCH = Histogram(
+    "autosuite_browser_launch_seconds",
+    "Cold browser launch time (playwright start excluded).",
+    ["mode"],  # pool | direct | async | async_pool
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0),
+)
+RECYCLED = Counter(
+    "autosuite_browser_recycled_total",
+    "Pooled browsers closed by the recycle/health policy.",
+    ["reason"],
+)
+
+PoolKey = tuple[str, bool]  # (browser type, headless)
+
+
+@dataclass(slots=True)
+class BrowserLease:
+    """One pooled browser; counts jobs served since launch."""
+
+    key: PoolKey
+    pw: Any
+    browser: Any
+    launched_at: float = field(default_factory=time.monotonic)
+    jobs: int = 0
+
+
+class _PoolRules:
+    """Idle lists, recycle policy and lease metrics shared by the sync and async pools."""
+
+    def __init__(self, max_age_s: float, max_jobs: int) -> None:
+        self.max_age_s = float(max_age_s)
+        self.max_jobs = max(int(max_jobs), 1)
+        self._pw: Any = None
+        self._idle: dict[PoolKey, list[BrowserLease]] = {}
+        self._stats: dict[str, float] = {"hits": 0, "misses": 0, "recycled": 0, "wait_s_max": 0.0}
+
+    def stats(self) -> dict[str, float]:
+        """Snapshot for logs/tests: hit/miss/recycle counters and idle size."""
+        return {**self._stats, "idle": sum(len(v) for v in self._idle.values())}
+
+    def _recycle_reason(self, lease: BrowserLease) -> str | None:
+        try:
+            if not lease.browser.is_connected():
+                return "disconnected"
+        except Exception:
+            return "disconnected"
+        if time.monotonic() - lease.launched_at >= self.max_age_s:
+            return "max_age"
+        if lease.jobs >= self.max_jobs:
+            return "max_jobs"
+        return None
+
+    def _count_retired(self, lease: BrowserLease, reason: str) -> None:
+        self._stats["recycled"] += 1
+        RECYCLED.labels(reason=reason).inc()
+        _logger.info("browser_pool_recycle", reason=reason, jobs=lease.jobs)
+
+    def _observe(self, outcome: str, t0: float) -> None:
+        waited = time.perf_counter() - t0
+        self._stats["hits" if outcome == "warm" else "misses"] += 1
+        self._stats["wait_s_max"] = max(self._stats["wait_s_max"], waited)
+        LEASE_WAIT.labels(outcome=outcome).observe(waited)
+        _logger.info("browser_pool_lease", outcome=outcome, wait_ms=round(waited * 1000, 2))
+
+
+class BrowserPool(_PoolRules):
+    """Owner-thread pool; sync Playwright objects must stay on the thread that made them."""
+
+    def __init__(self, max_age_s: float, max_jobs: int) -> None:
+        super().__init__(max_age_s, max_jobs)
+        self.owner = threading.get_ident()
+
+    def owns_thread(self) -> bool:
+        return threading.get_ident() == self.owner
+
+    def lease(self, headless: bool, browser_type: str = "chromium") -> BrowserLease:
+        """Return a healthy idle browser or launch one; records lease wait."""
+        t0 = time.perf_counter()
+        key: PoolKey = (browser_type, bool(headless))
+        idle = self._idle.setdefault(key, [])
+        while idle:
+            cand = idle.pop()
+            reason = self._recycle_reason(cand)
+            if reason is None:
+                cand.jobs += 1
+                self._observe("warm", t0)
+                return cand
+            self._retire(cand, reason)
+
+        if self._pw is None:
+            self._pw = sync_playwright().start()
+        with BROWSER_LAUNCH.labels(mode="pool").time():
+            browser = getattr(self._pw, browser_type).launch(headless=headless)
+        lease = BrowserLease(key=key, pw=self._pw, browser=browser, jobs=1)
+        self._observe("cold", t0)
+        return lease
+
+    def release(self, lease: BrowserLease, *, healthy: bool = True) -> None:
+        """Return a browser after the job closed its context."""
+        reason = "unhealthy" if not healthy else self._recycle_reason(lease)
+        if reason is not None:
+            self._retire(lease, reason)
+            return
+        self._idle.setdefault(lease.key, []).append(lease)
+
+    def close(self) -> None:
+        """Close every idle browser and stop Playwright."""
+        for leases in self._idle.values():
+            for lease in leases:
+                self._close_browser(lease)
+        self._idle.clear()
+        if self._pw is not None:
+            try:
+                self._pw.stop()
+            except Exception as e:
+                _logger.error("browser_pool_pw_stop_failed", err=str(e))
+            self._pw = None
+
+    def _retire(self, lease: BrowserLease, reason: str) -> None:
+        self._count_retired(lease, reason)
+        self._close_browser(lease)
+
+    @staticmethod
+    def _close_browser(lease: BrowserLease) -> None:
+        try:
+            lease.browser.close()
+        except Exception as e:
+            _logger.error("browser_pool_close_failed", err=str(e))
+
+
+def browser_pool_options(settings: Any) -> dict[str, Any] | None:
+    """Pool kwargs for build_session_bundle, or None when pooling is off."""
+    if not getattr(settings, "pw_browser_pool", False):
+        return None
+    return {
+        "max_age_s": getattr(settings, "pw_browser_pool_max_age_s", 1800),
+        "max_jobs": getattr(settings, "pw_browser_pool_max_jobs", 50),
+    }
+
+
+_LOCAL = threading.local()
+
+
+def get_browser_pool(max_age_s: float = 1800, max_jobs: int = 50) -> BrowserPool:
+    """This thread's pool, made on first use (sync Playwright objects are thread-bound).
+
+    Runner lanes live on long-lived threads, so each lane keeps its own warm
+    browsers across jobs. Only the main thread's pool is closed at exit; a lane
+    thread's browsers go down with the Playwright driver when the process exits.
+    """
+    pool: BrowserPool | None = getattr(_LOCAL, "pool", None)
+    if pool is None:
+        pool = _LOCAL.pool = BrowserPool(max_age_s=max_age_s, max_jobs=max_jobs)
+        if threading.current_thread() is threading.main_thread():
+            atexit.register(pool.close)
+    return pool
+
+
+def reset_browser_pool() -> None:
+    """Close and forget this thread's pool (tests, shutdown)."""
+    pool: BrowserPool | None = getattr(_LOCAL, "pool", None)
+    _LOCAL.pool = None
+    if pool is not None:
+        atexit.unregister(pool.close)
+        pool.close()
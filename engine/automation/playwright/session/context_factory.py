@@ -4,14 +4,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import structlog
 from playwright.sync_api import sync_playwright
 
+from ....core.config.loader import get_settings
 from ....core.constants.session import SessionMode
 from . import injectors, policy
+from .blocking import BlockPolicy, BlockStats, effective_policy, install_blocking
+from .browser_pool import BROWSER_LAUNCH, BrowserLease, get_browser_pool
 from .seed import make_seed
 
 _logger = structlog.get_logger(__name__)
@@ -24,6 +27,8 @@ class FlowSessionSpec:
     mode: SessionMode  # NON_AUTH | COOKIES_AUTH | FORM_AUTH
     secret_names: list[str]  # e.g., ["aem","jira"] for cookies/auth
     page_reuse: bool
+    blocking: BlockPolicy = BlockPolicy()  # requests the flow never needs
+    http_first: bool = False  # async engine: try a plain GET, open a page only if needed
 
 
 @dataclass(slots=True)
@@ -34,16 +39,31 @@ class SessionBundle:
     browser: Any
     context: Any
     page: Any | None = None
+    lease: BrowserLease | None = None  # set when the browser belongs to the warm pool
+    blocking: BlockPolicy | None = None
+    block_stats: dict[int, BlockStats] = field(default_factory=dict)  # id(page) -> counters
 
 
 def build_session_bundle(
     headless: bool,
     spec: FlowSessionSpec,
     seed_value: int | None = None,
+    pool: dict[str, Any] | None = None,
 ) -> SessionBundle:
-    """Create browser+context, inject profile/cookies, yield blank page."""
-    pw = sync_playwright().start()
-    browser = pw.chromium.launch(headless=headless)
+    """Create browser+context, inject profile/cookies, yield blank page.
+
+    `pool` (max_age_s/max_jobs) leases a warm browser from the calling thread's
+    pool instead of launching one.
+    """
+    browser_pool = get_browser_pool(**pool) if pool is not None else None
+    lease: BrowserLease | None = None
+    if browser_pool is not None:
+        lease = browser_pool.lease(headless=headless)
+        pw, browser = lease.pw, lease.browser
+    else:
+        pw = sync_playwright().start()
+        with BROWSER_LAUNCH.labels(mode="direct").time():
+            browser = pw.chromium.launch(headless=headless)
     profile = make_seed(seed_value)
     context = policy.create_context(browser, profile)
 
@@ -51,8 +71,21 @@ def build_session_bundle(
         injectors.inject_cookies(context, *spec.secret_names)
 
     # For FORM_AUTH we only prepare context; flows decide when to call get_form_auth()
-    bundle = SessionBundle(pw=pw, browser=browser, context=context)
-    _logger.info("session_built", mode=spec.mode, secrets=len(spec.secret_names), headless=headless)
+    bundle = SessionBundle(
+        pw=pw,
+        browser=browser,
+        context=context,
+        lease=lease,
+        blocking=effective_policy(getattr(spec, "blocking", None), get_settings()),
+    )
+    _logger.info(
+        "session_built",
+        mode=spec.mode,
+        secrets=len(spec.secret_names),
+        headless=headless,
+        pooled=lease is not None,
+        blocking=bundle.blocking is not None,
+    )
     return bundle
 
 
@@ -61,13 +94,25 @@ def ensure_page(bundle: SessionBundle, reuse: bool) -> Any:
     if reuse and bundle.page is not None:
         return bundle.page
     page = policy.new_page(bundle.context)
+    if bundle.blocking is not None:
+        bundle.block_stats[id(page)] = install_blocking(page, bundle.blocking)
     if reuse:
         bundle.page = page
     return page
 
 
+def take_network_stats(bundle: Any, page: Any, keep: bool = False) -> dict[str, Any] | None:
+    """Drain this page's request counters for item extras; `keep` for reused pages."""
+    stats_map = getattr(bundle, "block_stats", None) or {}
+    stats = stats_map.get(id(page)) if keep else stats_map.pop(id(page), None)
+    return stats.drain() if stats is not None else None
+
+
 def close_bundle(bundle: SessionBundle) -> None:
-    """Cleanup in reverse order; swallow close errors."""
+    """Cleanup in reverse order; swallow close errors. Pooled browsers go back to the pool."""
+    if bundle.lease is not None:
+        _release_to_pool(bundle)
+        return
     try:
         if bundle.context:
             policy.close_context(bundle.context)
@@ -81,3 +126,17 @@ def close_bundle(bundle: SessionBundle) -> None:
                 bundle.pw.stop()
         except Exception as e:
             _logger.error("close_bundle_pw_failed", err=str(e))
+
+
+def _release_to_pool(bundle: SessionBundle) -> None:
+    """Close only the job's context; the browser outlives the job unless that close failed."""
+    healthy = True
+    try:
+        if bundle.context:
+            bundle.context.close()
+    except Exception as e:
+        healthy = False
+        _logger.error("close_bundle_context_failed", err=str(e))
+    if bundle.lease is not None:
+        get_browser_pool().release(bundle.lease, healthy=healthy)
+    bundle.lease = None
@@ -12,16 +12,21 @@ import structlog
 _logger = structlog.get_logger(__name__)
 
 
+def context_options(profile: dict) -> dict[str, Any]:
+    """Map a seed profile to new_context kwargs (shared by sync/async)."""
+    return {
+        "user_agent": profile.get("user_agent"),
+        "locale": profile.get("locale"),
+        "timezone_id": profile.get("timezone_id"),
+        "viewport": profile.get("viewport"),
+        "device_scale_factor": profile.get("device_scale_factor"),
+        "is_mobile": profile.get("is_mobile", False),
+    }
+
+
 def create_context(browser: Any, profile: dict) -> Any:
     """Create a BrowserContext with a realistic profile."""
-    context = browser.new_context(
-        user_agent=profile.get("user_agent"),
-        locale=profile.get("locale"),
-        timezone_id=profile.get("timezone_id"),
-        viewport=profile.get("viewport"),
-        device_scale_factor=profile.get("device_scale_factor"),
-        is_mobile=profile.get("is_mobile", False),
-    )
+    context = browser.new_context(**context_options(profile))
     init_script = profile.get("init_script")
     if init_script:
         context.add_init_script(init_script)
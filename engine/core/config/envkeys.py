@@ -17,21 +17,44 @@ PAGE_SIZE_MAX: Final[str] = "AUTOSUITE_PAGE_SIZE_MAX"
 PW_HEADLESS: Final[str] = "AUTOSUITE_PW_HEADLESS"
 PW_TRACING: Final[str] = "AUTOSUITE_PW_TRACING"  # on | off | retain-on-failure
 PW_VIDEO: Final[str] = "AUTOSUITE_PW_VIDEO"  # off | retain-on-failure
+PW_BROWSER_POOL: Final[str] = "AUTOSUITE_PW_BROWSER_POOL"  # reuse browsers across jobs
+PW_BLOCK_RESOURCES: Final[str] = "AUTOSUITE_PW_BLOCK_RESOURCES"  # honour flow block lists
+PW_BROWSER_POOL_MAX_AGE_S: Final[str] = "AUTOSUITE_PW_BROWSER_POOL_MAX_AGE_S"
+PW_BROWSER_POOL_MAX_JOBS: Final[str] = "AUTOSUITE_PW_BROWSER_POOL_MAX_JOBS"
+
+HTTP_FIRST: Final[str] = "AUTOSUITE_HTTP_FIRST"  # honour flow http_first (plain GET before browser)
+HTTP_POOL_SIZE: Final[str] = "AUTOSUITE_HTTP_POOL_SIZE"  # pooled connections per job
+HTTP_HEAD_MAX_BYTES: Final[str] = "AUTOSUITE_HTTP_HEAD_MAX_BYTES"  # stop reading past this
 
 METRICS_ENABLED: Final[str] = "AUTOSUITE_METRICS_ENABLED"
 
 ARTIFACTS_DIR: Final[str] = "AUTOSUITE_ARTIFACTS_DIR"
 REPORTS_DIR: Final[str] = "AUTOSUITE_REPORTS_DIR"
 ARTIFACTS_TTL_DAYS: Final[str] = "AUTOSUITE_ARTIFACTS_TTL_DAYS"
+EXPORT_PREBUILD: Final[str] = "AUTOSUITE_EXPORT_PREBUILD"  # xlsx,csv,jsonl built on job finish
 
 ITEM_MAX_RETRIES: Final[str] = "AUTOSUITE_ITEM_MAX_RETRIES"
+ITEM_CONCURRENCY: Final[str] = "AUTOSUITE_ITEM_CONCURRENCY"  # default lanes (1 browser each)
+ITEM_CONCURRENCY_MAX: Final[str] = "AUTOSUITE_ITEM_CONCURRENCY_MAX"  # cap for job option
+ASYNC_ITEM_CONCURRENCY_MAX: Final[str] = "AUTOSUITE_ASYNC_ITEM_CONCURRENCY_MAX"  # async cap
+ASYNC_ENGINE: Final[str] = "AUTOSUITE_ASYNC_ENGINE"  # 0: ASYNC flows run on the sync lanes
 
 DISPLAY_TZ: Final[str] = "AUTOSUITE_DISPLAY_TZ"
 
 DB_URL: Final[str] = "AUTOSUITE_DB_URL"
 DB_ECHO: Final[str] = "AUTOSUITE_DB_ECHO"
+JSON_COMPRESS_MIN_BYTES: Final[str] = "AUTOSUITE_JSON_COMPRESS_MIN_BYTES"  # item output/extras
 UI_POLL_MS: Final[str] = "AUTOSUITE_UI_POLL_MS"
+JOB_SUMMARY_CACHE_MS: Final[str] = "AUTOSUITE_JOB_SUMMARY_CACHE_MS"  # status counters TTL
 EXECUTOR_MAX_WORKERS: Final[str] = "AUTOSUITE_EXECUTOR_MAX_WORKERS"
+RESULT_FLUSH_ITEMS: Final[str] = "AUTOSUITE_RESULT_FLUSH_ITEMS"  # batch size for item writes
+RESULT_FLUSH_MS: Final[str] = "AUTOSUITE_RESULT_FLUSH_MS"  # max age of an unflushed result
+EXECUTOR_MODE: Final[str] = "AUTOSUITE_EXECUTOR_MODE"  # spawn | pool
+EXECUTOR_DISPATCHER: Final[str] = "AUTOSUITE_EXECUTOR_DISPATCHER"  # background scheduler
+EXECUTOR_DISPATCH_TICK_MS: Final[str] = "AUTOSUITE_EXECUTOR_DISPATCH_TICK_MS"  # fallback poll
+EXECUTOR_RESUME: Final[str] = "AUTOSUITE_EXECUTOR_RESUME"  # requeue orphaned jobs on restart
+EVENTS_QUEUE_SIZE: Final[str] = "AUTOSUITE_EVENTS_QUEUE_SIZE"  # per-sink buffer, drop-oldest
+EVENTS_JSONL_PATH: Final[str] = "AUTOSUITE_EVENTS_JSONL_PATH"  # empty = no event file
 
 SAUCEDEMO_USERNAME: Final[str] = "SAUCEDEMO_USERNAME"
 SAUCEDEMO_PW: Final[str] = "SAUCEDEMO_PW"
@@ -124,9 +124,38 @@ def get_settings() -> Settings:
         "item_max_retries": _coerce_int(
             os.getenv(str(EK.ITEM_MAX_RETRIES)), defaults["item_max_retries"]
         ),
+        "item_concurrency": _coerce_int(
+            os.getenv(str(EK.ITEM_CONCURRENCY)), defaults["item_concurrency"]
+        ),
+        "item_concurrency_max": _coerce_int(
+            os.getenv(str(EK.ITEM_CONCURRENCY_MAX)), defaults["item_concurrency_max"]
+        ),
+        "async_item_concurrency_max": _coerce_int(
+            os.getenv(str(EK.ASYNC_ITEM_CONCURRENCY_MAX)), defaults["async_item_concurrency_max"]
+        ),
+        "async_engine": _coerce_bool(os.getenv(str(EK.ASYNC_ENGINE)), defaults["async_engine"]),
         "pw_headless": _coerce_bool(os.getenv(str(EK.PW_HEADLESS)), defaults["pw_headless"]),
         "pw_tracing": os.getenv(str(EK.PW_TRACING), defaults["pw_tracing"]),
         "pw_video": os.getenv(str(EK.PW_VIDEO), defaults["pw_video"]),
+        "pw_browser_pool": _coerce_bool(
+            os.getenv(str(EK.PW_BROWSER_POOL)), defaults["pw_browser_pool"]
+        ),
+        "pw_block_resources": _coerce_bool(
+            os.getenv(str(EK.PW_BLOCK_RESOURCES)), defaults["pw_block_resources"]
+        ),
+        "pw_browser_pool_max_age_s": _coerce_int(
+            os.getenv(str(EK.PW_BROWSER_POOL_MAX_AGE_S)), defaults["pw_browser_pool_max_age_s"]
+        ),
+        "pw_browser_pool_max_jobs": _coerce_int(
+            os.getenv(str(EK.PW_BROWSER_POOL_MAX_JOBS)), defaults["pw_browser_pool_max_jobs"]
+        ),
+        "http_first": _coerce_bool(os.getenv(str(EK.HTTP_FIRST)), defaults["http_first"]),
+        "http_pool_size": _coerce_int(
+            os.getenv(str(EK.HTTP_POOL_SIZE)), defaults["http_pool_size"]
+        ),
+        "http_head_max_bytes": _coerce_int(
+            os.getenv(str(EK.HTTP_HEAD_MAX_BYTES)), defaults["http_head_max_bytes"]
+        ),
         "metrics_enabled": _coerce_bool(
             os.getenv(str(EK.METRICS_ENABLED)), defaults["metrics_enabled"]
         ),
@@ -135,14 +164,45 @@ def get_settings() -> Settings:
         "artifacts_ttl_days": _coerce_int(
             os.getenv(str(EK.ARTIFACTS_TTL_DAYS)), defaults["artifacts_ttl_days"]
         ),
+        "export_prebuild": os.getenv(str(EK.EXPORT_PREBUILD), defaults["export_prebuild"]),
         "display_tz": os.getenv(str(EK.DISPLAY_TZ), defaults["display_tz"]),
         # DB + service extras (make sure schema has these fields)
         "db_url": os.getenv(str(EK.DB_URL), defaults.get("db_url", "sqlite:///./var/app.db")),
         "db_echo": _coerce_bool(os.getenv(str(EK.DB_ECHO)), defaults.get("db_echo", False)),
+        "json_compress_min_bytes": _coerce_int(
+            os.getenv(str(EK.JSON_COMPRESS_MIN_BYTES)),
+            defaults.get("json_compress_min_bytes", 1024),
+        ),
         "ui_poll_ms": _coerce_int(os.getenv(str(EK.UI_POLL_MS)), defaults.get("ui_poll_ms", 5000)),
+        "job_summary_cache_ms": _coerce_int(
+            os.getenv(str(EK.JOB_SUMMARY_CACHE_MS)), defaults.get("job_summary_cache_ms", 1000)
+        ),
         "executor_max_workers": _coerce_int(
             os.getenv(str(EK.EXECUTOR_MAX_WORKERS)), defaults.get("executor_max_workers", 1)
         ),
+        "executor_mode": os.getenv(str(EK.EXECUTOR_MODE), defaults.get("executor_mode", "spawn")),
+        "executor_dispatcher": _coerce_bool(
+            os.getenv(str(EK.EXECUTOR_DISPATCHER)), defaults.get("executor_dispatcher", False)
+        ),
+        "executor_dispatch_tick_ms": _coerce_int(
+            os.getenv(str(EK.EXECUTOR_DISPATCH_TICK_MS)),
+            defaults.get("executor_dispatch_tick_ms", 5000),
+        ),
+        "executor_resume": _coerce_bool(
+            os.getenv(str(EK.EXECUTOR_RESUME)), defaults.get("executor_resume", False)
+        ),
+        "result_flush_items": _coerce_int(
+            os.getenv(str(EK.RESULT_FLUSH_ITEMS)), defaults.get("result_flush_items", 20)
+        ),
+        "result_flush_ms": _coerce_int(
+            os.getenv(str(EK.RESULT_FLUSH_MS)), defaults.get("result_flush_ms", 1000)
+        ),
+        "events_queue_size": _coerce_int(
+            os.getenv(str(EK.EVENTS_QUEUE_SIZE)), defaults.get("events_queue_size", 1000)
+        ),
+        "events_jsonl_path": os.getenv(
+            str(EK.EVENTS_JSONL_PATH), defaults.get("events_jsonl_path", "")
+        ),
         "saucedemo_username": os.getenv(str(EK.SAUCEDEMO_USERNAME), defaults["saucedemo_username"]),
         "saucedemo_pw": os.getenv(str(EK.SAUCEDEMO_PW), defaults["saucedemo_pw"]),
     }
@@ -156,21 +216,44 @@ def get_settings() -> Settings:
         api_key_enabled=settings.api_key_enabled,
         api_key=_mask(settings.api_key),
         db_url=_mask_db_url(settings.db_url),
+        json_compress_min_bytes=settings.json_compress_min_bytes,
         limits=dict(
             max_items_per_job=settings.max_items_per_job,
             payload_max_bytes=settings.payload_max_bytes,
             page_size_default=settings.page_size_default,
             page_size_max=settings.page_size_max,
             item_max_retries=settings.item_max_retries,
+            item_concurrency=settings.item_concurrency,
+            item_concurrency_max=settings.item_concurrency_max,
+            async_item_concurrency_max=settings.async_item_concurrency_max,
         ),
+        async_engine=settings.async_engine,
         pw=dict(
-            headless=settings.pw_headless, tracing=settings.pw_tracing, video=settings.pw_video
+            headless=settings.pw_headless,
+            tracing=settings.pw_tracing,
+            video=settings.pw_video,
+            browser_pool=settings.pw_browser_pool,
+            block_resources=settings.pw_block_resources,
+        ),
+        http=dict(
+            first=settings.http_first,
+            pool_size=settings.http_pool_size,
+            head_max_bytes=settings.http_head_max_bytes,
         ),
         paths=dict(artifacts=settings.artifacts_dir, reports=settings.reports_dir),
+        export_prebuild=settings.export_prebuild,
         metrics_enabled=settings.metrics_enabled,
         display_tz=settings.display_tz,
         ui_poll_ms=getattr(settings, "ui_poll_ms", None),
+        job_summary_cache_ms=getattr(settings, "job_summary_cache_ms", None),
         executor_max_workers=getattr(settings, "executor_max_workers", None),
+        executor_mode=getattr(settings, "executor_mode", None),
+        executor_resume=getattr(settings, "executor_resume", None),
+        executor_dispatcher=getattr(settings, "executor_dispatcher", None),
+        events=dict(
+            queue_size=getattr(settings, "events_queue_size", None),
+            jsonl_path=getattr(settings, "events_jsonl_path", None),
+        ),
     )
     return settings
 
@@ -19,6 +19,15 @@ class Settings(BaseModel):
     pw_headless: bool = Field(default=True)
     pw_tracing: Literal["on", "off", "retain-on-failure"] = Field(default="retain-on-failure")
     pw_video: Literal["off", "retain-on-failure"] = Field(default="retain-on-failure")
+    pw_browser_pool: bool = Field(default=False)
+    pw_block_resources: bool = Field(default=True)
+    pw_browser_pool_max_age_s: int = Field(default=1800)
+    pw_browser_pool_max_jobs: int = Field(default=50)
+
+    # HTTP fast path (flows with FlowSessionSpec.http_first)
+    http_first: bool = Field(default=True)
+    http_pool_size: int = Field(default=64)
+    http_head_max_bytes: int = Field(default=256 * 1024)
 
     # Limits
     max_items_per_job: int = Field(default=200)
@@ -26,11 +35,16 @@ class Settings(BaseModel):
     page_size_default: int = Field(default=50)
     page_size_max: int = Field(default=500)
     item_max_retries: int = Field(default=2)
+    item_concurrency: int = Field(default=1)
+    item_concurrency_max: int = Field(default=8)
+    async_item_concurrency_max: int = Field(default=32)
+    async_engine: bool = Field(default=True)  # off: every flow takes the sync runner
 
     # Paths / artifacts
     artifacts_dir: str = Field(default="./var/artifacts")
     reports_dir: str = Field(default="./var/reports")
-    artifacts_ttl_days: int = Field(default=7)
+    artifacts_ttl_days: int = Field(default=7)  # also the export cache under reports_dir
+    export_prebuild: str = Field(default="xlsx")  # comma list; "" builds on first download
 
     # Locale
     display_tz: str = Field(default="Asia/Ho_Chi_Minh")
@@ -38,8 +52,18 @@ class Settings(BaseModel):
     # --- Service layer (added) ---
     db_url: str = "sqlite:///./var/app.db"
     db_echo: bool = False
+    json_compress_min_bytes: int = 1024  # SQLite: zstd-pack bigger item output/extras; 0 = off
     ui_poll_ms: int = 5000
+    job_summary_cache_ms: int = 1000
     executor_max_workers: int = 1
+    executor_mode: Literal["spawn", "pool"] = "spawn"
+    executor_resume: bool = False
+    executor_dispatcher: bool = False
+    executor_dispatch_tick_ms: int = 5000
+    result_flush_items: int = 20
+    result_flush_ms: int = 1000
+    events_queue_size: int = 1000
+    events_jsonl_path: str = ""
 
     metrics_enabled: bool = Field(default=True)
 
@@ -22,3 +22,11 @@ class ContextPer(StrEnum):
 
     JOB = "JOB"
     ITEM = "ITEM"
+
+
+@unique
+class ExecutionMode(StrEnum):
+    """Which Playwright API a flow is written against."""
+
+    SYNC = "SYNC"
+    ASYNC = "ASYNC"
@@ -0,0 +1,74 @@
+# root/engine/core/timing.py
+"""Per-item step timings collected through a context variable."""
+# Why: page objects time themselves without threading a dict through every call.
+
+from __future__ import annotations
+
+import functools
+import inspect
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Seconds per step; nested steps are "outer.inner". Flat keeps ItemResult.timings a
+# dict[str, float]; readers that want a tree split on the dot.
+_steps: ContextVar[dict[str, float] | None] = ContextVar("autosuite_step_timings", default=None)
+_prefix: ContextVar[str] = ContextVar("autosuite_step_prefix", default="")
+
+
+@contextmanager
+def collect_timings() -> Iterator[dict[str, float]]:
+    """Scope for one item: steps run inside it land in the yielded dict."""
+    timings: dict[str, float] = {}
+    token, ptoken = _steps.set(timings), _prefix.set("")
+    try:
+        yield timings
+    finally:
+        _prefix.reset(ptoken)
+        _steps.reset(token)
+
+
+@contextmanager
+def step(name: str) -> Iterator[None]:
+    """Time a block; no-op outside collect_timings. Repeats add up, failures still count."""
+    timings = _steps.get()
+    if timings is None:
+        yield
+        return
+    key = _prefix.get() + name
+    token = _prefix.set(key + ".")
+    t0 = perf_counter()
+    try:
+        yield
+    finally:
+        _prefix.reset(token)
+        timings[key] = round(timings.get(key, 0.0) + perf_counter() - t0, 6)
+
+
+def timed_step(name: str | None = None) -> Callable[[F], F]:
+    """Decorator form of step() for page-object methods (sync or async)."""
+
+    def deco(fn: F) -> F:
+        label = name or fn.__name__
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with step(label):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with step(label):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return deco
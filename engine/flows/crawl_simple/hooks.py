@@ -25,12 +25,16 @@ def before_job(context: dict[str, Any]) -> FlowCtx:
     spec = context["spec"]
     ctx: FlowCtx = {"bundle": None, "page": None, "page_reuse": False, "__trace_path__": None}
     if getattr(spec, "context_per", "JOB") == "JOB":
-        from engine.automation.playwright.session import build_session_bundle
+        from engine.automation.playwright.session import (
+            browser_pool_options,
+            build_session_bundle,
+        )
 
         ctx["bundle"] = build_session_bundle(
             headless=s.pw_headless,
             spec=spec,
             seed_value=None,
+            pool=browser_pool_options(s),
         )
 
     ctx["page_reuse"] = getattr(spec, "page_reuse", False)
@@ -68,7 +72,7 @@ def before_item(ctx: FlowCtx, item_input: dict[str, Any]) -> Any:
 
 def after_item(ctx: FlowCtx, item_result: dict[str, Any]) -> None:
     """Stop tracing (if any) and optionally close page."""
-    from engine.automation.playwright.session import policy as _pol
+    from engine.automation.playwright.session import policy as _pol, take_network_stats
 
     try:
         # Stop trace and record path
@@ -79,6 +83,11 @@ def after_item(ctx: FlowCtx, item_result: dict[str, Any]) -> None:
             item_result["extras"]["trace_path"] = trace_path
 
         p = ctx.get("page")
+        network = take_network_stats(ctx.get("bundle"), p, keep=bool(ctx.get("page_reuse")))
+        if network is not None:
+            item_result.setdefault("extras", {})
+            item_result["extras"]["network"] = network
+
         if p and not ctx.get("page_reuse"):
             p.close()
     except Exception as e:
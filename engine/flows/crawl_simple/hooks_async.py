@@ -0,0 +1,130 @@
+# root/engine/flows/crawl_simple/hooks_async.py
+"""Async lifecycle hooks for CRAWL_SIMPLE (ExecutionMode.ASYNC)."""
+# Why: many items share one context, so page ownership travels with the item.
+
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import Any, cast
+
+import structlog
+
+from engine.automation.playwright.session.async_context_factory import AsyncSessionBundle
+
+from ...core.config.loader import get_settings
+from .hooks import api_prevalidate, dedupe_key, on_error, on_retry, validate_input
+from .http_first import HttpFirstTarget
+
+_logger = structlog.get_logger(__name__)
+
+FlowCtx = dict[str, Any]
+
+__all__ = [
+    "after_item",
+    "after_job",
+    "api_prevalidate",
+    "before_item",
+    "before_job",
+    "dedupe_key",
+    "on_error",
+    "on_retry",
+    "validate_input",
+]
+
+
+async def before_job(context: dict[str, Any]) -> FlowCtx:
+    """Launch one browser/context for every in-flight item of the job.
+
+    HTTP-first jobs open a pooled HTTP client instead; the browser is launched
+    by the first item that needs it (often never).
+    """
+    s = get_settings()
+    spec = context["spec"]
+    ctx: FlowCtx = {"bundle": None, "page_reuse": False, "http": None, "spec": spec}
+    if getattr(spec, "http_first", False) and getattr(s, "http_first", True):
+        from engine.automation.http import new_http_client
+
+        ctx["http"] = new_http_client(s)
+        ctx["bundle_lock"] = asyncio.Lock()
+    else:
+        await _ensure_bundle(ctx)
+    # Reusing one page is meaningless when items run side by side.
+    ctx["page_reuse"] = False
+    if str(s.pw_tracing).lower() in ("on", "1", "true"):
+        # Context-level tracing cannot be split per item when pages overlap.
+        _logger.info("hook_tracing_skipped_async")
+    _logger.info("hook_before_job_async", headless=s.pw_headless, http_first=bool(ctx["http"]))
+    return ctx
+
+
+async def _ensure_bundle(ctx: FlowCtx) -> AsyncSessionBundle:
+    """Build the job's browser/context once, even when items ask at the same time."""
+    from engine.automation.playwright.session import (
+        browser_pool_options,
+        build_session_bundle_async,
+    )
+
+    lock = ctx.get("bundle_lock")
+    if ctx.get("bundle") is None:
+        async with lock or asyncio.Lock():
+            if ctx.get("bundle") is None:
+                s = get_settings()
+                ctx["bundle"] = await build_session_bundle_async(
+                    headless=s.pw_headless,
+                    spec=ctx["spec"],
+                    seed_value=None,
+                    pool=browser_pool_options(s),
+                )
+    return cast(AsyncSessionBundle, ctx["bundle"])
+
+
+async def _open_page(ctx: FlowCtx) -> Any:
+    from engine.automation.playwright.session import ensure_page_async
+
+    return await ensure_page_async(await _ensure_bundle(ctx), reuse=False)
+
+
+async def before_item(ctx: FlowCtx, item_input: dict[str, Any]) -> Any:
+    """Open a fresh page for this item (HTTP-first: a target that opens one on demand)."""
+    from engine.automation.playwright.session import ensure_page_async
+
+    _logger.debug("hook_before_item_async", url=item_input.get("url"))
+    if ctx.get("http") is not None:
+        return HttpFirstTarget(
+            client=ctx["http"],
+            open_page=partial(_open_page, ctx),
+            max_bytes=int(getattr(get_settings(), "http_head_max_bytes", 256 * 1024)),
+        )
+    bundle = ctx.get("bundle")
+    if bundle is None:
+        raise RuntimeError("Session bundle not initialized in before_job")
+    return await ensure_page_async(cast(AsyncSessionBundle, bundle), reuse=False)
+
+
+async def after_item(ctx: FlowCtx, item_result: dict[str, Any], page: Any) -> None:
+    """Record the page's request counters, then close it."""
+    from engine.automation.playwright.session import close_page_async, take_network_stats
+
+    if isinstance(page, HttpFirstTarget):
+        page = page.page  # None when the GET was enough
+    network = take_network_stats(ctx.get("bundle"), page)
+    if network is not None:
+        item_result.setdefault("extras", {})
+        item_result["extras"]["network"] = network
+    if page is not None:
+        await close_page_async(page)
+    _logger.debug("hook_after_item_async", status=item_result.get("status"))
+
+
+async def after_job(ctx: FlowCtx, summary: dict[str, Any]) -> None:
+    """Tear down job-level resources."""
+    if ctx.get("bundle"):
+        from engine.automation.playwright.session import close_bundle_async
+
+        await close_bundle_async(ctx["bundle"])
+        ctx["bundle"] = None
+    if ctx.get("http") is not None:
+        await ctx["http"].aclose()
+        ctx["http"] = None
+    _logger.info("hook_after_job_async", **summary)
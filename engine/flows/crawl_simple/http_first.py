@@ -0,0 +1,61 @@
+# root/engine/flows/crawl_simple/http_first.py
+"""HTTP-first navigation for CRAWL_SIMPLE: plain GET, browser only when the head is not enough."""
+# Why: most pages answer title/meta in the first few KB; a browser page costs far more.
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+import structlog
+
+from ...automation.http import browser_reason, fetch_head
+from ...automation.playwright.pages.async_common_page import AsyncCommonPage
+from ...core.timing import step
+
+_logger = structlog.get_logger(__name__)
+
+
+@dataclass(slots=True)
+class HttpFirstTarget:
+    """What before_item hands run_item_async instead of a page; opens one on demand."""
+
+    client: httpx.AsyncClient
+    open_page: Callable[[], Awaitable[Any]]
+    max_bytes: int = 256 * 1024
+    page: Any | None = None  # set once the item fell back; retries stay on the browser
+    fallback: str | None = None
+    bytes_read: int = 0
+
+    async def browser_page(self) -> Any:
+        if self.page is None:
+            self.page = await self.open_page()
+        return self.page
+
+    def fetch_info(self) -> dict[str, Any]:
+        """extras["fetch"]: how the snapshot was taken and why the browser was needed."""
+        if self.page is None:
+            return {"via": "http", "bytes": self.bytes_read}
+        return {"via": "browser", "fallback": self.fallback}
+
+
+async def navigate_and_collect(target: HttpFirstTarget, url: str) -> dict[str, Any]:
+    """Same contract as AsyncCommonPage.navigate_and_collect."""
+    if target.page is None:
+        try:
+            with step("http_fetch"):
+                snap = await fetch_head(target.client, url, max_bytes=target.max_bytes)
+            target.bytes_read = snap.bytes_read
+            reason = browser_reason(snap)
+            if reason is None:
+                return snap.as_snapshot()
+        except httpx.HTTPError as e:
+            # The browser has its own stack (TLS, HTTP/2, proxies): let it decide.
+            reason = f"http_error:{type(e).__name__}"
+        target.fallback = reason
+        _logger.debug("http_first_fallback", url=url, reason=reason)
+
+    page = await target.browser_page()
+    return await AsyncCommonPage(page).navigate_and_collect(url)
@@ -10,52 +10,103 @@ from typing import Any, cast
 
 import structlog
 
+from ...automation.playwright.pages.async_common_page import AsyncCommonPage
 from ...automation.playwright.pages.common_page import CommonPage
 from ...core.config.loader import get_settings
 from ...core.errors import ErrorCode
 from ...core.models.action_result import ActionResult
+from ...core.timing import collect_timings
+from . import http_first
+from .http_first import HttpFirstTarget
 from .input import CrawlSimpleInput
 from .output import CrawlSimpleOutput
 
 _logger = structlog.get_logger(__name__)
 
 
+def _to_result(
+    input_: CrawlSimpleInput,
+    page_snapshot: dict[str, Any],
+    t0: float,
+    steps: dict[str, float],
+    extras: dict[str, Any] | None = None,
+) -> ActionResult[dict]:
+    """Shape a page snapshot into the CRAWL_SIMPLE output contract."""
+    title = cast(str | None, page_snapshot.get("title"))
+    final_url = cast(str | None, page_snapshot.get("final_url"))
+    http_status = cast(int | None, page_snapshot.get("http_status"))
+    meta_tags = cast(Mapping[str, str] | dict[str, str] | None, page_snapshot.get("meta_tags"))
+
+    page_snapshot["meta"] = input_.meta
+    meta = cast(Mapping[str, Any] | dict[str, Any] | None, page_snapshot.get("meta"))
+
+    elapsed = perf_counter() - t0
+    timings = {**steps, "total": elapsed}
+    page_snapshot["timings"] = timings
+
+    value = CrawlSimpleOutput(
+        title=title,
+        final_url=final_url,
+        http_status=http_status,
+        meta_tags=dict(meta_tags or {}),
+        meta=dict(meta or {}),
+    ).model_dump()
+
+    return ActionResult(ok=True, value=value, timings=timings, extras=extras or {})
+
+
+def _to_failure(
+    input_: CrawlSimpleInput,
+    exc: Exception,
+    t0: float,
+    steps: dict[str, float],
+    extras: dict[str, Any] | None = None,
+) -> ActionResult[dict]:
+    elapsed = perf_counter() - t0
+    timings = {**steps, "total": elapsed}  # steps so far show where it broke
+    _logger.warning("crawl_simple_failed", url=input_.url, err=str(exc))
+    return ActionResult(
+        ok=False,
+        error_code=ErrorCode.UNKNOWN,
+        error_message=str(exc),
+        timings=timings,
+        extras=extras or {},
+    )
+
+
 def run_item(input_: CrawlSimpleInput, page: Any) -> ActionResult[dict]:
     """Navigate on provided page and return a minimal snapshot."""
     _logger.warning("start_flow_actions", url=input_.url)
     _ = get_settings()
     t0 = perf_counter()
-    timings: dict[str, float]
-    try:
-        common = CommonPage(page)
-        page_snapshot = common.navigate_and_collect(input_.url)
-        _logger.warning("end_flow_actions", url=input_.url)
-
-        title = cast(str | None, page_snapshot.get("title"))
-        final_url = cast(str | None, page_snapshot.get("final_url"))
-        http_status = cast(int | None, page_snapshot.get("http_status"))
-        meta_tags = cast(Mapping[str, str] | dict[str, str] | None, page_snapshot.get("meta_tags"))
-
-        page_snapshot["meta"] = input_.meta
-        meta = cast(Mapping[str, Any] | dict[str, Any] | None, page_snapshot.get("meta"))
-
-        elapsed = perf_counter() - t0
-        timings = {"total": elapsed}
-        page_snapshot["timings"] = timings
-
-        value = CrawlSimpleOutput(
-            title=title,
-            final_url=final_url,
-            http_status=http_status,
-            meta_tags=dict(meta_tags or {}),
-            meta=dict(meta or {}),
-        ).model_dump()
-
-        return ActionResult(ok=True, value=value, timings=timings)
-    except Exception as exc:
-        elapsed = perf_counter() - t0
-        timings = {"total": elapsed}
-        _logger.warning("crawl_simple_failed", url=input_.url, err=str(exc))
-        return ActionResult(
-            ok=False, error_code=ErrorCode.UNKNOWN, error_message=str(exc), timings=timings
-        )
+    with collect_timings() as steps:
+        try:
+            common = CommonPage(page)
+            page_snapshot = common.navigate_and_collect(input_.url)
+            _logger.warning("end_flow_actions", url=input_.url)
+            return _to_result(input_, page_snapshot, t0, steps)
+        except Exception as exc:
+            return _to_failure(input_, exc, t0, steps)
+
+
+async def run_item_async(input_: CrawlSimpleInput, page: Any) -> ActionResult[dict]:
+    """Async twin of run_item; many of these share one browser on the loop.
+
+    `page` is an HttpFirstTarget when the job runs HTTP-first (see hooks_async).
+    """
+    _logger.debug("start_flow_actions_async", url=input_.url)
+    t0 = perf_counter()
+    with collect_timings() as steps:
+        extras: dict[str, Any] | None = None
+        try:
+            if isinstance(page, HttpFirstTarget):
+                try:
+                    page_snapshot = await http_first.navigate_and_collect(page, input_.url)
+                finally:
+                    extras = {"fetch": page.fetch_info()}
+            else:
+                page_snapshot = await AsyncCommonPage(page).navigate_and_collect(input_.url)
+            _logger.debug("end_flow_actions_async", url=input_.url)
+            return _to_result(input_, page_snapshot, t0, steps, extras)
+        except Exception as exc:
+            return _to_failure(input_, exc, t0, steps, extras)
@@ -4,13 +4,24 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
 
+from ..automation.playwright.session.blocking import BlockPolicy
 from ..automation.playwright.session.context_factory import FlowSessionSpec
 from ..core.constants.flows import FlowType
-from ..core.constants.session import ContextPer, SessionMode
+from ..core.constants.session import ContextPer, ExecutionMode, SessionMode
+
+# Analytics/ad hosts: never part of what a flow reads, often the slowest requests on a page.
+TRACKER_URL_PATTERNS = (
+    "*://*.google-analytics.com/*",
+    "*://*.googletagmanager.com/*",
+    "*://*.doubleclick.net/*",
+    "*://connect.facebook.net/*",
+    "*://*.hotjar.com/*",
+    "*://*.segment.io/*",
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -23,18 +34,32 @@ class FlowAdapter:
     spec: FlowSessionSpec
     context_per: ContextPer
     page_reuse: bool
+    # Async engine (optional): runner picks it when execution is ASYNC.
+    execution: ExecutionMode = ExecutionMode.SYNC
+    run_item_async: Callable[[Any, Any], Awaitable[Any]] | None = None
+    async_hooks: Any = None  # module with async before/after hooks
 
 
 def get_flow_adapter(flow: FlowType) -> FlowAdapter:
     """Return the adapter + session spec for a flow."""
     if flow in {FlowType.CRAWL_SIMPLE}:
-        from .crawl_simple import hooks as hooks_mod_cs, run as run_mod_cs
+        from .crawl_simple import (
+            hooks as hooks_mod_cs,
+            hooks_async as hooks_async_mod_cs,
+            run as run_mod_cs,
+        )
         from .crawl_simple.input import CrawlSimpleInput
 
         spec = FlowSessionSpec(
             mode=SessionMode.NON_AUTH,  # switch to COOKIES_AUTH for cookie flows
             secret_names=[],  # e.g., ["aem","jira"] when needed
             page_reuse=False,
+            # Title/meta tags come from the HTML; nothing visual is read.
+            blocking=BlockPolicy(
+                resource_types=frozenset({"image", "media", "font", "stylesheet"}),
+                url_patterns=TRACKER_URL_PATTERNS,
+            ),
+            http_first=True,  # <head> is all it reads; the browser is the fallback
         )
 
         return FlowAdapter(
@@ -44,6 +69,9 @@ def get_flow_adapter(flow: FlowType) -> FlowAdapter:
             spec=spec,
             context_per=ContextPer.JOB,
             page_reuse=spec.page_reuse,
+            execution=ExecutionMode.ASYNC,  # many navigations share one browser (AUTOSUITE_ASYNC_ENGINE)
+            run_item_async=run_mod_cs.run_item_async,
+            async_hooks=hooks_async_mod_cs,
         )
 
     if flow in {FlowType.FLOW_SAUCE_DEMO}:
@@ -54,6 +82,8 @@ def get_flow_adapter(flow: FlowType) -> FlowAdapter:
             mode=SessionMode.FORM_AUTH,  # login form with secrets fallback
             secret_names=["sauce_demo"],  # secrets/form_auth/sauce_demo.json (optional)
             page_reuse=False,  # new blank page per attempt
+            # Keep stylesheets: visibility assertions depend on layout.
+            blocking=BlockPolicy(resource_types=frozenset({"image", "media", "font"})),
         )
 
         return FlowAdapter(
@@ -0,0 +1,244 @@
+# root/engine/orchestration/async_runner.py
+"""Asyncio runner for flows declared ExecutionMode.ASYNC."""
+# Why: one browser per worker can keep dozens of navigations in flight.
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+import time
+from collections.abc import Coroutine, Mapping
+from typing import Any
+
+import structlog
+
+from ..core.config.loader import get_settings
+from ..core.constants.flows import FlowType
+from ..core.constants.statuses import ItemStatus
+from ..core.errors import ErrorCode, to_error_code
+from ..core.models.item_result import ItemResult
+from ..flows.registry import get_flow_adapter
+from .events import ItemStarted, JobStarted, SessionOpened, emit
+from .runner import (
+    ResultCallback,
+    _close_job,
+    _gate_item,
+    _item_finished,
+    _materialize_input,
+    _notify,
+    _resolve_concurrency,
+    _retried,
+    _session_closed,
+    _summarize,
+)
+
+_logger = structlog.get_logger(__name__)
+
+# One loop kept across jobs on the first thread that asks (the worker's main thread).
+_JOB_RUNNER: asyncio.Runner | None = None
+_JOB_RUNNER_THREAD: int | None = None
+
+
+def run_on_job_loop(
+    coro: Coroutine[Any, Any, list[ItemResult]], *, keep_loop: bool
+) -> list[ItemResult]:
+    """Run a job coroutine; `keep_loop` reuses one event loop for every job on this thread.
+
+    Loop-bound resources (the async browser pool) die with asyncio.run's loop, so
+    they only pay off when consecutive jobs share one. Other threads get a fresh loop.
+    """
+    global _JOB_RUNNER, _JOB_RUNNER_THREAD
+    if not keep_loop:
+        return asyncio.run(coro)
+    if _JOB_RUNNER is None:
+        _JOB_RUNNER = asyncio.Runner()
+        _JOB_RUNNER_THREAD = threading.get_ident()
+        atexit.register(_JOB_RUNNER.close)  # after the pool's own atexit close (LIFO)
+    if threading.get_ident() != _JOB_RUNNER_THREAD:
+        return asyncio.run(coro)
+    return _JOB_RUNNER.run(coro)
+
+
+async def _execute_item_async(
+    adapter: Any,
+    hook_ctx: dict[str, Any],
+    raw: dict[str, Any],
+    attempts: int,
+    *,
+    job_id: str = "n/a",
+    idx: int = -1,
+) -> tuple[ItemResult, Any]:
+    """Async twin of runner._execute_item; also returns the page for after_item."""
+    page = await adapter.async_hooks.before_item(hook_ctx, raw)
+    final_result: ItemResult | None = None
+
+    for attempt in range(attempts):
+        try:
+            input_obj = _materialize_input(raw, adapter)
+            ar = await adapter.run_item_async(input_obj, page)
+
+            if ar.ok and ar.value is not None:
+                final_result = ItemResult(
+                    status=ItemStatus.DONE,
+                    retry_count=attempt,
+                    error_code=ErrorCode.NONE,
+                    output=ar.value,
+                    timings=ar.timings,
+                    extras=ar.extras or {},
+                )
+                break
+
+            if attempt < attempts - 1:
+                msg = ar.error_message or str(ar.error_code)
+                _retried(job_id, idx, attempt + 1, ar.error_code, msg)
+                adapter.hooks.on_retry(raw, attempt + 1, RuntimeError(msg))
+                continue
+
+            final_result = ItemResult(
+                status=ItemStatus.FAILED,
+                retry_count=attempt,
+                error_code=ar.error_code,
+                error_message=ar.error_message,
+                timings=ar.timings,
+                extras=ar.extras or {},
+            )
+
+        except Exception as exc:
+            code = to_error_code(exc)
+            if attempt < attempts - 1:
+                _retried(job_id, idx, attempt + 1, code, str(exc))
+                adapter.hooks.on_retry(raw, attempt + 1, exc)
+                continue
+            adapter.hooks.on_error(raw, exc)
+            final_result = ItemResult(
+                status=ItemStatus.FAILED,
+                error_code=code,
+                error_message=str(exc),
+            )
+
+    result = final_result or ItemResult(
+        status=ItemStatus.FAILED,
+        error_code=ErrorCode.UNKNOWN,
+        error_message="no_result",
+    )
+    return result, page
+
+
+async def _finish_item_async(
+    adapter: Any, hook_ctx: dict[str, Any], result: ItemResult, page: Any
+) -> None:
+    """Let async after_item mutate timings/extras and release the page."""
+    mutable_view: dict[str, Any] = {
+        "status": result.status,
+        "timings": dict(result.timings or {}),
+        "extras": dict(result.extras or {}),
+    }
+    await adapter.async_hooks.after_item(hook_ctx, mutable_view, page)
+    result.timings = mutable_view.get("timings") or result.timings
+    result.extras = mutable_view.get("extras") or result.extras
+
+
+async def run_adapter_async(
+    adapter: Any,
+    settings: Any,
+    flow: FlowType,
+    items: list[dict[str, Any]],
+    options: dict[str, Any],
+    on_result: ResultCallback | None = None,
+    completed: Mapping[int, ItemResult] | None = None,
+) -> list[ItemResult]:
+    """Run every item as a task on one job context, bounded by a semaphore."""
+    job_id = str(options.get("job_id") or "n/a")
+    attempts = int(settings.item_max_retries) + 1
+    done_before = completed or {}
+    in_flight = _resolve_concurrency(
+        options, settings, len(items) - len(done_before), cap_key="async_item_concurrency_max"
+    )
+    dedupe_on = bool(options.get("dedupe", True))
+
+    _logger.info(
+        "run_job_enter",
+        flow=str(flow),
+        items=len(items),
+        in_flight=in_flight,
+        resumed=len(done_before),
+    )
+    emit(JobStarted(job_id=job_id, flow=flow), _logger)
+    started = time.perf_counter()
+
+    # Gate in idx order so dedupe stays "first occurrence wins".
+    seen_keys: set[str] = set()
+    gates = [_gate_item(adapter, raw, dedupe_on, seen_keys) for raw in items]
+    slots: list[ItemResult | None] = [done_before.get(idx) for idx in range(len(items))]
+
+    hook_ctx = await adapter.async_hooks.before_job(
+        {"flow": str(flow), "options": options, "spec": adapter.spec}
+    )
+    emit(SessionOpened(job_id=job_id, flow=flow), _logger)
+    sem = asyncio.Semaphore(in_flight)
+
+    async def _one(idx: int, raw: dict[str, Any]) -> None:
+        gated = gates[idx]
+        if gated is not None:
+            slots[idx] = gated
+            await adapter.async_hooks.after_item(hook_ctx, {"status": gated.status}, None)
+            _notify(on_result, idx, gated)
+            return
+        async with sem:
+            emit(ItemStarted(job_id=job_id, item_index=idx), _logger)
+            t0 = time.perf_counter()
+            result, page = await _execute_item_async(
+                adapter, hook_ctx, raw, attempts, job_id=job_id, idx=idx
+            )
+            slots[idx] = result
+            await _finish_item_async(adapter, hook_ctx, result, page)
+            _notify(on_result, idx, result)
+            emit(_item_finished(job_id, idx, result, t0), _logger)
+
+    tasks = [
+        asyncio.create_task(_one(idx, raw))
+        for idx, raw in enumerate(items)
+        if idx not in done_before
+    ]
+    results: list[ItemResult] = []
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # Do not leave siblings navigating on a context we are about to close.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        results = [
+            r
+            or ItemResult(
+                status=ItemStatus.FAILED,
+                error_code=ErrorCode.UNKNOWN,
+                error_message="no_result",
+            )
+            for r in slots
+        ]
+        await adapter.async_hooks.after_job(hook_ctx, _summarize(results))
+        emit(_session_closed(job_id, flow, 0, len(results), started), _logger)
+
+    _close_job(flow, job_id, results, started)
+    return results
+
+
+async def run_job_async(
+    flow: FlowType,
+    items: list[dict[str, Any]],
+    options: dict[str, Any],
+    *,
+    on_result: ResultCallback | None = None,
+    completed: Mapping[int, ItemResult] | None = None,
+) -> list[ItemResult]:
+    """Entry for callers already on an event loop (flow must be ASYNC)."""
+    adapter = get_flow_adapter(flow)
+    if getattr(adapter, "async_hooks", None) is None or adapter.run_item_async is None:
+        raise ValueError(f"Flow has no async engine: {flow}")
+    return await run_adapter_async(
+        adapter, get_settings(), flow, items, options, on_result=on_result, completed=completed
+    )
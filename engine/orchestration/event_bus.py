@@ -0,0 +1,154 @@
+# root/engine/orchestration/event_bus.py
+"""In-process event bus: one bounded queue + thread per sink."""
+# Why: the item loop only enqueues; a slow DB or disk sink can lag but never stall a lane.
+
+from __future__ import annotations
+
+import queue
+import threading
+from abc import ABC, abstractmethod
+from typing import Any
+
+import structlog
+
+_logger = structlog.get_logger(__name__)
+
+_STOP = object()
+
+
+class EventSink(ABC):
+    """Sink base: receives events in emit order, in batches, on its own thread."""
+
+    name = "sink"
+
+    @abstractmethod
+    def handle(self, events: list[Any]) -> None:
+        """Process one batch; exceptions are logged and the batch is dropped."""
+
+    def close(self) -> None:
+        """Called once on the sink thread after the last batch."""
+        return None
+
+
+class _SinkLane:
+    """Queue + thread for one sink; overflow drops the oldest event."""
+
+    def __init__(self, sink: EventSink, max_queue: int, max_batch: int) -> None:
+        self.sink = sink
+        self.max_batch = max(int(max_batch), 1)
+        self.queue: queue.Queue[Any] = queue.Queue(maxsize=max(int(max_queue), 1))
+        self.dropped = 0
+        self.thread = threading.Thread(target=self._run, name=f"evt-sink-{sink.name}", daemon=True)
+
+    def offer(self, evt: Any) -> None:
+        """Never blocks: progress is only useful fresh, so the oldest entry goes first."""
+        while True:
+            try:
+                self.queue.put_nowait(evt)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [self.queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if _STOP in batch:
+                stopping = True
+                batch = [e for e in batch if e is not _STOP]
+            if not batch:
+                continue
+            try:
+                self.sink.handle(batch)
+            except Exception as e:
+                _logger.warning("event_sink_failed", sink=self.sink.name, err=str(e))
+        try:
+            self.sink.close()
+        except Exception as e:
+            _logger.warning("event_sink_close_failed", sink=self.sink.name, err=str(e))
+
+
+class EventBus:
+    """Fan-out to sinks; publish() is safe from any thread and never waits on a sink."""
+
+    def __init__(self, max_queue: int = 1000, max_batch: int = 256) -> None:
+        self.max_queue = max_queue
+        self.max_batch = max_batch
+        self._lanes: list[_SinkLane] = []
+        self._lock = threading.Lock()
+
+    def add_sink(self, sink: EventSink, max_queue: int | None = None) -> EventSink:
+        lane = _SinkLane(sink, max_queue or self.max_queue, self.max_batch)
+        lane.thread.start()
+        with self._lock:
+            self._lanes = [*self._lanes, lane]
+        return sink
+
+    def remove_sink(self, sink: EventSink, timeout: float = 2.0) -> None:
+        """Detach, drain what is queued, then close the sink."""
+        with self._lock:
+            lanes = [ln for ln in self._lanes if ln.sink is sink]
+            self._lanes = [ln for ln in self._lanes if ln.sink is not sink]
+        for lane in lanes:
+            self._stop_lane(lane, timeout)
+
+    def sinks(self) -> list[EventSink]:
+        return [ln.sink for ln in self._lanes]
+
+    def dropped(self) -> dict[str, int]:
+        return {ln.sink.name: ln.dropped for ln in self._lanes}
+
+    def publish(self, evt: Any) -> None:
+        for lane in self._lanes:  # copy-on-write list: no lock on the hot path
+            lane.offer(evt)
+
+    def close(self, timeout: float = 2.0) -> None:
+        with self._lock:
+            lanes, self._lanes = self._lanes, []
+        for lane in lanes:
+            self._stop_lane(lane, timeout)
+
+    @staticmethod
+    def _stop_lane(lane: _SinkLane, timeout: float) -> None:
+        try:
+            lane.queue.put(_STOP, timeout=timeout)  # drain: wait for room, do not drop
+        except queue.Full:
+            lane.offer(_STOP)
+        lane.thread.join(timeout=timeout)
+        if lane.dropped:
+            _logger.warning("event_sink_dropped", sink=lane.sink.name, dropped=lane.dropped)
+
+
+_BUS: EventBus | None = None
+_BUS_LOCK = threading.Lock()
+
+
+def get_event_bus() -> EventBus:
+    """Process-wide bus; sinks are installed by the process that owns them."""
+    global _BUS
+    if _BUS is None:
+        with _BUS_LOCK:
+            if _BUS is None:
+                from ..core.config.loader import get_settings
+
+                size = int(getattr(get_settings(), "events_queue_size", 1000) or 1000)
+                _BUS = EventBus(max_queue=size)
+    return _BUS
+
+
+def reset_event_bus() -> None:
+    """Tests/shutdown: close every sink and forget the bus."""
+    global _BUS
+    with _BUS_LOCK:
+        bus, _BUS = _BUS, None
+    if bus is not None:
+        bus.close()
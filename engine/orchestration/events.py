@@ -4,10 +4,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import structlog
 
 from ..core.constants.flows import FlowType
 from ..core.constants.statuses import ItemStatus, JobStatus
+from .event_bus import get_event_bus
+
+_logger = structlog.get_logger(__name__)
 
 
 @dataclass(slots=True)
@@ -25,6 +31,7 @@ class JobFinished:
     job_id: str
     flow: FlowType
     status: JobStatus
+    duration_ms: float = 0.0
 
 
 @dataclass(slots=True)
@@ -42,3 +49,53 @@ class ItemFinished:
     job_id: str
     item_index: int
     status: ItemStatus
+    error_code: str | None = None
+    retry_count: int = 0
+    duration_ms: float = 0.0
+    # Flow-reported breakdown (navigation, extraction, ...), seconds as the flow wrote them.
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class ItemRetried:
+    """Emitted when an attempt failed and the item is about to run again."""
+
+    job_id: str
+    item_index: int
+    attempt: int
+    error_code: str | None = None
+    error_message: str | None = None
+
+
+@dataclass(slots=True)
+class SessionOpened:
+    """Emitted when a lane opens its job context (browser/session)."""
+
+    job_id: str
+    flow: FlowType
+    lane: int = 0
+
+
+@dataclass(slots=True)
+class SessionClosed:
+    """Emitted when a lane closes its job context."""
+
+    job_id: str
+    flow: FlowType
+    lane: int = 0
+    items: int = 0
+    duration_ms: float = 0.0
+
+
+def event_payload(evt: Any) -> dict[str, Any]:
+    """Wire shape: {"type": <class name>, **fields} (enums are str already)."""
+    return {"type": type(evt).__name__, **asdict(evt)}
+
+
+def emit(evt: Any, logger: Any = None) -> None:
+    """Log the event and publish it to the bus; never waits on a sink.
+
+    `logger` keeps the "evt" line under the emitting module (runner vs async_runner).
+    """
+    (logger or _logger).info("evt", **asdict(evt))
+    get_event_bus().publish(evt)
@@ -1,24 +1,41 @@
 # root/engine/orchestration/runner.py
-"""Sequential runner using FlowAdapter + hooks."""
+"""Job runner using FlowAdapter + hooks (sequential or concurrent lanes)."""
 # Why: keep orchestration boring; flows own session/page details.
 
 from __future__ import annotations
 
-from dataclasses import asdict
+import queue
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Any
 
 import structlog
 
 from ..core.config.loader import get_settings
 from ..core.constants.flows import FlowType
+from ..core.constants.session import ExecutionMode
 from ..core.constants.statuses import ItemStatus, JobStatus
 from ..core.errors import ErrorCode, to_error_code
 from ..core.models.item_result import ItemResult
 from ..flows.registry import get_flow_adapter
-from .events import ItemFinished, ItemStarted, JobFinished, JobStarted
+from .events import (
+    ItemFinished,
+    ItemRetried,
+    ItemStarted,
+    JobFinished,
+    JobStarted,
+    SessionClosed,
+    SessionOpened,
+    emit,
+)
 
 _logger = structlog.get_logger(__name__)
 
+# Called with (idx, result) as soon as an item is terminal; may run on lane threads.
+ResultCallback = Callable[[int, ItemResult], None]
+
 
 def _fallback_dedupe_key(item: dict[str, Any]) -> str:
     """Fallback key based on URL + meta; deterministic and cheap."""
@@ -40,23 +57,23 @@ def _materialize_input(raw: dict[str, Any], adapter: Any) -> Any:
     return adapter.input_cls(**payload)
 
 
-def run_job(
-    flow: FlowType, items: list[dict[str, Any]], options: dict[str, Any]
-) -> list[ItemResult]:
-    """Sequential job runner; no threading, no signals, just hooks + retries."""
-    settings = get_settings()
-    adapter = get_flow_adapter(flow)
-
-    job_id = str(options.get("job_id") or "n/a")
-
-    _logger.info("run_job_enter", flow=str(flow), items=len(items))
-    _logger.info("evt", **asdict(JobStarted(job_id=job_id, flow=flow)))
+def _resolve_concurrency(
+    options: dict[str, Any], settings: Any, total: int, cap_key: str = "item_concurrency_max"
+) -> int:
+    """Pick lane count: job option wins, settings give default + hard cap."""
+    default = int(getattr(settings, "item_concurrency", 1) or 1)
+    cap = int(getattr(settings, cap_key, 8) or 1)
+    raw = options.get("concurrency")
+    try:
+        wanted = int(raw) if raw is not None else default
+    except (TypeError, ValueError):
+        _logger.warning("run_job_bad_concurrency", value=raw)
+        wanted = default
+    return max(1, min(wanted, cap, max(total, 1)))
 
-    results: list[ItemResult] = []
-    seen_keys: set[str] = set()
-    dedupe_on = bool(options.get("dedupe", True))
 
-    # Job-level context managed by flow (browser/session policy).
+def _open_job_ctx(adapter: Any, flow: FlowType, options: dict[str, Any]) -> dict[str, Any]:
+    """Job-level context managed by flow (browser/session policy)."""
     hook_ctx = adapter.hooks.before_job(
         {
             "flow": str(flow),
@@ -65,156 +82,406 @@ def run_job(
         }
     )
     hook_ctx["page_reuse"] = getattr(adapter, "page_reuse", False)
+    return hook_ctx
 
+
+def _dedupe_key(adapter: Any, raw: dict[str, Any]) -> str:
+    """Flow key when declared; fallback key when missing or broken."""
+    if hasattr(adapter.hooks, "dedupe_key"):
+        try:
+            return adapter.hooks.dedupe_key(raw) or ""
+        except Exception:
+            return _fallback_dedupe_key(raw)
+    return _fallback_dedupe_key(raw)
+
+
+def _gate_item(
+    adapter: Any, raw: dict[str, Any], dedupe_on: bool, seen_keys: set[str]
+) -> ItemResult | None:
+    """Validate + dedupe; return a terminal result when the item must not run."""
+    # ---- validate input ----
     try:
-        for idx, raw in enumerate(items):
-            # ---- validate input ----
-            try:
-                adapter.hooks.validate_input(raw)
-            except Exception as exc:
-                # Hard fail this item, continue others.
-                results.append(
-                    ItemResult(
-                        status=ItemStatus.FAILED,
-                        error_code=to_error_code(exc),
-                        error_message=str(exc),
-                    )
+        adapter.hooks.validate_input(raw)
+    except Exception as exc:
+        # Hard fail this item, continue others.
+        return ItemResult(
+            status=ItemStatus.FAILED,
+            error_code=to_error_code(exc),
+            error_message=str(exc),
+        )
+
+    # ---- dedupe ----
+    if dedupe_on:
+        key = _dedupe_key(adapter, raw)
+        if key and key in seen_keys:
+            return ItemResult(
+                status=ItemStatus.CANCELLED,
+                error_code=ErrorCode.DEDUPED,
+                error_message=ErrorCode.DEDUPED,
+            )
+        if key:
+            seen_keys.add(key)
+    return None
+
+
+def _retried(job_id: str, idx: int, attempt: int, code: Any, message: str | None) -> None:
+    emit(
+        ItemRetried(
+            job_id=job_id,
+            item_index=idx,
+            attempt=attempt,
+            error_code=str(code) if code else None,
+            error_message=message,
+        ),
+        _logger,
+    )
+
+
+def _item_finished(job_id: str, idx: int, result: ItemResult, t0: float) -> ItemFinished:
+    """Finished event with retry count, wall time and the flow's own timings."""
+    return ItemFinished(
+        job_id=job_id,
+        item_index=idx,
+        status=result.status,
+        error_code=str(result.error_code) if result.error_code else None,
+        retry_count=int(result.retry_count or 0),
+        duration_ms=round((time.perf_counter() - t0) * 1000, 3),
+        timings=dict(result.timings or {}),
+    )
+
+
+def _execute_item(
+    adapter: Any,
+    hook_ctx: dict[str, Any],
+    raw: dict[str, Any],
+    attempts: int,
+    *,
+    job_id: str = "n/a",
+    idx: int = -1,
+) -> ItemResult:
+    """Run one item with retries on the page handed out by the flow hooks."""
+    # ---- page lifecycle driven by flow hooks ----
+    page = adapter.hooks.before_item(hook_ctx, raw)
+    final_result: ItemResult | None = None
+
+    for attempt in range(attempts):
+        try:
+            input_obj = _materialize_input(raw, adapter)
+            ar = adapter.run_item(input_obj, page)
+
+            if ar.ok and ar.value is not None:
+                final_result = ItemResult(
+                    status=ItemStatus.DONE,
+                    retry_count=attempt,
+                    error_code=ErrorCode.NONE,
+                    output=ar.value,
+                    timings=ar.timings,
+                    extras=ar.extras or {},
                 )
-                adapter.hooks.after_item(hook_ctx, {"status": ItemStatus.FAILED})
+                break
+
+            # Retry on soft failure.
+            if attempt < attempts - 1:
+                msg = ar.error_message or str(ar.error_code)
+                _retried(job_id, idx, attempt + 1, ar.error_code, msg)
+                adapter.hooks.on_retry(raw, attempt + 1, RuntimeError(msg))
                 continue
 
-            # ---- dedupe ----
-            key = ""
-            if dedupe_on:
-                if hasattr(adapter.hooks, "dedupe_key"):
-                    try:
-                        key = adapter.hooks.dedupe_key(raw) or ""
-                    except Exception:
-                        key = _fallback_dedupe_key(raw)
-                else:
-                    key = _fallback_dedupe_key(raw)
-
-                if key and key in seen_keys:
-                    results.append(
-                        ItemResult(
-                            status=ItemStatus.CANCELLED,
-                            error_code=ErrorCode.DEDUPED,
-                            error_message=ErrorCode.DEDUPED,
-                        )
-                    )
-                    adapter.hooks.after_item(hook_ctx, {"status": ItemStatus.CANCELLED})
-                    continue
+            # Out of retries -> failed.
+            final_result = ItemResult(
+                status=ItemStatus.FAILED,
+                retry_count=attempt,
+                error_code=ar.error_code,
+                error_message=ar.error_message,
+                timings=ar.timings,
+                extras=ar.extras or {},
+            )
 
-                if key:
-                    seen_keys.add(key)
-
-            _logger.info(
-                "evt",
-                **asdict(
-                    ItemStarted(
-                        job_id=job_id,
-                        item_index=idx,
-                    )
-                ),
+        except Exception as exc:
+            code = to_error_code(exc)
+            if attempt < attempts - 1:
+                _retried(job_id, idx, attempt + 1, code, str(exc))
+                adapter.hooks.on_retry(raw, attempt + 1, exc)
+                continue
+            adapter.hooks.on_error(raw, exc)
+            final_result = ItemResult(
+                status=ItemStatus.FAILED,
+                error_code=code,
+                error_message=str(exc),
             )
 
-            # ---- page lifecycle driven by flow hooks ----
-            page = adapter.hooks.before_item(hook_ctx, raw)
-            attempts = int(settings.item_max_retries) + 1
-            final_result: ItemResult | None = None
+    return final_result or ItemResult(
+        status=ItemStatus.FAILED,
+        error_code=ErrorCode.UNKNOWN,
+        error_message="no_result",
+    )
+
+
+def _finish_item(adapter: Any, hook_ctx: dict[str, Any], result: ItemResult) -> None:
+    """Let after_item mutate timings/extras through a plain dict view."""
+    mutable_view: dict[str, Any] = {
+        "status": result.status,
+        "timings": dict(result.timings or {}),
+        "extras": dict(result.extras or {}),
+    }
+    adapter.hooks.after_item(hook_ctx, mutable_view)
+    result.timings = mutable_view.get("timings") or result.timings
+    result.extras = mutable_view.get("extras") or result.extras
+
+
+def _notify(on_result: ResultCallback | None, idx: int, result: ItemResult) -> None:
+    """Stream one terminal result to the caller; a broken sink must not fail the job."""
+    if on_result is None:
+        return
+    try:
+        on_result(idx, result)
+    except Exception as e:
+        _logger.error("run_job_on_result_failed", idx=idx, err=str(e))
+
+
+def _summarize(results: list[ItemResult]) -> dict[str, int]:
+    """Count terminal statuses for hooks/logs."""
+    return {
+        "done": sum(1 for r in results if r.status == ItemStatus.DONE),
+        "failed": sum(1 for r in results if r.status == ItemStatus.FAILED),
+        "cancelled": sum(1 for r in results if r.status == ItemStatus.CANCELLED),
+    }
+
+
+def _run_sequential(
+    adapter: Any,
+    flow: FlowType,
+    items: list[dict[str, Any]],
+    options: dict[str, Any],
+    attempts: int,
+    job_id: str,
+    on_result: ResultCallback | None = None,
+    completed: Mapping[int, ItemResult] | None = None,
+) -> list[ItemResult]:
+    """One page at a time on a single job-level context."""
+    results: list[ItemResult] = []
+    seen_keys: set[str] = set()
+    dedupe_on = bool(options.get("dedupe", True))
+
+    t_session = time.perf_counter()
+    hook_ctx = _open_job_ctx(adapter, flow, options)
+    emit(SessionOpened(job_id=job_id, flow=flow), _logger)
+
+    done_before = completed or {}
+
+    for idx, raw in enumerate(items):
+        gated = _gate_item(adapter, raw, dedupe_on, seen_keys)
+        if idx in done_before:
+            # Resumed job: gating above rebuilt seen_keys; keep the stored outcome.
+            results.append(done_before[idx])
+            continue
+        if gated is not None:
+            results.append(gated)
+            adapter.hooks.after_item(hook_ctx, {"status": gated.status})
+            _notify(on_result, idx, gated)
+            continue
+
+        emit(ItemStarted(job_id=job_id, item_index=idx), _logger)
+        t0 = time.perf_counter()
+        result = _execute_item(adapter, hook_ctx, raw, attempts, job_id=job_id, idx=idx)
+        results.append(result)
+        _finish_item(adapter, hook_ctx, result)
+        _notify(on_result, idx, result)
+        emit(_item_finished(job_id, idx, result, t0), _logger)
+
+    adapter.hooks.after_job(hook_ctx, _summarize(results))
+    emit(_session_closed(job_id, flow, 0, len(results), t_session), _logger)
+    return results
+
+
+_LANES: ThreadPoolExecutor | None = None
+_LANES_SIZE = 0
+_LANES_LOCK = threading.Lock()
+
+
+def _lane_executor(size: int) -> ThreadPoolExecutor:
+    """Long-lived lane threads shared by every job in this process (grown on demand).
+
+    Thread-bound resources a lane builds in before_job (each thread's warm browser
+    pool) then survive between jobs instead of dying with a per-job executor.
+    """
+    global _LANES, _LANES_SIZE
+    with _LANES_LOCK:
+        if _LANES is None or size > _LANES_SIZE:
+            if _LANES is not None:
+                _LANES.shutdown(wait=False)  # running lanes finish; new ones go to the bigger set
+            _LANES = ThreadPoolExecutor(max_workers=size, thread_name_prefix="job-lane")
+            _LANES_SIZE = size
+        return _LANES
+
+
+def _run_lanes(
+    adapter: Any,
+    flow: FlowType,
+    items: list[dict[str, Any]],
+    options: dict[str, Any],
+    attempts: int,
+    job_id: str,
+    lanes: int,
+    on_result: ResultCallback | None = None,
+    completed: Mapping[int, ItemResult] | None = None,
+) -> list[ItemResult]:
+    """N lanes pull items from a shared queue; each lane owns its job context.
+
+    Playwright's sync API binds objects to the thread that created them, so each
+    lane calls before_job/after_job itself instead of sharing one browser: N lanes
+    cost N browsers. Lanes run on the process's long-lived lane threads, so with
+    the browser pool on each lane leases a warm browser of its own thread.
+    """
+    dedupe_on = bool(options.get("dedupe", True))
+    seen_keys: set[str] = set()
 
-            for attempt in range(attempts):
+    # Gate in idx order up front so "first occurrence wins" stays deterministic.
+    done_before = completed or {}
+    slots: list[ItemResult | None] = [None] * len(items)
+    work: queue.SimpleQueue[tuple[int, dict[str, Any], ItemResult | None]] = queue.SimpleQueue()
+    for idx, raw in enumerate(items):
+        gated = _gate_item(adapter, raw, dedupe_on, seen_keys)
+        if idx in done_before:
+            slots[idx] = done_before[idx]
+            continue
+        work.put((idx, raw, gated))
+
+    def _lane(lane_no: int) -> None:
+        t_session = time.perf_counter()
+        hook_ctx = _open_job_ctx(adapter, flow, options)
+        emit(SessionOpened(job_id=job_id, flow=flow, lane=lane_no), _logger)
+        mine: list[ItemResult] = []
+        try:
+            while True:
                 try:
-                    input_obj = _materialize_input(raw, adapter)
-                    ar = adapter.run_item(input_obj, page)
-
-                    if ar.ok and ar.value is not None:
-                        final_result = ItemResult(
-                            status=ItemStatus.DONE,
-                            retry_count=attempt,
-                            error_code=ErrorCode.NONE,
-                            output=ar.value,
-                            timings=ar.timings,
-                            extras=ar.extras or {},
-                        )
-                        break
-
-                    # Retry on soft failure.
-                    if attempt < attempts - 1:
-                        msg = ar.error_message or str(ar.error_code)
-                        adapter.hooks.on_retry(raw, attempt + 1, RuntimeError(msg))
-                        continue
-
-                    # Out of retries -> failed.
-                    final_result = ItemResult(
-                        status=ItemStatus.FAILED,
-                        retry_count=attempt,
-                        error_code=ar.error_code,
-                        error_message=ar.error_message,
-                        timings=ar.timings,
-                        extras=ar.extras or {},
-                    )
-
-                except Exception as exc:
-                    code = to_error_code(exc)
-                    if attempt < attempts - 1:
-                        adapter.hooks.on_retry(raw, attempt + 1, exc)
-                        continue
-                    adapter.hooks.on_error(raw, exc)
-                    final_result = ItemResult(
-                        status=ItemStatus.FAILED,
-                        error_code=code,
-                        error_message=str(exc),
-                    )
-
-            results.append(
-                final_result
-                or ItemResult(
-                    status=ItemStatus.FAILED,
-                    error_code=ErrorCode.UNKNOWN,
-                    error_message="no_result",
-                )
-            )
-            _last = results[-1]
-            mutable_view: dict[str, Any] = {
-                "status": _last.status,
-                "timings": dict(_last.timings or {}),
-                "extras": dict(_last.extras or {}),
-            }
-            adapter.hooks.after_item(hook_ctx, mutable_view)
-            _last.timings = mutable_view.get("timings") or _last.timings
-            _last.extras = mutable_view.get("extras") or _last.extras
-
-            _logger.info(
-                "evt",
-                **asdict(
-                    ItemFinished(
-                        job_id=job_id,
-                        item_index=idx,
-                        status=results[-1].status,
-                    )
-                ),
-            )
+                    idx, raw, gated = work.get_nowait()
+                except queue.Empty:
+                    return
+
+                if gated is not None:
+                    slots[idx] = gated
+                    mine.append(gated)
+                    adapter.hooks.after_item(hook_ctx, {"status": gated.status})
+                    _notify(on_result, idx, gated)
+                    continue
+
+                emit(ItemStarted(job_id=job_id, item_index=idx), _logger)
+                t0 = time.perf_counter()
+                result = _execute_item(adapter, hook_ctx, raw, attempts, job_id=job_id, idx=idx)
+                slots[idx] = result
+                mine.append(result)
+                _finish_item(adapter, hook_ctx, result)
+                _notify(on_result, idx, result)
+                emit(_item_finished(job_id, idx, result, t0), _logger)
+        finally:
+            adapter.hooks.after_job(hook_ctx, _summarize(mine))
+            emit(_session_closed(job_id, flow, lane_no, len(mine), t_session), _logger)
+            _logger.info("run_job_lane_leave", lane=lane_no, items=len(mine))
+
+    executor = _lane_executor(lanes)
+    futures = [executor.submit(_lane, n) for n in range(lanes)]
+    wait(futures)
+    # Surface the first lane failure like the sequential path would.
+    for fut in futures:
+        fut.result()
+
+    return [
+        r
+        or ItemResult(
+            status=ItemStatus.FAILED,
+            error_code=ErrorCode.UNKNOWN,
+            error_message="no_result",
+        )
+        for r in slots
+    ]
+
+
+def _session_closed(job_id: str, flow: FlowType, lane: int, items: int, t0: float) -> SessionClosed:
+    return SessionClosed(
+        job_id=job_id,
+        flow=flow,
+        lane=lane,
+        items=items,
+        duration_ms=round((time.perf_counter() - t0) * 1000, 3),
+    )
+
+
+def _close_job(
+    flow: FlowType, job_id: str, results: list[ItemResult], started: float | None = None
+) -> None:
+    """Derive job status from item results and emit the closing events."""
+    summary = _summarize(results)
+    if summary["cancelled"] > 0 and (summary["done"] + summary["failed"]) < len(results):
+        job_status = JobStatus.CANCELLED
+    elif summary["failed"] > 0:
+        job_status = JobStatus.FAILED
+    else:
+        job_status = JobStatus.DONE
+
+    duration_ms = round((time.perf_counter() - started) * 1000, 3) if started else 0.0
+    emit(JobFinished(job_id=job_id, flow=flow, status=job_status, duration_ms=duration_ms), _logger)
+    _logger.info("run_job_leave", **summary)
+
+
+def resolve_execution(adapter: Any, settings: Any) -> ExecutionMode:
+    """The flow's declared engine; the async_engine setting is the kill switch for ASYNC."""
+    declared = getattr(adapter, "execution", ExecutionMode.SYNC)
+    if declared == ExecutionMode.ASYNC and not getattr(settings, "async_engine", True):
+        return ExecutionMode.SYNC
+    return ExecutionMode(declared)
 
-        # ---- summary ----
-        summary = {
-            "done": sum(1 for r in results if r.status == ItemStatus.DONE),
-            "failed": sum(1 for r in results if r.status == ItemStatus.FAILED),
-            "cancelled": sum(1 for r in results if r.status == ItemStatus.CANCELLED),
-        }
-        adapter.hooks.after_job(hook_ctx, summary)
 
-        if summary["cancelled"] > 0 and (summary["done"] + summary["failed"]) < len(results):
-            job_status = JobStatus.CANCELLED
-        elif summary["failed"] > 0:
-            job_status = JobStatus.FAILED
-        else:
-            job_status = JobStatus.DONE
+def run_job(
+    flow: FlowType,
+    items: list[dict[str, Any]],
+    options: dict[str, Any],
+    *,
+    on_result: ResultCallback | None = None,
+    completed: Mapping[int, ItemResult] | None = None,
+) -> list[ItemResult]:
+    """Run a job: hooks + retries, one lane by default, N lanes when asked.
+
+    Flows declared ExecutionMode.ASYNC are handed to the async runner on a
+    fresh event loop (unless AUTOSUITE_ASYNC_ENGINE=0), or on the worker's
+    long-lived loop when the browser pool is on, so callers keep one
+    entrypoint for every flow.
+    `on_result(idx, result)` fires as each item becomes terminal.
+    `completed` (idx -> stored result) resumes a job: those items are not run
+    or re-emitted, but still count toward dedupe and the final summary.
+    """
+    settings = get_settings()
+    adapter = get_flow_adapter(flow)
 
-        _logger.info("evt", **asdict(JobFinished(job_id=job_id, flow=flow, status=job_status)))
-        _logger.info("run_job_leave", **summary)
-    finally:
-        # Flow hooks own cleanup; runner stays boring.
-        pass
+    if resolve_execution(adapter, settings) == ExecutionMode.ASYNC:
+        from .async_runner import run_adapter_async, run_on_job_loop
 
+        return run_on_job_loop(
+            run_adapter_async(
+                adapter, settings, flow, items, options, on_result=on_result, completed=completed
+            ),
+            keep_loop=bool(getattr(settings, "pw_browser_pool", False)),
+        )
+
+    job_id = str(options.get("job_id") or "n/a")
+    attempts = int(settings.item_max_retries) + 1
+    remaining = len(items) - len(completed or {})
+    lanes = _resolve_concurrency(options, settings, remaining)
+
+    _logger.info(
+        "run_job_enter", flow=str(flow), items=len(items), lanes=lanes, resumed=len(completed or {})
+    )
+    emit(JobStarted(job_id=job_id, flow=flow), _logger)
+    started = time.perf_counter()
+
+    if lanes > 1:
+        results = _run_lanes(
+            adapter, flow, items, options, attempts, job_id, lanes, on_result, completed
+        )
+    else:
+        results = _run_sequential(
+            adapter, flow, items, options, attempts, job_id, on_result, completed
+        )
+
+    _close_job(flow, job_id, results, started)
     return results
@@ -0,0 +1,124 @@
+# root/engine/orchestration/sinks.py
+"""Engine-side event sinks: Prometheus counters and a JSONL event file."""
+# Why: metrics/audit trail must not depend on the service layer or its DB.
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import IO, Any
+
+import orjson
+import structlog
+from prometheus_client import Counter, Histogram
+
+from .event_bus import EventBus, EventSink
+from .events import (
+    ItemFinished,
+    ItemRetried,
+    JobFinished,
+    JobStarted,
+    SessionOpened,
+    event_payload,
+)
+
+_logger = structlog.get_logger(__name__)
+
+ITEMS = Counter(
+    "autosuite_items_total",
+    "Items that reached a terminal status.",
+    ["flow", "status", "error_code"],
+)
+ITEM_SECONDS = Histogram(
+    "autosuite_item_duration_seconds",
+    "Wall time of one item, retries included.",
+    ["flow", "status"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+ITEM_STEP_SECONDS = Histogram(
+    "autosuite_item_step_seconds",
+    "Flow-reported step timings (ItemResult.timings), one series per step name.",
+    ["flow", "step"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+RETRIES = Counter(
+    "autosuite_item_retries_total",
+    "Attempts that failed and were retried.",
+    ["flow"],
+)
+JOBS = Counter(
+    "autosuite_jobs_total",
+    "Jobs finished by the runner.",
+    ["flow", "status"],
+)
+SESSIONS = Counter(
+    "autosuite_job_sessions_total",
+    "Job contexts (browser sessions) opened by runner lanes.",
+    ["flow"],
+)
+
+
+class PrometheusSink(EventSink):
+    """Item events carry job_id only; the flow label comes from JobStarted."""
+
+    name = "prometheus"
+
+    def __init__(self) -> None:
+        self._flows: dict[str, str] = {}
+
+    def handle(self, events: list[Any]) -> None:
+        for evt in events:
+            if isinstance(evt, JobStarted):
+                self._flows[evt.job_id] = str(evt.flow)
+            elif isinstance(evt, ItemFinished):
+                flow = self._flows.get(evt.job_id, "unknown")
+                status = str(evt.status)
+                ITEMS.labels(flow=flow, status=status, error_code=evt.error_code or "NONE").inc()
+                ITEM_SECONDS.labels(flow=flow, status=status).observe(evt.duration_ms / 1000)
+                for step, seconds in evt.timings.items():
+                    if isinstance(seconds, int | float):
+                        ITEM_STEP_SECONDS.labels(flow=flow, step=step).observe(seconds)
+            elif isinstance(evt, ItemRetried):
+                RETRIES.labels(flow=self._flows.get(evt.job_id, "unknown")).inc()
+            elif isinstance(evt, SessionOpened):
+                SESSIONS.labels(flow=str(evt.flow)).inc()
+            elif isinstance(evt, JobFinished):
+                self._flows.pop(evt.job_id, None)
+                JOBS.labels(flow=str(evt.flow), status=str(evt.status)).inc()
+
+
+class JsonlFileSink(EventSink):
+    """Append one JSON object per event; one write() per batch keeps lines whole."""
+
+    name = "jsonl"
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._fh: IO[bytes] | None = None
+
+    def handle(self, events: list[Any]) -> None:
+        if self._fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = self.path.open("ab")
+        ts = time.time()
+        self._fh.write(
+            b"".join(orjson.dumps({"ts": ts, **event_payload(e)}) + b"\n" for e in events)
+        )
+        self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+def install_default_sinks(bus: EventBus, settings: Any) -> list[EventSink]:
+    """Sinks every job-running process wants, switched by settings."""
+    sinks: list[EventSink] = []
+    if getattr(settings, "metrics_enabled", False):
+        sinks.append(bus.add_sink(PrometheusSink()))
+    path = getattr(settings, "events_jsonl_path", "")
+    if path:
+        sinks.append(bus.add_sink(JsonlFileSink(path)))
+    _logger.info("event_sinks_installed", sinks=[s.name for s in sinks])
+    return sinks
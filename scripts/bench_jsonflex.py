@@ -0,0 +1,147 @@
+# root/scripts/bench_jsonflex.py
+"""JSONFlex microbenchmark: load N job items with stdlib json vs orjson codecs."""
+# Why: item output/timings/extras decode dominates job_detail and export on big jobs.
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import create_engine, delete, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from engine.core.constants.statuses import ItemStatus, JobStatus
+from service.db import types as jtypes
+from service.db.models import Base, Job, JobItem
+
+Codec = tuple[Callable[[Any], str], Callable[[str | bytes], Any]]
+
+CODECS: dict[str, Codec] = {
+    "json": (lambda v: json.dumps(v, ensure_ascii=False), json.loads),
+    "orjson": (jtypes.json_dumps, jtypes.json_loads),
+}
+
+
+def _payload(n: int) -> dict[str, Any]:
+    # Shape close to a crawl_simple result: a few scalars + link/heading lists.
+    return {
+        "url": f"https://example.com/page/{n}",
+        "title": f"Example page {n} — tiêu đề",
+        "status_code": 200,
+        "headings": [f"Heading {n}.{k}" for k in range(8)],
+        "links": [{"href": f"/p/{n}/{k}", "text": f"link {k}"} for k in range(20)],
+    }
+
+
+def _engine(url: str, codec: Codec) -> Engine:
+    dumps, loads = codec
+    return create_engine(url, future=True, json_serializer=dumps, json_deserializer=loads)
+
+
+def _use(codec: Codec) -> None:
+    # JSONFlex resolves the module-level helpers at call time (TEXT dialects).
+    jtypes.json_dumps, jtypes.json_loads = codec  # type: ignore[assignment]
+
+
+def _seed(factory: sessionmaker[Session], rows: int) -> str:
+    job_id = str(uuid.uuid4())
+    now = datetime.now(UTC)
+    with factory() as db:
+        db.execute(delete(JobItem))
+        db.execute(delete(Job))
+        db.add(Job(id=job_id, flow_type="CRAWL_SIMPLE", status=str(JobStatus.DONE)))
+        db.add_all(
+            JobItem(
+                id=str(uuid.uuid4()),
+                job_id=job_id,
+                idx=n,
+                status=str(ItemStatus.DONE),
+                input={"url": f"https://example.com/page/{n}"},
+                output=_payload(n),
+                timings={"goto": 0.42, "extract": 0.03, "total": 0.45},
+                extras={"lane": n % 4},
+                created_at=now,
+            )
+            for n in range(rows)
+        )
+        db.commit()
+    return job_id
+
+
+def _best_of(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run(url: str, name: str, rows: int, repeat: int) -> dict[str, float]:
+    codec = CODECS[name]
+    _use(codec)
+    engine = _engine(url, codec)
+    factory = sessionmaker(bind=engine, expire_on_commit=False, future=True)
+    t0 = time.perf_counter()
+    job_id = _seed(factory, rows)
+    insert_s = time.perf_counter() - t0
+
+    def _load() -> None:
+        with factory() as db:
+            items = db.scalars(select(JobItem).where(JobItem.job_id == job_id)).all()
+            if len(items) != rows:
+                raise RuntimeError(f"loaded {len(items)} of {rows} rows")
+
+    load_s = _best_of(_load, repeat)
+    docs = [_payload(n) for n in range(rows)]
+    encoded = [codec[0](d) for d in docs]
+    decode_s = _best_of(lambda: [codec[1](e) for e in encoded], repeat)
+    encode_s = _best_of(lambda: [codec[0](d) for d in docs], repeat)
+    engine.dispose()
+    return {
+        "insert": round(insert_s, 3),
+        "load": round(load_s, 3),
+        "encode": round(encode_s, 3),
+        "decode": round(decode_s, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--db-url", help="default: temp SQLite file")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    tmp = None
+    url = args.db_url
+    if not url:
+        tmp = tempfile.TemporaryDirectory()
+        url = f"sqlite:///{Path(tmp.name) / 'bench_jsonflex.db'}"
+    setup = create_engine(url, future=True)
+    Base.metadata.create_all(setup)
+    print(f"db={setup.dialect.name} rows={args.rows} (seconds, best of {args.repeat})")
+    setup.dispose()
+
+    original = CODECS["orjson"]
+    print(f"{'codec':<7} {'insert':>7} {'load':>7} {'encode':>7} {'decode':>7}")
+    try:
+        for name in CODECS:
+            r = run(url, name, args.rows, args.repeat)
+            print(f"{name:<7} {r['insert']:>7} {r['load']:>7} {r['encode']:>7} {r['decode']:>7}")
+    finally:
+        _use(original)
+    if tmp is not None:
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# root/scripts/compress_json.py
+"""Pack existing job_items output/extras on a SQLite database (or unpack them) and report."""
+# Why: JSONFlex only compresses on write; rows stored before that stay raw TEXT.
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Any, cast
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
+
+from engine.core.config.loader import get_settings
+from service.db.types import ZSTD_MARKER, pack_json, unpack_json
+
+# JSONFlex(compress=True) columns on job_items.
+_COLUMNS = ("output", "extras")
+_SELECT = text(
+    "SELECT rowid, output, extras FROM job_items WHERE rowid > :after ORDER BY rowid LIMIT :n"
+)
+_UPDATE = text("UPDATE job_items SET output = :output, extras = :extras WHERE rowid = :rid")
+
+
+def _convert(value: Any, min_bytes: int, undo: bool) -> tuple[Any, int, int] | None:
+    """(new value, bytes before, bytes after), or None when the value stays as it is."""
+    if undo:
+        if not (isinstance(value, bytes) and value.startswith(ZSTD_MARKER)):
+            return None
+        raw = cast(bytes, unpack_json(value))
+        return raw.decode("utf-8"), len(value), len(raw)
+    if not isinstance(value, str):  # NULL or already packed
+        return None
+    packed = pack_json(value, min_bytes)
+    if packed is value:
+        return None
+    return packed, len(value.encode("utf-8")), len(packed)
+
+
+def backfill(
+    engine: Engine, min_bytes: int, *, batch: int = 500, dry_run: bool = False, undo: bool = False
+) -> dict[str, int]:
+    """Walk job_items by rowid, one short transaction per batch (the service may keep writing)."""
+    stats = {"rows": 0, "values": 0, "before": 0, "after": 0}
+    after = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(_SELECT, {"after": after, "n": batch}).all()
+            if not rows:
+                return stats
+            updates: list[dict[str, Any]] = []
+            for rowid, *values in rows:
+                row = {"rid": rowid, **dict(zip(_COLUMNS, values, strict=True))}
+                changed = False
+                for col, value in zip(_COLUMNS, values, strict=True):
+                    converted = _convert(value, min_bytes, undo)
+                    if converted is None:
+                        continue
+                    row[col], before, now = converted
+                    changed = True
+                    stats["values"] += 1
+                    stats["before"] += before
+                    stats["after"] += now
+                if changed:
+                    updates.append(row)
+            stats["rows"] += len(updates)
+            if updates and not dry_run:
+                conn.execute(_UPDATE, updates)
+            after = rows[-1][0]
+
+
+def file_stats(conn: Connection) -> dict[str, int]:
+    """Database file size and the part of it sitting in the freelist (reusable pages)."""
+    page = int(conn.exec_driver_sql("PRAGMA page_size").scalar() or 0)
+    pages = int(conn.exec_driver_sql("PRAGMA page_count").scalar() or 0)
+    free = int(conn.exec_driver_sql("PRAGMA freelist_count").scalar() or 0)
+    return {"file": page * pages, "free": page * free}
+
+
+def _mb(n: int) -> str:
+    return f"{n / 1_048_576:.2f} MB"
+
+
+def main() -> None:
+    s = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--db-url", default=s.db_url, help="default: AUTOSUITE_DB_URL")
+    parser.add_argument("--min-bytes", type=int, default=s.json_compress_min_bytes)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true", help="report only, write nothing")
+    parser.add_argument("--undo", action="store_true", help="unpack back to plain JSON text")
+    parser.add_argument("--vacuum", action="store_true", help="VACUUM after to shrink the file")
+    args = parser.parse_args()
+
+    engine = create_engine(args.db_url, future=True)
+    if engine.dialect.name != "sqlite":
+        sys.exit("compress_json: SQLite only (Postgres compresses JSONB itself)")
+    with engine.connect() as conn:
+        start = file_stats(conn)
+
+    stats = backfill(engine, args.min_bytes, batch=args.batch, dry_run=args.dry_run, undo=args.undo)
+    if args.vacuum and not args.dry_run:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.exec_driver_sql("VACUUM")
+    with engine.connect() as conn:
+        end = file_stats(conn)
+    engine.dispose()
+
+    verb = "would rewrite" if args.dry_run else "rewrote"
+    mode = "unpack" if args.undo else f"pack >= {args.min_bytes} chars"
+    print(f"{mode}: {verb} {stats['values']} values in {stats['rows']} rows")
+    if stats["before"]:
+        ratio = stats["after"] / stats["before"]
+        saved = stats["before"] - stats["after"]
+        print(
+            f"values: {_mb(stats['before'])} -> {_mb(stats['after'])} "
+            f"({ratio:.0%}, {_mb(saved)} saved)"
+        )
+    print(
+        f"file:   {_mb(start['file'])} -> {_mb(end['file'])} "
+        f"(free pages {_mb(start['free'])} -> {_mb(end['free'])})"
+    )
+    if stats["rows"] and not args.vacuum and not args.dry_run:
+        # Rows under a page shrink in place: the slack is reused, the file keeps its size.
+        print("freed space is reused by new rows; pass --vacuum to shrink the file now")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+# root/scripts/explain_queries.py
+"""Dump EXPLAIN plans for the service's hot queries against a seeded database."""
+# Why: prove every query is index-backed (no full scans) at ~1M job_items.
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Executable, create_engine, event, func, insert, inspect, select, update
+from sqlalchemy.engine import Connection, Engine
+
+from engine.core.constants.statuses import ItemStatus, JobStatus
+from service.db.migrations import ensure_indexes
+from service.db.models import Base, Job, JobItem
+from service.db.repo import encode_cursor, items_by_status_stmt, items_page_stmt, jobs_page_stmt
+from service.executor.progress import started_items_stmt
+
+_CHUNK = 50_000
+
+
+def _seed(engine: Engine, jobs: int, items_per_job: int) -> str:
+    """Mostly finished jobs plus a PENDING/RUNNING tail; returns one RUNNING job id."""
+    t0 = datetime(2026, 1, 1, tzinfo=UTC)
+    job_rows: list[dict[str, Any]] = []
+    for n in range(jobs):
+        status = JobStatus.DONE
+        if n >= jobs - 20:
+            status = JobStatus.PENDING
+        elif n >= jobs - 24:
+            status = JobStatus.RUNNING
+        job_rows.append(
+            {
+                "id": str(uuid.uuid4()),
+                "flow_type": "CRAWL_SIMPLE",
+                "status": str(status),
+                "created_at": t0 + timedelta(seconds=n),
+                "count_done": 0,
+                "count_failed": 0,
+                "count_cancelled": 0,
+            }
+        )
+    statuses = [str(ItemStatus.DONE)] * 8 + [str(ItemStatus.FAILED), str(ItemStatus.PENDING)]
+    with engine.begin() as conn:
+        conn.execute(insert(Job), job_rows)
+        batch: list[dict[str, Any]] = []
+        for job in job_rows:
+            for idx in range(items_per_job):
+                batch.append(
+                    {
+                        "id": str(uuid.uuid4()),
+                        "job_id": job["id"],
+                        "idx": idx,
+                        "status": statuses[idx % len(statuses)],
+                        "retry_count": 0,
+                        "input": {"url": f"https://example.com/{idx}"},
+                        "created_at": job["created_at"],
+                    }
+                )
+                if len(batch) >= _CHUNK:
+                    conn.execute(insert(JobItem), batch)
+                    batch.clear()
+        if batch:
+            conn.execute(insert(JobItem), batch)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    return str(job_rows[jobs - 22]["id"])
+
+
+def _queries(job_id: str, created_at: datetime) -> list[tuple[str, Executable]]:
+    """Mirror of every statement the service issues (name = call site)."""
+    running = str(JobStatus.RUNNING)
+    pending = str(JobStatus.PENDING)
+    unfinished = JobItem.finished_at.is_(None)
+    return [
+        ("api.jobs.list_jobs / history (page 1)", jobs_page_stmt(50)),
+        (
+            "api.jobs.list_jobs / history (cursor)",
+            jobs_page_stmt(50, cursor=encode_cursor(created_at, job_id)),
+        ),
+        ("api.jobs.list_jobs (status filter)", jobs_page_stmt(50, status=pending)),
+        ("api.jobs.get_job", select(Job).where(Job.id == job_id)),
+        (
+            "api.jobs.list_job_items / worker._load_items / export",
+            select(JobItem).where(JobItem.job_id == job_id).order_by(JobItem.idx.asc()),
+        ),
+        (
+            "api.jobs.list_job_items (fields + status + keyset page)",
+            items_page_stmt(
+                job_id,
+                ["status", "output"],
+                statuses=[str(ItemStatus.FAILED)],
+                limit=100,
+                after_idx=200,
+            ),
+        ),
+        (
+            "api.jobs.list_job_items (fields, keyset page)",
+            items_page_stmt(job_id, ["status", "error_code"], limit=100, after_idx=200),
+        ),
+        (
+            "api.jobs.cancel_job (items)",
+            update(JobItem)
+            .where(JobItem.job_id == job_id, unfinished)
+            .values(status=str(ItemStatus.CANCELLED)),
+        ),
+        (
+            "views.pages.job_detail / api.jobs summary (count_items_by_status)",
+            items_by_status_stmt(job_id),
+        ),
+        (
+            "views.partials.job_items_tbody",
+            select(JobItem).where(JobItem.job_id == job_id).order_by(JobItem.idx.asc()),
+        ),
+        (
+            "views.partials.job_items_delta",
+            select(JobItem)
+            .where(JobItem.job_id == job_id, JobItem.version > 3)
+            .order_by(JobItem.idx.asc()),
+        ),
+        (
+            "worker._load_completed",
+            select(JobItem).where(JobItem.job_id == job_id, JobItem.finished_at.is_not(None)),
+        ),
+        (
+            "result_sink.load_item_ids",
+            select(JobItem.idx, JobItem.id).where(JobItem.job_id == job_id),
+        ),
+        (
+            "result_sink.write_results (item by pk)",
+            update(JobItem).where(JobItem.id == "x").values(status=str(ItemStatus.DONE)),
+        ),
+        (
+            "progress.DbProgressSink (job version bump)",
+            update(Job).where(Job.id == job_id).values(version=Job.version + 1),
+        ),
+        (
+            "progress.DbProgressSink (started items)",
+            started_items_stmt(job_id, list(range(16)), 1),
+        ),
+        (
+            "result_sink.finalize_job",
+            select(Job.count_done, Job.count_failed, Job.count_cancelled).where(Job.id == job_id),
+        ),
+        (
+            "scheduler._running_jobs_count",
+            select(func.count()).select_from(Job).where(Job.status == running),
+        ),
+        (
+            "scheduler._pending_candidates",
+            select(Job.id)
+            .where(Job.status == pending, Job.worker_pid.is_(None))
+            .order_by(Job.created_at.asc())
+            .limit(8),
+        ),
+        (
+            "scheduler._claim_batch",
+            update(Job)
+            .where(
+                Job.id.in_(
+                    select(Job.id)
+                    .where(Job.status == pending, Job.worker_pid.is_(None))
+                    .order_by(Job.created_at.asc())
+                    .limit(8)
+                )
+            )
+            .values(status=running),
+        ),
+        ("scheduler.reconcile_stale_jobs", select(Job).where(Job.status == running)),
+        (
+            "scheduler._cancel_unfinished_items",
+            update(JobItem)
+            .where(JobItem.job_id == job_id, unfinished)
+            .values(status=str(ItemStatus.CANCELLED)),
+        ),
+    ]
+
+
+class _PlanCapture:
+    """Run EXPLAIN on the DBAPI cursor right before each statement executes."""
+
+    def __init__(self, engine: Engine) -> None:
+        self.prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+        self.plan: list[str] = []
+        event.listen(engine, "before_cursor_execute", self._before)
+
+    def _before(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if executemany or statement.lstrip().upper().startswith(("EXPLAIN", "ANALYZE")):
+            return
+        cursor.execute(self.prefix + statement, parameters)
+        # SQLite: (id, parent, notused, detail); Postgres: (QUERY PLAN,)
+        self.plan = [str(row[-1]) for row in cursor.fetchall()]
+
+
+def _full_scans(dialect: str, plan: list[str]) -> list[str]:
+    if dialect == "sqlite":
+        return [p for p in plan if p.startswith("SCAN ") and " USING " not in p]
+    return [p for p in plan if "Seq Scan" in p]
+
+
+def _require_empty(engine: Engine) -> None:
+    """Seeding needs a database of its own: never touch one that already holds the schema."""
+    existing = set(inspect(engine).get_table_names()) & set(Base.metadata.tables)
+    if existing:
+        engine.dispose()
+        sys.exit(
+            f"explain_queries: {sorted(existing)} already exist at --db-url; "
+            "point it at an empty scratch database"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--db-url", help="empty scratch database to seed (default: temp SQLite file)"
+    )
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--items-per-job", type=int, default=500)
+    args = parser.parse_args()
+
+    tmp = None
+    url = args.db_url
+    if not url:
+        tmp = tempfile.TemporaryDirectory()
+        url = f"sqlite:///{Path(tmp.name) / 'explain.db'}"
+    engine = create_engine(url, future=True)
+    _require_empty(engine)
+    Base.metadata.create_all(engine)
+    ensure_indexes(engine)
+
+    t0 = time.perf_counter()
+    job_id = _seed(engine, args.jobs, args.items_per_job)
+    total = args.jobs * args.items_per_job
+    print(f"db={engine.dialect.name} items={total} seeded in {time.perf_counter() - t0:.1f}s")
+
+    with engine.connect() as conn:
+        created_at = conn.scalar(select(Job.created_at).where(Job.id == job_id))
+    capture = _PlanCapture(engine)
+    offenders: list[str] = []
+    for name, stmt in _queries(job_id, created_at):
+        with engine.connect() as conn:
+            trans = conn.begin()
+            started = time.perf_counter()
+            conn.execute(stmt)
+            ms = (time.perf_counter() - started) * 1000
+            trans.rollback()
+        scans = _full_scans(engine.dialect.name, capture.plan)
+        flag = "FULL SCAN" if scans else "ok"
+        print(f"\n== {name}  [{flag}, {ms:.1f} ms]")
+        for line in capture.plan:
+            print(f"   {line}")
+        if scans:
+            offenders.append(name)
+
+    engine.dispose()
+    if tmp is not None:
+        tmp.cleanup()
+    else:
+        print(f"\nseeded tables left in {engine.url.render_as_string(hide_password=True)}")
+    if offenders:
+        print(f"\nfull scans: {offenders}")
+        sys.exit(1)
+    print("\nno full scans")
+
+
+if __name__ == "__main__":
+    main()
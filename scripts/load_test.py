@@ -0,0 +1,113 @@
+# root/scripts/load_test.py
+"""Polling load test: many open job pages hitting the read endpoints at once."""
+# Why: compare requests/sec and tail latency of the read routes across DB stacks.
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import UTC, datetime
+
+import httpx
+
+READ_PATHS = (
+    "/api/v1/jobs/{job_id}",
+    "/api/v1/jobs/{job_id}/items",
+    "/jobs/{job_id}/items",  # HTMX items partial (first paint)
+    "/jobs/{job_id}/items/delta?since=0&cols=status,timings",  # HTMX delta poll
+    "/api/v1/history?limit=50",
+)
+
+
+def seed(db_url: str, items: int) -> str:
+    """Insert one finished job with `items` rows directly; returns its id."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from service.db.models import Base, Job, JobItem
+
+    engine = create_engine(db_url, future=True)
+    Base.metadata.create_all(engine)
+    job_id = str(uuid.uuid4())
+    now = datetime.now(UTC)
+    with sessionmaker(bind=engine)() as db:
+        db.add(Job(id=job_id, flow_type="CRAWL_SIMPLE", status="DONE", count_done=items))
+        db.add_all(
+            JobItem(
+                job_id=job_id,
+                idx=i,
+                status="DONE",
+                input={"url": f"https://example.com/{i}"},
+                output={"title": f"Example {i}", "meta": {"description": "x" * 200}},
+                timings={"total": 1.2},
+                finished_at=now,
+            )
+            for i in range(items)
+        )
+        db.commit()
+    engine.dispose()
+    return job_id
+
+
+async def _user(
+    client: httpx.AsyncClient, paths: list[str], until: float, lat: list[float], errors: list[int]
+) -> None:
+    n = 0
+    while time.perf_counter() < until:
+        path = paths[n % len(paths)]
+        n += 1
+        t0 = time.perf_counter()
+        try:
+            r = await client.get(path)
+            if r.status_code >= 400:
+                errors.append(r.status_code)
+        except httpx.HTTPError:
+            errors.append(0)
+        lat.append(time.perf_counter() - t0)
+
+
+async def run(base_url: str, job_id: str, users: int, seconds: float) -> dict[str, float]:
+    paths = [p.format(job_id=job_id) for p in READ_PATHS]
+    lat: list[float] = []
+    errors: list[int] = []
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        until = time.perf_counter() + seconds
+        t0 = time.perf_counter()
+        await asyncio.gather(*(_user(client, paths, until, lat, errors) for _ in range(users)))
+        elapsed = time.perf_counter() - t0
+    lat.sort()
+    return {
+        "requests": len(lat),
+        "errors": len(errors),
+        "rps": round(len(lat) / elapsed, 1),
+        "p50_ms": round(statistics.median(lat) * 1000, 1) if lat else 0.0,
+        "p95_ms": round(lat[int(len(lat) * 0.95) - 1] * 1000, 1) if lat else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--job-id", help="existing job to poll; otherwise --seed-db-url")
+    parser.add_argument("--seed-db-url", help="insert a demo job into this DB first")
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--users", type=int, nargs="+", default=[16, 64, 128])
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    job_id = args.job_id or (seed(args.seed_db_url, args.items) if args.seed_db_url else None)
+    if not job_id:
+        parser.error("--job-id or --seed-db-url is required")
+
+    print(f"{'users':>5} {'rps':>8} {'p50_ms':>8} {'p95_ms':>8} {'errors':>6}")
+    for users in args.users:
+        r = asyncio.run(run(args.base_url, job_id, users, args.seconds))
+        print(f"{users:>5} {r['rps']:>8} {r['p50_ms']:>8} {r['p95_ms']:>8} {r['errors']:>6}")
+
+
+if __name__ == "__main__":
+    main()
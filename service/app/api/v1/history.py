@@ -1,44 +1,46 @@
 # root/service/app/api/v1/history.py
-"""History list (jobs summary) with paging & fields projection."""
-# Why: avoid heavy payloads; cursor/page kept simple for phase 1.
+"""History list (jobs summary) with keyset paging & fields projection."""
+# Why: avoid heavy payloads; opaque cursor keeps deep pages as cheap as the first.
 
 from __future__ import annotations
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import desc, select
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from service.app.deps import get_db, get_settings, require_api_key
+from service.app.deps import get_async_db, get_settings, require_api_key
 from service.app.utils.jinja_filters import format_tz
-from service.db.models import Job
+from service.db.repo import page_jobs
 
 router = APIRouter(dependencies=[Depends(require_api_key)])
 
 
 @router.get("")
-def list_jobs(
-    page: int = Query(1, ge=1),
+async def list_jobs(
+    request: Request,
+    cursor: str | None = None,
     limit: int | None = Query(None, ge=1, le=1000),
     flow_type: str | None = None,
     status: str | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     tz: str = Query("Asia/Ho_Chi_Minh"),
-) -> list[dict[str, Any]]:
-    """Return job summaries page; default limit via env."""
+) -> dict[str, Any]:
+    """Return one page of job summaries plus `next_cursor` (None on the last page)."""
+    if "page" in request.query_params:  # removed; fail loudly instead of serving page 1 forever
+        raise HTTPException(status_code=400, detail="page_removed_use_cursor")
     s = get_settings()
     per_page = limit or s.page_size_default
     if per_page > s.page_size_max:
         per_page = s.page_size_max
 
-    stmt = select(Job).order_by(desc(Job.created_at))
-    if flow_type:
-        stmt = stmt.filter(Job.flow_type == flow_type)
-    if status:
-        stmt = stmt.filter(Job.status == status)
-    rows = db.execute(stmt.limit(per_page).offset((page - 1) * per_page)).scalars().all()
-    return [
+    try:
+        rows, next_cursor = await page_jobs(
+            db, limit=per_page, cursor=cursor, status=status, flow_type=flow_type
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="invalid_cursor") from exc
+    items = [
         {
             "id": str(r.id),
             "flow_type": r.flow_type,
@@ -53,3 +55,4 @@ def list_jobs(
         }
         for r in rows
     ]
+    return {"items": items, "next_cursor": next_cursor}
@@ -4,34 +4,78 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import signal
+import tempfile
 import uuid
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
+from email.utils import formatdate
 from typing import Any
 
 import structlog
 from fastapi import APIRouter, Depends, Header as HeaderParam, HTTPException, Query, Request
-from fastapi.responses import Response
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import desc, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.background import BackgroundTask
 
 from engine.core.constants.flows import FlowType
 from engine.core.constants.statuses import ItemStatus, JobStatus
 from service.constants.api import Header as APIHeader
 
 from ....db.models import Job, JobItem
-from ....executor.scheduler import schedule_jobs
-from ...deps import get_db, get_settings, require_api_key
-from ...exporters.job_excel import build_job_excel_from_db
+from ....db.repo import bump_job_version, page_items, page_jobs
+from ....db.session import get_async_session_factory
+from ....executor.dispatcher import request_schedule
+from ....executor.pool import get_worker_pool
+from ...deps import get_async_db, get_db, get_session_factory, get_settings, require_api_key
+from ...event_broker import STREAM_CLOSED, TERMINAL, get_event_broker, sse_frame
+from ...exporters.export_cache import (
+    MEDIA_TYPES,
+    cached_export,
+    export_key,
+    export_root,
+    maybe_prune_exports,
+)
+from ...exporters.job_excel import write_job_excel
+from ...exporters.job_stream import iter_job_csv, iter_job_jsonl
 from ...registry.form_registry import get_flow_by_enum_name
+from ...utils.http_cache import (
+    job_etag,
+    not_modified,
+    not_modified_response,
+    revalidate_headers,
+)
+from ...utils.job_summary import get_job_summary, invalidate_job_summary
 from ...validation import prevalidate
 
 _logger = structlog.get_logger(__name__)
 router = APIRouter(dependencies=[Depends(require_api_key)])
 
+_SSE_KEEPALIVE_S = 15.0
+
+# /items `fields=`: JobItem columns clients may ask for; JSON ones default to {}.
+_ITEM_FIELDS = (
+    "id",
+    "idx",
+    "status",
+    "retry_count",
+    "error_code",
+    "error_message",
+    "input",
+    "output",
+    "timings",
+    "extras",
+    "created_at",
+    "finished_at",
+)
+_JSON_FIELDS = frozenset({"input", "output", "timings", "extras"})
+_ITEM_STATUSES = frozenset(str(st) for st in ItemStatus)
+
 # ---------- payloads ----------
 
 
@@ -72,6 +116,45 @@ def _pretty_input_text(flow: FlowType, item: dict[str, Any]) -> str:
             return ""
 
 
+def _csv_param(raw: str | None) -> list[str]:
+    return [p.strip() for p in (raw or "").split(",") if p.strip()]
+
+
+def _item_projection(fields: str | None) -> tuple[list[str], list[str] | None]:
+    """`fields=` -> (columns to SELECT, output keys to keep or None for all of output).
+
+    "output.<key>" selects the output column and trims it to the named keys.
+    """
+    wanted = _csv_param(fields)
+    if not wanted:
+        return list(_ITEM_FIELDS), None
+    columns: dict[str, None] = {}
+    output_keys: dict[str, None] = {}
+    for f in wanted:
+        if f.startswith("output.") and len(f) > len("output."):
+            output_keys[f.removeprefix("output.")] = None
+            columns["output"] = None
+        elif f in _ITEM_FIELDS:
+            columns[f] = None
+        else:
+            raise HTTPException(status_code=400, detail="invalid_fields")
+    whole_output = "output" in wanted
+    return list(columns), None if whole_output or not output_keys else list(output_keys)
+
+
+def _item_row(row: dict[str, Any], output_keys: list[str] | None) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    for name, value in row.items():
+        if name == "id":
+            value = str(value)
+        elif name in _JSON_FIELDS:
+            value = value or {}
+            if name == "output" and output_keys is not None:
+                value = {k: value.get(k) for k in output_keys}
+        out[name] = value
+    return out
+
+
 # ---------- routes ----------
 
 
@@ -192,7 +275,7 @@ def create_job(
         }
 
     # Schedule based on slots (max workers, queue is FIFO).
-    schedule_jobs(db)
+    request_schedule(db)
 
     _logger.info(
         "job_created",
@@ -205,26 +288,28 @@ def create_job(
 
 
 @router.get("")
-def list_jobs(
-    page: int = Query(1, ge=1),
+async def list_jobs(
+    request: Request,
+    cursor: str | None = None,
     page_size: int | None = Query(None, ge=1),
     status: str | None = None,
     flow_type: str | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> dict[str, Any]:
-    """List jobs with simple paging (FIFO)."""
+    """List jobs newest-first; pass back `next_cursor` to get the next page."""
+    if "page" in request.query_params:  # removed; fail loudly instead of serving page 1 forever
+        raise HTTPException(status_code=400, detail="page_removed_use_cursor")
     s = get_settings()
     per = page_size or s.page_size_default
     if per > s.page_size_max:
         per = s.page_size_max
 
-    stmt = select(Job).order_by(desc(Job.created_at))
-    if status:
-        stmt = stmt.filter(Job.status == status)
-    if flow_type:
-        stmt = stmt.filter(Job.flow_type == flow_type)
-
-    rows = db.execute(stmt.limit(per).offset((page - 1) * per)).scalars().all()
+    try:
+        rows, next_cursor = await page_jobs(
+            db, limit=per, cursor=cursor, status=status, flow_type=flow_type
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="invalid_cursor") from exc
     items = [
         {
             "id": str(r.id),
@@ -240,15 +325,21 @@ def list_jobs(
         }
         for r in rows
     ]
-    return {"items": items, "page": page, "page_size": per}
+    return {"items": items, "page_size": per, "next_cursor": next_cursor}
 
 
-@router.get("/{job_id}")
-def get_job(job_id: str, db: Session = Depends(get_db)) -> dict[str, Any]:
-    """Lightweight meta; UI fetches items separately."""
-    row: Job | None = db.get(Job, job_id)
+@router.get("/{job_id}", response_model=None)
+async def get_job(
+    job_id: str, request: Request, response: Response, db: AsyncSession = Depends(get_async_db)
+) -> dict[str, Any] | Response:
+    """Lightweight meta; UI fetches items separately. Weak ETag from Job.version."""
+    row: Job | None = await db.get(Job, job_id)
     if not row:
         raise HTTPException(status_code=404, detail="job_not_found")
+    etag = job_etag(row, "job")
+    if not_modified(request, etag):
+        return not_modified_response(etag)
+    response.headers.update(revalidate_headers(etag))
     return {
         "id": str(row.id),
         "flow_type": row.flow_type,
@@ -263,42 +354,113 @@ def get_job(job_id: str, db: Session = Depends(get_db)) -> dict[str, Any]:
     }
 
 
-@router.get("/{job_id}/items")
-def list_job_items(job_id: str, db: Session = Depends(get_db)) -> dict[str, Any]:
-    """Return items of a job for API consumers (FE table builds on this)."""
-    job: Job | None = db.get(Job, job_id)
-    if not job:
+@router.get("/{job_id}/summary")
+async def get_job_summary_route(
+    job_id: str, db: AsyncSession = Depends(get_async_db)
+) -> dict[str, Any]:
+    """Status counters for pollers; cached briefly (finished jobs: until evicted)."""
+    summary = await get_job_summary(db, job_id)
+    if summary is None:
         raise HTTPException(status_code=404, detail="job_not_found")
+    return summary
 
-    rows = (
-        db.execute(select(JobItem).where(JobItem.job_id == job_id).order_by(JobItem.idx.asc()))
-        .scalars()
-        .all()
+
+@router.get("/{job_id}/events")
+async def stream_job_events(job_id: str, request: Request) -> StreamingResponse:
+    """SSE: `snapshot` (summary) first, then ItemStarted/ItemFinished/JobFinished.
+
+    Watchers share one producer per job via the local broker; the stream ends
+    after JobFinished (or StreamClosed when the producer dies; clients reconnect).
+    No DB session is held while the stream is open.
+    """
+    factory = get_async_session_factory()
+    broker = get_event_broker()
+    if factory is None or broker is None:
+        raise HTTPException(status_code=503, detail="events_unavailable")
+
+    async with factory() as db:
+        summary = await get_job_summary(db, job_id)
+        job: Job | None = await db.get(Job, job_id)
+    if summary is None or job is None:
+        raise HTTPException(status_code=404, detail="job_not_found")
+    since = int(job.version or 0)
+
+    async def _stream() -> AsyncIterator[bytes]:
+        yield b"retry: 3000\n\n" + sse_frame(summary, event="snapshot")
+        if summary["status"] in TERMINAL:
+            return
+        q = broker.subscribe(job_id, since)
+        try:
+            while True:
+                try:
+                    payload = await asyncio.wait_for(q.get(), timeout=_SSE_KEEPALIVE_S)
+                except TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield b": keepalive\n\n"
+                    continue
+                yield sse_frame(payload)
+                if payload.get("type") in ("JobFinished", STREAM_CLOSED):
+                    return
+        finally:
+            broker.unsubscribe(job_id, q)
+
+    return StreamingResponse(
+        _stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
-    items = [
-        {
-            "id": str(r.id),
-            "idx": r.idx,
-            "status": r.status,
-            "retry_count": r.retry_count,
-            "error_code": r.error_code,
-            "error_message": r.error_message,
-            "input": r.input or {},
-            "output": r.output or {},
-            "timings": r.timings or {},
-            "extras": r.extras or {},
-            "created_at": r.created_at,
-            "finished_at": r.finished_at,
-        }
-        for r in rows
-    ]
-    return {"job_id": job_id, "items": items}
+
+@router.get("/{job_id}/items", response_model=None)
+async def list_job_items(
+    job_id: str,
+    request: Request,
+    response: Response,
+    fields: str | None = None,
+    status: str | None = None,
+    limit: int | None = Query(None, ge=1),
+    after_idx: int | None = Query(None, ge=0),
+    db: AsyncSession = Depends(get_async_db),
+) -> dict[str, Any] | Response:
+    """Return items of a job for API consumers (FE table builds on this).
+
+    - fields: comma list of item fields and/or "output.<key>" (default: all).
+      Only those columns are read; `idx` is always included.
+    - status: comma list of item statuses to keep.
+    - limit/after_idx: keyset pages in idx order; pass back `next_after_idx`.
+
+    304 on a matching If-None-Match is answered from the Job row alone.
+    """
+    columns, output_keys = _item_projection(fields)
+    statuses = _csv_param(status)
+    if not set(statuses) <= _ITEM_STATUSES:
+        raise HTTPException(status_code=400, detail="invalid_status")
+    if limit is not None:
+        limit = min(limit, get_settings().page_size_max)
+
+    job: Job | None = await db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="job_not_found")
+    # Tag from the version read before the rows: a write in between is re-sent, never lost.
+    etag = job_etag(job, "items")
+    if not_modified(request, etag):
+        return not_modified_response(etag)
+    response.headers.update(revalidate_headers(etag))
+
+    rows, next_after_idx = await page_items(
+        db, job_id, columns, statuses=statuses, limit=limit, after_idx=after_idx
+    )
+    items = [_item_row(r, output_keys) for r in rows]
+    return {"job_id": job_id, "items": items, "next_after_idx": next_after_idx}
 
 
 @router.post("/{job_id}/cancel")
 def cancel_job(job_id: str, db: Session = Depends(get_db)) -> dict[str, Any]:
-    """Hard cancel: kill worker process (if any) and cancel pending items."""
+    """Hard cancel: stop the job's worker (if any) and cancel pending items.
+
+    A pool worker also holds other jobs, so the pool stops only this one.
+    """
     row: Job | None = db.get(Job, job_id)
     if not row:
         raise HTTPException(status_code=404, detail="job_not_found")
@@ -307,7 +469,10 @@ def cancel_job(job_id: str, db: Session = Depends(get_db)) -> dict[str, Any]:
         return {"id": job_id, "status": row.status}
 
     pid = row.worker_pid
-    if pid:
+    pool = get_worker_pool()
+    if pid and pool is not None:
+        pool.cancel(job_id)
+    elif pid:
         try:
             os.kill(pid, signal.SIGTERM)
         except ProcessLookupError:
@@ -315,37 +480,113 @@ def cancel_job(job_id: str, db: Session = Depends(get_db)) -> dict[str, Any]:
         except Exception as exc:
             _logger.warning("job_cancel_kill_failed", job_id=job_id, pid=pid, err=str(exc))
 
-    # Mark unfinished items cancelled.
+    # Mark unfinished items cancelled (stamped so live tables pick them up).
+    version = bump_job_version(db, job_id, status=str(JobStatus.CANCELLED), worker_pid=None)
     db.query(JobItem).filter(JobItem.job_id == job_id, JobItem.finished_at.is_(None)).update(
-        {"status": str(ItemStatus.CANCELLED)}, synchronize_session=False
-    )
-
-    db.query(Job).filter(Job.id == job_id).update(
-        {"status": str(JobStatus.CANCELLED), "worker_pid": None}, synchronize_session=False
+        {"status": str(ItemStatus.CANCELLED), "version": version}, synchronize_session=False
     )
     db.commit()
 
+    invalidate_job_summary(job_id)
     _logger.info("job_cancelled", job_id=job_id, pid=pid)
 
     # Free a slot -> schedule next jobs if any.
-    schedule_jobs(db)
+    request_schedule(db)
 
     return {"id": job_id, "status": str(JobStatus.CANCELLED)}
 
 
+def _export_job(db: Session, job_id: str) -> Job:
+    """404 before any byte is streamed; a streamed response cannot change status later."""
+    job = db.get(Job, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="job_not_found")
+    return job
+
+
+def _attachment(filename: str) -> dict[str, str]:
+    return {"Content-Disposition": f'attachment; filename="{filename}"'}
+
+
+def _export_session_factory() -> sessionmaker[Session]:
+    # Streamed bodies outlive the request's own session: they open (and close) their own.
+    factory = get_session_factory()
+    if factory is None:
+        raise HTTPException(status_code=503, detail="db_not_ready")
+    return factory
+
+
+def _cached_export(request: Request, db: Session, job: Job, fmt: str) -> Response | None:
+    """Finished jobs: 304 or the cached file. None while the job can still change."""
+    key = export_key(job, fmt)
+    if key is None:
+        return None
+    headers = revalidate_headers(f'"{key}"')
+    finished = job.finished_at
+    if finished is not None:
+        if finished.tzinfo is None:  # SQLite hands back naive UTC
+            finished = finished.replace(tzinfo=UTC)
+        headers["Last-Modified"] = formatdate(finished.timestamp(), usegmt=True)
+    if not_modified(request, headers["ETag"], finished):
+        return Response(status_code=304, headers=headers)
+
+    s = get_settings()
+    maybe_prune_exports(s)  # before the lookup: never prune the file we are about to send
+    path = cached_export(db, job, fmt, export_root(s))
+    return FileResponse(
+        path,
+        media_type=MEDIA_TYPES[fmt],
+        headers={**headers, **_attachment(f"job_{job.id}.{fmt}")},
+    )
+
+
 @router.get("/{job_id}/export.xlsx")
-def export_job_excel(job_id: str, db: Session = Depends(get_db)) -> Response:
-    """Export one job as an Excel file."""
+def export_job_excel(request: Request, job_id: str, db: Session = Depends(get_db)) -> Response:
+    """Export one job as an Excel file (cached once final; built on disk, streamed)."""
+    job = _export_job(db, job_id)
+    cached = _cached_export(request, db, job, "xlsx")
+    if cached is not None:
+        return cached
+
+    fd, path = tempfile.mkstemp(prefix=f"job_{job.id}_", suffix=".xlsx")
+    os.close(fd)
     try:
-        job, content = build_job_excel_from_db(db, job_id)
-    except ValueError as exc:
-        if str(exc) == "job_not_found":
-            raise HTTPException(status_code=404, detail="job_not_found") from exc
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-
-    filename = f"job_{job.id}.xlsx"
-    return Response(
-        content=content,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        write_job_excel(db, job, path)
+    except Exception:
+        os.unlink(path)
+        raise
+
+    return FileResponse(
+        path,
+        media_type=MEDIA_TYPES["xlsx"],
+        headers={**_attachment(f"job_{job.id}.xlsx"), "Cache-Control": "no-store"},
+        background=BackgroundTask(os.unlink, path),
+    )
+
+
+@router.get("/{job_id}/export.csv")
+def export_job_csv(request: Request, job_id: str, db: Session = Depends(get_db)) -> Response:
+    """Export one job as CSV, streamed row by row (same columns as the Excel file)."""
+    job = _export_job(db, job_id)
+    cached = _cached_export(request, db, job, "csv")
+    if cached is not None:
+        return cached
+    return StreamingResponse(
+        iter_job_csv(_export_session_factory(), job.id),
+        media_type=MEDIA_TYPES["csv"],
+        headers={**_attachment(f"job_{job.id}.csv"), "Cache-Control": "no-store"},
+    )
+
+
+@router.get("/{job_id}/export.jsonl")
+def export_job_jsonl(request: Request, job_id: str, db: Session = Depends(get_db)) -> Response:
+    """Export one job as JSON Lines: one stored item row per line, streamed."""
+    job = _export_job(db, job_id)
+    cached = _cached_export(request, db, job, "jsonl")
+    if cached is not None:
+        return cached
+    return StreamingResponse(
+        iter_job_jsonl(_export_session_factory(), job.id),
+        media_type=MEDIA_TYPES["jsonl"],
+        headers={**_attachment(f"job_{job.id}.jsonl"), "Cache-Control": "no-store"},
     )
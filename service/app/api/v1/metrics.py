@@ -4,14 +4,140 @@
 
 from __future__ import annotations
 
+import glob
+import os
+import threading
+from collections import defaultdict
+from collections.abc import Iterator
+
+import structlog
 from fastapi import APIRouter, Depends, HTTPException, Response
-from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.mmap_dict import MmapedDict
+from prometheus_client.registry import Collector
+from sqlalchemy import func, select
 
 from engine.core.config.schema import Settings
-from service.app.deps import get_settings, require_api_key
+from engine.core.constants.statuses import JobStatus
+from service.app.deps import get_session_factory, get_settings, require_api_key
+from service.db.models import Job
+
+_logger = structlog.get_logger(__name__)
 
 router = APIRouter(dependencies=[Depends(require_api_key)])
 
+# Set in the process environment before start (not .env): prometheus_client
+# picks its value backend at import time. Workers inherit it from the API.
+MULTIPROC_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+_GAUGED = (str(JobStatus.PENDING), str(JobStatus.RUNNING))
+
+# Summed per sample key, so a dead process's files fold into one archive file each.
+_ADDITIVE = ("counter", "histogram", "summary")
+_ARCHIVE_PID = "archive"
+
+
+class JobStatusCollector(Collector):
+    """Queue depth read from the DB at scrape time: always right, whatever process ran it."""
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        factory = get_session_factory()
+        if factory is None:
+            return
+        db = factory()
+        try:
+            rows = db.execute(
+                select(Job.status, func.count()).where(Job.status.in_(_GAUGED)).group_by(Job.status)
+            ).all()
+        except Exception as e:
+            _logger.warning("metrics_job_gauge_failed", err=str(e))
+            return
+        finally:
+            db.close()
+        counts = {str(status): int(n) for status, n in rows}
+        gauge = GaugeMetricFamily(
+            "autosuite_jobs_active", "Jobs pending or running.", labels=["status"]
+        )
+        for status in _GAUGED:
+            gauge.add_metric([status], counts.get(status, 0))
+        yield gauge
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def compact_dead_processes(path: str) -> int:
+    """Fold dead processes' counter/histogram/summary files into `<type>_archive.db`.
+
+    Spawn mode starts one process per job and every one leaves its own files, so
+    without this the scrape merges (and the disk keeps) one file set per job ever run.
+    Live gauge files of dead processes are simply dropped. Returns files removed.
+    Callers serialize it with scrapes (one API process owns the directory).
+    """
+    dead: dict[str, list[str]] = defaultdict(list)
+    for f in glob.glob(os.path.join(path, "*.db")):
+        parts = os.path.basename(f)[:-3].split("_")
+        if not parts[-1].isdigit() or _pid_alive(int(parts[-1])):
+            continue
+        if parts[0] in _ADDITIVE:
+            dead[parts[0]].append(f)
+        else:
+            multiprocess.mark_process_dead(int(parts[-1]), path)
+    removed = 0
+    for typ, files in dead.items():
+        totals: dict[str, float] = defaultdict(float)
+        for f in files:
+            for key, value, _ts, _pos in MmapedDict.read_all_values_from_file(f):
+                totals[key] += value
+        archive = MmapedDict(os.path.join(path, f"{typ}_{_ARCHIVE_PID}.db"))
+        try:
+            for key, value in totals.items():
+                current, _ = archive.read_value(key)
+                archive.write_value(key, current + value, 0.0)
+        finally:
+            archive.close()
+        for f in files:
+            os.remove(f)
+        removed += len(files)
+    if removed:
+        _logger.info("metrics_files_compacted", removed=removed)
+    return removed
+
+
+_JOBS_COLLECTOR = JobStatusCollector()
+_registered = False
+_register_lock = threading.Lock()
+_scrape_lock = threading.Lock()  # compaction must not interleave with a merge
+
+
+def _registry() -> CollectorRegistry:
+    """Multiprocess: merge every worker's files per scrape. Single process: default registry."""
+    global _registered
+    if os.environ.get(MULTIPROC_ENV):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        registry.register(_JOBS_COLLECTOR)
+        return registry
+    with _register_lock:  # sync route: concurrent first scrapes on the threadpool
+        if not _registered:
+            REGISTRY.register(_JOBS_COLLECTOR)
+            _registered = True
+    return REGISTRY
+
 
 @router.get("/metrics")
 def metrics() -> Response:
@@ -20,5 +146,12 @@ def metrics() -> Response:
     if not s.metrics_enabled:
         raise HTTPException(status_code=404)
 
-    data = generate_latest()
+    path = os.environ.get(MULTIPROC_ENV)
+    with _scrape_lock:
+        if path:
+            try:
+                compact_dead_processes(path)
+            except Exception as e:
+                _logger.warning("metrics_compact_failed", err=str(e))
+        data = generate_latest(_registry())
     return Response(content=data, media_type=CONTENT_TYPE_LATEST)
@@ -23,6 +23,14 @@ from engine.core.config.loader import (
 )
 from engine.core.config.schema import Settings
 from service.constants.api import Header
+from service.db.migrations import ensure_columns, ensure_indexes, ensure_jsonb_columns
+from service.db.session import (
+    JSON_ENGINE_KWARGS,
+    close_async_engine,
+    get_async_db as get_async_db,  # re-export: routers take dependencies from deps
+    init_async_engine,
+)
+from service.db.types import configure_json_compression
 
 _logger = structlog.get_logger(__name__)
 
@@ -42,7 +50,7 @@ def init_engine() -> None:
 
     s = get_settings()
     # future=True cho SQLAlchemy 2.x style, echo controlled by env.
-    _ENGINE = create_engine(s.db_url, echo=s.db_echo, future=True)
+    _ENGINE = create_engine(s.db_url, echo=s.db_echo, future=True, **JSON_ENGINE_KWARGS)
     _SessionLocal = sessionmaker(
         bind=_ENGINE,
         class_=Session,
@@ -74,6 +82,7 @@ async def close_db() -> None:
     if _ENGINE is not None:
         _ENGINE.dispose()
         _ENGINE = None
+    await close_async_engine()
 
 
 def init_logging() -> None:
@@ -122,16 +131,28 @@ async def init_db() -> None:
     if _ENGINE is not None and _SessionLocal is not None:
         return
     s = get_settings()
-    _ENGINE = create_engine(s.db_url, echo=s.db_echo, pool_pre_ping=True, future=True)
+    configure_json_compression(getattr(s, "json_compress_min_bytes", 1024))
+    _ENGINE = create_engine(
+        s.db_url, echo=s.db_echo, pool_pre_ping=True, future=True, **JSON_ENGINE_KWARGS
+    )
     _SessionLocal = sessionmaker(bind=_ENGINE, autoflush=False, autocommit=False, future=True)
 
     # Auto-create tables for phase 1 (Alemic optional later)
     from service.db import models as m
 
     m.Base.metadata.create_all(_ENGINE)
+    ensure_columns(_ENGINE)
+    ensure_indexes(_ENGINE)
+    ensure_jsonb_columns(_ENGINE)
     _logger.info("db_ready", url="db_ready")
 
 
+def init_async_db() -> None:
+    """Async engine for read routes; API process only (workers stay sync)."""
+    s = get_settings()
+    init_async_engine(s.db_url, echo=s.db_echo)
+
+
 # API key guard (optional via env)
 _api_key_header = APIKeyHeader(name=Header.API_KEY, auto_error=False)
 
@@ -0,0 +1,237 @@
+# root/service/app/event_broker.py
+"""Local fan-out of job events to SSE subscribers (one producer per watched job)."""
+# Why: N open tabs on a job should cost one DB tail, not N polling loops.
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+import structlog
+from sqlalchemy import select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from engine.core.constants.flows import FlowType
+from engine.core.constants.statuses import ItemStatus, JobStatus
+from engine.orchestration.event_bus import EventSink, get_event_bus
+from engine.orchestration.events import ItemFinished, ItemStarted, JobFinished, event_payload
+from service.db.models import Job, JobItem
+from service.executor.progress import EVENTS_CHANNEL, RELAYED_EVENTS
+
+from .utils.job_summary import invalidate_job_summary
+
+_logger = structlog.get_logger(__name__)
+
+TERMINAL = (str(JobStatus.DONE), str(JobStatus.FAILED), str(JobStatus.CANCELLED))
+_ITEM_LIVE = (str(ItemStatus.PENDING), str(ItemStatus.RUNNING))
+# Last payload when a job's tail dies early; the stream ends and EventSource reconnects.
+STREAM_CLOSED = "StreamClosed"
+
+
+class JobEventBroker:
+    """Subscribers get bounded queues; a slow client loses its oldest events, not ours."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        tail_s: float = 1.0,
+        queue_size: int = 256,
+    ) -> None:
+        self._factory = session_factory
+        self.tail_s = max(float(tail_s), 0.05)
+        self.queue_size = queue_size
+        self._subs: dict[str, set[asyncio.Queue[dict[str, Any]]]] = {}
+        self._producers: dict[str, asyncio.Task[None]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def subscribe(self, job_id: str, since: int) -> asyncio.Queue[dict[str, Any]]:
+        """Register a watcher; the first one for a job starts its DB tail at `since`."""
+        self._loop = asyncio.get_running_loop()
+        q: asyncio.Queue[dict[str, Any]] = asyncio.Queue(self.queue_size)
+        self._subs.setdefault(job_id, set()).add(q)
+        if job_id not in self._producers:
+            self._producers[job_id] = asyncio.create_task(self._tail(job_id, since))
+        return q
+
+    def unsubscribe(self, job_id: str, q: asyncio.Queue[dict[str, Any]]) -> None:
+        subs = self._subs.get(job_id)
+        if subs is None:
+            return
+        subs.discard(q)
+        if not subs:
+            del self._subs[job_id]
+            task = self._producers.pop(job_id, None)
+            if task is not None:
+                task.cancel()
+
+    def watchers(self, job_id: str) -> int:
+        return len(self._subs.get(job_id, ()))
+
+    def publish(self, job_id: str, payload: dict[str, Any]) -> None:
+        """Loop thread only; drop-oldest when a subscriber falls behind."""
+        for q in self._subs.get(job_id, ()):
+            if q.full():
+                q.get_nowait()
+            q.put_nowait(payload)
+
+    def publish_threadsafe(self, payload: dict[str, Any]) -> None:
+        """From the LISTEN thread: hop onto the loop, only for watched jobs."""
+        job_id = str(payload.get("job_id") or "")
+        loop = self._loop
+        if loop is None or job_id not in self._subs or payload.get("type") not in RELAYED_EVENTS:
+            return
+        loop.call_soon_threadsafe(self.publish, job_id, payload)
+
+    async def close(self) -> None:
+        tasks = list(self._producers.values())
+        self._producers.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _end_streams(self, job_id: str, reason: str) -> None:
+        """Tell every watcher to close and forget them; a reconnect starts a fresh tail."""
+        self.publish(job_id, {"type": STREAM_CLOSED, "job_id": job_id, "reason": reason})
+        self._subs.pop(job_id, None)
+
+    async def _tail(self, job_id: str, since: int) -> None:
+        """One indexed delta query per tick for the whole audience of this job."""
+        try:
+            while True:
+                await asyncio.sleep(self.tail_s)
+                async with self._factory() as db:
+                    job: Job | None = await db.get(Job, job_id)
+                    if job is None:
+                        self._end_streams(job_id, "job_not_found")
+                        return
+                    # Watermark before rows: a concurrent write is re-sent, never lost.
+                    version = int(job.version or 0)
+                    rows = (
+                        await db.execute(
+                            select(JobItem.idx, JobItem.status)
+                            .where(JobItem.job_id == job_id, JobItem.version > since)
+                            .order_by(JobItem.idx.asc())
+                        )
+                    ).all()
+                    status, flow = job.status, job.flow_type
+                since = max(since, version)
+                for idx, item_status in rows:
+                    # RUNNING rows come from the worker's progress sink.
+                    evt: ItemStarted | ItemFinished = (
+                        ItemStarted(job_id=job_id, item_index=idx)
+                        if item_status in _ITEM_LIVE
+                        else ItemFinished(
+                            job_id=job_id, item_index=idx, status=ItemStatus(item_status)
+                        )
+                    )
+                    self.publish(job_id, event_payload(evt))
+                if status in TERMINAL:
+                    invalidate_job_summary(job_id)  # clients re-read counters on JobFinished
+                    evt_done = JobFinished(
+                        job_id=job_id, flow=FlowType(flow), status=JobStatus(status)
+                    )
+                    self.publish(job_id, event_payload(evt_done))
+                    return
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _logger.error("event_tail_failed", job_id=job_id, err=str(e))
+            self._end_streams(job_id, "tail_failed")
+        finally:
+            if self._producers.get(job_id) is asyncio.current_task():
+                del self._producers[job_id]
+
+
+def sse_frame(payload: dict[str, Any], event: str | None = None) -> bytes:
+    """One text/event-stream frame."""
+    name = event or str(payload.get("type") or "message")
+    return b"event: " + name.encode() + b"\ndata: " + orjson.dumps(payload) + b"\n\n"
+
+
+class BrokerSink(EventSink):
+    """Bus sink for jobs run inside the API process (tests, local runs)."""
+
+    name = "sse_broker"
+
+    def __init__(self, broker: JobEventBroker) -> None:
+        self._broker = broker
+
+    def handle(self, events: list[Any]) -> None:
+        for evt in events:
+            self._broker.publish_threadsafe(event_payload(evt))
+
+
+class _NotifyListener:
+    """Postgres LISTEN thread feeding worker-side events into the broker."""
+
+    def __init__(self, broker: JobEventBroker, db_url: str, timeout_s: float = 5.0) -> None:
+        self._broker = broker
+        self._dsn = (
+            make_url(db_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        )
+        self._timeout_s = timeout_s
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="events-listen", daemon=True)
+
+    def start(self) -> _NotifyListener:
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=self._timeout_s + 1)
+
+    def _run(self) -> None:
+        import psycopg
+
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(self._dsn, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {EVENTS_CHANNEL}")
+                    while not self._stop.is_set():
+                        for n in conn.notifies(timeout=self._timeout_s):
+                            self._broker.publish_threadsafe(orjson.loads(n.payload))
+            except Exception as e:
+                _logger.warning("events_listen_failed", err=str(e))
+                self._stop.wait(self._timeout_s)
+
+
+_BROKER: JobEventBroker | None = None
+_LISTENER: _NotifyListener | None = None
+_SINK: BrokerSink | None = None
+
+
+def get_event_broker() -> JobEventBroker | None:
+    return _BROKER
+
+
+def start_event_broker(
+    session_factory: Callable[[], AsyncSession], db_url: str | None, tail_s: float
+) -> JobEventBroker:
+    """API process only: broker + (Postgres) the NOTIFY listener."""
+    global _BROKER, _LISTENER, _SINK
+    if _BROKER is None:
+        _BROKER = JobEventBroker(session_factory, tail_s=tail_s)
+        _SINK = BrokerSink(_BROKER)
+        get_event_bus().add_sink(_SINK)
+        if db_url and make_url(db_url).get_backend_name() == "postgresql":
+            _LISTENER = _NotifyListener(_BROKER, db_url).start()
+        _logger.info("event_broker_started", tail_s=tail_s, listen=_LISTENER is not None)
+    return _BROKER
+
+
+async def stop_event_broker() -> None:
+    global _BROKER, _LISTENER, _SINK
+    broker, _BROKER = _BROKER, None
+    listener, _LISTENER = _LISTENER, None
+    sink, _SINK = _SINK, None
+    if sink is not None:
+        get_event_bus().remove_sink(sink)
+    if listener is not None:
+        listener.stop()
+    if broker is not None:
+        await broker.close()
@@ -0,0 +1,148 @@
+# root/service/app/exporters/export_cache.py
+"""On-disk export cache for finished jobs: build once, serve the file, revalidate by ETag."""
+# Why: a DONE/FAILED/CANCELLED job never changes, yet each download rebuilt the workbook.
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import structlog
+from sqlalchemy.orm import Session
+
+from ...db.models import Job
+from ..event_broker import TERMINAL
+from .job_excel import write_job_excel
+from .job_stream import EXPORT_VERSION, csv_chunks, jsonl_chunks
+
+_logger = structlog.get_logger(__name__)
+
+MEDIA_TYPES: dict[str, str] = {
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson",
+}
+
+_PRUNE_EVERY_S = 3600.0
+_prune_lock = threading.Lock()
+_last_prune = 0.0
+
+
+def export_root(settings: Any) -> Path:
+    return Path(getattr(settings, "reports_dir", "./var/reports")) / "exports"
+
+
+def export_key(job: Job, fmt: str) -> str | None:
+    """Content address of one export, or None while the job can still change.
+
+    job.version rides along with finished_at: a cancelled job has no finished_at,
+    and a worker killed mid-flush may still land a last batch after the cancel.
+    """
+    if str(job.status) not in TERMINAL:
+        return None
+    finished = job.finished_at.isoformat() if job.finished_at is not None else "-"
+    basis = f"{job.id}|{finished}|{job.version}|{EXPORT_VERSION}|{fmt}"
+    return hashlib.sha256(basis.encode()).hexdigest()[:32]
+
+
+def write_export(db: Session, job: Job, fmt: str, path: Path) -> None:
+    """Build one export file at `path` (rows streamed from the DB)."""
+    if fmt == "xlsx":
+        write_job_excel(db, job, path)
+        return
+    chunks = csv_chunks if fmt == "csv" else jsonl_chunks
+    with path.open("wb") as fh:
+        for chunk in chunks(db, job.id):
+            fh.write(chunk)
+
+
+def cached_export(db: Session, job: Job, fmt: str, root: Path) -> Path:
+    """Path of the cached file, building it on a miss (finished jobs only)."""
+    key = export_key(job, fmt)
+    if key is None:
+        raise ValueError("job_not_final")
+    path = root / job.id / f"{key}.{fmt}"
+    with contextlib.suppress(FileNotFoundError):  # a miss, or pruned meanwhile: (re)build
+        os.utime(path)  # a hit restarts the TTL, so a pruner never deletes a file being served
+        return path
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique temp name + atomic rename: concurrent builders never serve a half file.
+    tmp = path.with_name(f".{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+    started = time.perf_counter()
+    try:
+        write_export(db, job, fmt, tmp)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+    for old in path.parent.glob(f"*.{fmt}"):  # superseded keys (new version/exporter)
+        if old != path:
+            old.unlink(missing_ok=True)
+    _logger.info(
+        "export_cached",
+        job_id=job.id,
+        fmt=fmt,
+        bytes=path.stat().st_size,
+        ms=int((time.perf_counter() - started) * 1000),
+    )
+    return path
+
+
+def prune_exports(root: Path, ttl_days: int) -> int:
+    """Delete cache files not built or served for ttl_days; ttl <= 0 keeps all."""
+    if ttl_days <= 0 or not root.is_dir():
+        return 0
+    cutoff = time.time() - ttl_days * 86400
+    removed = 0
+    for job_dir in root.iterdir():
+        if not job_dir.is_dir():
+            continue
+        for f in job_dir.iterdir():
+            try:
+                if f.stat().st_mtime < cutoff:
+                    f.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue  # raced with another pruner/builder
+        with contextlib.suppress(OSError):
+            job_dir.rmdir()  # only succeeds when empty
+    if removed:
+        _logger.info("exports_pruned", removed=removed, ttl_days=ttl_days)
+    return removed
+
+
+def maybe_prune_exports(settings: Any) -> None:
+    """prune_exports at most once per hour per process; call before a cache lookup."""
+    global _last_prune
+    now = time.monotonic()
+    with _prune_lock:
+        if _last_prune and now - _last_prune < _PRUNE_EVERY_S:
+            return
+        _last_prune = now
+    prune_exports(export_root(settings), int(getattr(settings, "artifacts_ttl_days", 7)))
+
+
+def prebuild_formats(settings: Any) -> list[str]:
+    raw = str(getattr(settings, "export_prebuild", "") or "")
+    return [f for f in (p.strip().lower() for p in raw.split(",")) if f in MEDIA_TYPES]
+
+
+def prebuild_exports(db: Session, job_id: str, formats: Iterable[str], settings: Any) -> None:
+    """Warm the cache right after a job finishes so the first download is a file send."""
+    job = db.get(Job, job_id)
+    if job is None or str(job.status) not in TERMINAL:
+        return
+    maybe_prune_exports(settings)
+    root = export_root(settings)
+    for fmt in formats:
+        try:
+            cached_export(db, job, fmt, root)
+        except Exception as e:  # a failed warm-up only costs the first download
+            _logger.warning("export_prebuild_failed", job_id=job_id, fmt=fmt, err=str(e))
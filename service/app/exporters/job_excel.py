@@ -5,8 +5,9 @@
 from __future__ import annotations
 
 import io
-from collections.abc import Mapping, Sequence
-from typing import Any, cast
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
 
 import xlsxwriter
 from sqlalchemy.orm import Session
@@ -15,7 +16,7 @@ from ...db.models import Job, JobItem
 from ..utils.jinja_filters import format_tz
 from ..utils.job_rows import build_rows_for_items
 from ..utils.nested_numbering import render_numbered_text
-from ..utils.table_shape import build_table
+from .job_stream import iter_shaped_rows, plan_rows, shape_export_row
 
 
 def _cell_to_excel_value(value: Any) -> Any:
@@ -40,23 +41,28 @@ def _cell_to_excel_value(value: Any) -> Any:
     return str(value)
 
 
-def build_job_excel_bytes(job: Job, items: list[JobItem]) -> bytes:
-    """Render one .xlsx file for a job using dynamic columns."""
-    rows = build_rows_for_items(items)
-    columns, shaped = build_table(rows)
-
+def _write_items_sheet(
+    workbook: xlsxwriter.Workbook,
+    job: Job,
+    columns: list[str],
+    rows: Iterable[dict[str, Any]],
+) -> None:
+    """Meta row, header, then rows strictly top-down (constant_memory flushes each row)."""
     if not columns:
         # Fallback for empty jobs; keep a minimal shape.
         columns = ["status", "timings"]
 
-    buffer = io.BytesIO()
-    workbook = xlsxwriter.Workbook(buffer, {"in_memory": True})
     worksheet = workbook.add_worksheet("items")
 
     meta_fmt = workbook.add_format({"italic": True})
     header_fmt = workbook.add_format({"bold": True, "text_wrap": True, "border": 1})
     cell_fmt = workbook.add_format({"text_wrap": True, "border": 1})
 
+    # Simple column sizing for readability at a glance.
+    for col_idx, name in enumerate(columns):
+        width = max(len(str(name)), 12) + 4
+        worksheet.set_column(col_idx, col_idx, width)
+
     # Row 0: job meta, using the same timezone rules as the UI.
     created_at = getattr(job, "created_at", None)
     finished_at = getattr(job, "finished_at", None)
@@ -78,43 +84,48 @@ def build_job_excel_bytes(job: Job, items: list[JobItem]) -> bytes:
         worksheet.write(1, col_idx, name, header_fmt)
 
     # Row 2+: data rows shaped by the same rules as the UI.
-    for row_idx, row in enumerate(shaped, start=2):
+    last_row_idx = 1
+    for last_row_idx, row in enumerate(rows, start=2):
         for col_idx, name in enumerate(columns):
             worksheet.write(
-                row_idx,
+                last_row_idx,
                 col_idx,
                 _cell_to_excel_value(row.get(name)),
                 cell_fmt,
             )
 
-    # Add table styling on top of header + data.
-    last_row_idx = 1 + len(shaped)
-    worksheet.add_table(
-        1,
-        0,
-        last_row_idx,
-        last_col_idx,
-        {"columns": [{"header": col} for col in columns]},
-    )
+    # Filter + frozen header instead of add_table (not available in constant_memory).
+    worksheet.autofilter(1, 0, last_row_idx, last_col_idx)
+    worksheet.freeze_panes(2, 0)
 
-    # Simple column sizing for readability at a glance.
-    for col_idx, name in enumerate(columns):
-        width = max(len(str(name)), 12) + 4
-        worksheet.set_column(col_idx, col_idx, width)
 
+def build_job_excel_bytes(job: Job, items: list[JobItem]) -> bytes:
+    """Render one .xlsx file for a job in memory (small jobs, tests)."""
+    rows = build_rows_for_items(items)
+    plan = plan_rows(rows)
+
+    buffer = io.BytesIO()
+    workbook = xlsxwriter.Workbook(buffer, {"in_memory": True})
+    _write_items_sheet(
+        workbook,
+        job,
+        plan.columns,
+        (shape_export_row(r, plan) for r in rows),
+    )
     workbook.close()
-    buffer.seek(0)
     return buffer.getvalue()
 
 
-def build_job_excel_from_db(db: Session, job_id: str) -> tuple[Job, bytes]:
-    """Load one job and its items, then build Excel bytes."""
-    job: Job | None = db.get(Job, job_id)
-    if job is None:
-        raise ValueError("job_not_found")
+def write_job_excel(db: Session, job: Job, path: str | Path) -> None:
+    """Stream a job's items into an .xlsx at `path`.
 
-    raw_items = db.query(JobItem).filter(JobItem.job_id == job_id).order_by(JobItem.idx.asc()).all()
-    items = cast(list[JobItem], cast(object, raw_items))
-
-    content = build_job_excel_bytes(job, items)
-    return job, content
+    Rows come from the DB in batches and xlsxwriter's constant_memory mode
+    flushes each finished row to a temp file, so memory stays flat in job size.
+    """
+    path = Path(path)
+    plan, rows = iter_shaped_rows(db, job.id)
+    workbook = xlsxwriter.Workbook(str(path), {"constant_memory": True, "tmpdir": str(path.parent)})
+    try:
+        _write_items_sheet(workbook, job, plan.columns, rows)
+    finally:
+        workbook.close()
@@ -17,16 +17,21 @@ from starlette.middleware.trustedhost import TrustedHostMiddleware
 from starlette.staticfiles import StaticFiles
 
 from ..constants.api import API_TITLE, API_V1_PREFIX, API_VERSION
+from ..db.session import get_async_session_factory
+from ..executor.dispatcher import start_dispatcher, stop_dispatcher
+from ..executor.pool import start_worker_pool, stop_worker_pool
 from ..executor.scheduler import reconcile_stale_jobs, schedule_jobs
 from .api.v1 import api_v1
 from .deps import (
     close_db,
     get_session_factory,
     get_settings,
+    init_async_db,
     init_db,
     init_jinja_filters,
     init_logging,
 )
+from .event_broker import start_event_broker, stop_event_broker
 from .views import pages as pages_views, partials as partials_views
 
 s = get_settings()
@@ -39,6 +44,16 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     init_jinja_filters()
     # app.state.db = await init_db() # type: ignore[attr-defined]
     await init_db()
+    init_async_db()
+    async_factory = get_async_session_factory()
+    if async_factory is not None:
+        # Tail at the result flush cadence: finished rows cannot appear any faster.
+        tail_s = getattr(s, "result_flush_ms", 1000) / 1000
+        start_event_broker(async_factory, getattr(s, "db_url", None), tail_s)
+
+    # Warm workers must exist before the first schedule pass dispatches to them.
+    if getattr(s, "executor_mode", "spawn") == "pool":
+        start_worker_pool(int(s.executor_max_workers))
 
     # Reconcile stale RUNNING jobs from previous crash.
     factory = get_session_factory()
@@ -46,7 +61,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         db = factory()
         try:
             reconcile_stale_jobs(db)
-            schedule_jobs(db)
+            if not getattr(s, "executor_dispatcher", False):
+                schedule_jobs(db)
         except Exception:
             import structlog
 
@@ -54,7 +70,14 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         finally:
             db.close()
 
+    # Dispatcher's first pass replaces the inline startup schedule.
+    if factory is not None and getattr(s, "executor_dispatcher", False):
+        start_dispatcher(factory)
+
     yield
+    await stop_event_broker()
+    stop_dispatcher()
+    stop_worker_pool()
     await close_db()
 
 
@@ -0,0 +1,61 @@
+# root/service/app/utils/http_cache.py
+"""Conditional GET helpers: ETags from Job.version, If-None-Match/If-Modified-Since checks."""
+# Why: pollers re-fetch unchanged jobs all day; a 304 costs one Job row instead of every item.
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+from fastapi import Request
+from starlette.responses import Response
+
+from service.db.models import Job
+
+# Clients may keep the body but must ask before reusing it.
+REVALIDATE = "private, no-cache"
+
+
+def job_etag(job: Job, kind: str) -> str:
+    """Weak ETag for one view of a job: every item/status write bumps Job.version.
+
+    Weak because it names a state, not bytes (JSON/HTML rendering may differ).
+    """
+    return f'W/"{kind}-{job.id}-{int(job.version or 0)}"'
+
+
+def _opaque(tag: str) -> str:
+    return tag.strip().removeprefix("W/")
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison (RFC 9110 13.1.2) against If-None-Match; "*" matches anything."""
+    inm = request.headers.get("if-none-match")
+    if not inm:
+        return False
+    tags = {_opaque(t) for t in inm.split(",")}
+    return "*" in tags or _opaque(etag) in tags
+
+
+def not_modified(request: Request, etag: str, last_modified: datetime | None = None) -> bool:
+    """If-None-Match wins; If-Modified-Since only when no ETag was sent."""
+    if request.headers.get("if-none-match") is not None:
+        return etag_matches(request, etag)
+    ims = request.headers.get("if-modified-since")
+    if not ims or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(ims)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def revalidate_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": REVALIDATE}
+
+
+def not_modified_response(etag: str, **extra: str) -> Response:
+    return Response(status_code=304, headers={**revalidate_headers(etag), **extra})
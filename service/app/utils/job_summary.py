@@ -0,0 +1,70 @@
+# root/service/app/utils/job_summary.py
+"""Per-job status summary (one GROUP BY), cached per process."""
+# Why: job pages and pollers read counters constantly; finished jobs never change.
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from engine.core.constants.statuses import ItemStatus, JobStatus
+from service.db.models import Job
+from service.db.repo import count_items_by_status
+
+from ..deps import get_settings
+
+_TERMINAL = {str(JobStatus.DONE), str(JobStatus.FAILED), str(JobStatus.CANCELLED)}
+_MAX_ENTRIES = 1024
+
+# job_id -> (expires_at monotonic | None for terminal jobs, summary)
+_cache: OrderedDict[str, tuple[float | None, dict[str, Any]]] = OrderedDict()
+
+
+def _build(job: Job, by_status: dict[str, int]) -> dict[str, Any]:
+    counts = {str(st).lower(): by_status.get(str(st), 0) for st in ItemStatus}
+    return {
+        "id": str(job.id),
+        "flow_type": job.flow_type,
+        "status": job.status,
+        "created_at": job.created_at,
+        "finished_at": job.finished_at,
+        "total": sum(by_status.values()),
+        "counts": counts,
+    }
+
+
+async def get_job_summary(db: AsyncSession, job_id: str) -> dict[str, Any] | None:
+    """Cached summary or None if the job does not exist; callers must not mutate it."""
+    now = time.monotonic()
+    hit = _cache.get(job_id)
+    if hit is not None and (hit[0] is None or hit[0] > now):
+        _cache.move_to_end(job_id)
+        return hit[1]
+
+    job: Job | None = await db.get(Job, job_id)
+    if job is None:
+        return None
+    summary = _build(job, await count_items_by_status(db, job_id))
+
+    ttl_s = int(getattr(get_settings(), "job_summary_cache_ms", 1000)) / 1000
+    if job.status in _TERMINAL:
+        _cache[job_id] = (None, summary)
+    elif ttl_s > 0:
+        _cache[job_id] = (now + ttl_s, summary)
+    else:
+        return summary
+    _cache.move_to_end(job_id)
+    while len(_cache) > _MAX_ENTRIES:
+        _cache.popitem(last=False)
+    return summary
+
+
+def invalidate_job_summary(job_id: str | None = None) -> None:
+    """Drop one job (after a write from this process) or everything (tests)."""
+    if job_id is None:
+        _cache.clear()
+    else:
+        _cache.pop(job_id, None)
@@ -27,12 +27,41 @@ def _any_failed_or_cancelled(rows: list[dict[str, Any]]) -> bool:
     return any(r.get("status") in ("FAILED", "CANCELLED") for r in rows)
 
 
+def timings_view(t: Any) -> dict[str, Any] | None:
+    """Total first, then steps in run order; "login.submit" nests under "login".
+
+    A step that has sub-steps shows its own time as that node's "total".
+    """
+    if not isinstance(t, dict):
+        return None
+    view: dict[str, Any] = {"total": _secs(t.get("total"))}
+    for key, val in t.items():
+        if key == "total":
+            continue
+        *parents, leaf = str(key).split(".")
+        node = view
+        for part in parents:
+            child = node.get(part)
+            if not isinstance(child, dict):
+                child = {} if child is None else {"total": child}
+                node[part] = child
+            node = child
+        if isinstance(node.get(leaf), dict):
+            node[leaf]["total"] = _secs(val)
+        else:
+            node[leaf] = _secs(val)
+    return view
+
+
+def _secs(v: Any) -> Any:
+    return round(v, 3) if isinstance(v, float) else v
+
+
 def _shape_row(r: dict[str, Any], domain_keys: list[str]) -> dict[str, Any]:
     out: dict[str, Any] = {
         "status": r.get("status"),
     }
-    t = r.get("timings") or {}
-    out["timings"] = {"total": (t or {}).get("total")} if isinstance(t, dict) else None
+    out["timings"] = timings_view(r.get("timings") or {})
 
     # optional diagnostics
     out["retry_count"] = r.get("retry_count")
@@ -50,15 +79,62 @@ def _shape_row(r: dict[str, Any], domain_keys: list[str]) -> dict[str, Any]:
     return out
 
 
+class ColumnPlan:
+    """build_table's column rules fed one idx-ordered row at a time (streamed exports)."""
+
+    def __init__(self) -> None:
+        self._seen = 0
+        self._domain: set[str] = set()
+        self._diagnostics = False
+        self._asserted = False
+
+    def observe(self, r: dict[str, Any]) -> None:
+        if self._seen < 20:  # domain keys come from the first rows only
+            self._domain.update(_collect_domain_keys([r]))
+        self._seen += 1
+        self._diagnostics = self._diagnostics or _any_failed_or_cancelled([r])
+        self._asserted = self._asserted or _has_asserted([r])
+
+    @property
+    def domain(self) -> list[str]:
+        return sorted(self._domain)
+
+    def columns(self) -> list[str]:
+        cols: list[str] = list(_BASE_ORDER)
+        # show diagnostics only when needed
+        if self._diagnostics:
+            cols.extend(["retry_count", "error_code", "error_message"])
+        cols.extend(self.domain)
+        if self._asserted:
+            cols.append("asserted")
+        return cols
+
+
 def build_table(rows: list[dict[str, Any]]) -> tuple[list[str], list[dict[str, Any]]]:
-    domain = _collect_domain_keys(rows)
-    shaped = [_shape_row(r, domain) for r in rows]
-
-    cols: list[str] = list(_BASE_ORDER)
-    # show diagnostics only when needed
-    if _any_failed_or_cancelled(rows):
-        cols.extend(["retry_count", "error_code", "error_message"])
-    cols.extend(domain)
-    if _has_asserted(rows):
-        cols.append("asserted")
-    return cols, shaped
+    plan = ColumnPlan()
+    for r in rows:
+        plan.observe(r)
+    domain = plan.domain
+    return plan.columns(), [_shape_row(r, domain) for r in rows]
+
+
+def columns_cover(columns: list[str], rows: list[dict[str, Any]]) -> bool:
+    """True if a table rendered with `columns` can show these (changed) rows as-is.
+
+    Mirrors build_table on the full idx-ordered list: diagnostics/asserted appear
+    as soon as any row needs them; domain keys only come from idx < 20.
+    """
+    have = set(columns)
+    if _any_failed_or_cancelled(rows) and "error_code" not in have:
+        return False
+    if _has_asserted(rows) and "asserted" not in have:
+        return False
+    head = [r for r in rows if int(r.get("idx") or 0) < 20]
+    return set(_collect_domain_keys(head)) <= have
+
+
+def shape_rows(columns: list[str], rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Shape rows for an already-rendered table (delta refresh keeps its columns)."""
+    fixed = {*_BASE_ORDER, "retry_count", "error_code", "error_message", "asserted"}
+    domain = [c for c in columns if c not in fixed]
+    return [_shape_row(r, domain) for r in rows]
@@ -8,13 +8,14 @@ import os
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import Response
 
-from ...db.models import Job, JobItem
-from ..deps import get_db, get_settings, templates
+from ...db.models import Job
+from ..deps import get_async_db, get_settings, templates
 from ..registry.bdd_map import BDD_ENTRIES
 from ..registry.form_registry import get_flow_by_slug
+from ..utils.job_summary import get_job_summary
 
 router = APIRouter()
 
@@ -64,21 +65,19 @@ def flow_host(
 
 
 @router.get("/jobs/{job_id}")
-def job_detail(
+async def job_detail(
     request: Request,
     job_id: str,
     s: Annotated[Any, Depends(get_settings)],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Response:
-    job: Job | None = db.get(Job, job_id)
+    job: Job | None = await db.get(Job, job_id)
     if not job:
         raise HTTPException(404, "job_not_found")
 
-    # Counters
-    qs = db.query(JobItem).filter(JobItem.job_id == job_id)
-    cnt_done = qs.filter(JobItem.status == "DONE").count()
-    cnt_failed = qs.filter(JobItem.status == "FAILED").count()
-    cnt_cancelled = qs.filter(JobItem.status == "CANCELLED").count()
+    # Counters: one cached GROUP BY instead of a COUNT per status.
+    summary = await get_job_summary(db, job_id) or {"counts": {}}
+    counts = summary["counts"]
 
     poll_ms = int(os.getenv("AUTOSUITE_UI_POLL_MS", str(s.ui_poll_ms)))
     return templates.TemplateResponse(
@@ -87,7 +86,11 @@ def job_detail(
             "request": request,
             "job": job,
             "poll_ms": poll_ms,
-            "counts": {"done": cnt_done, "failed": cnt_failed, "cancelled": cnt_cancelled},
+            "counts": {
+                "done": counts.get("done", 0),
+                "failed": counts.get("failed", 0),
+                "cancelled": counts.get("cancelled", 0),
+            },
         },
     )
 
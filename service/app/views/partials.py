@@ -6,44 +6,118 @@
 
 from __future__ import annotations
 
-from typing import cast
+from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import Response
 
+from engine.core.constants.statuses import JobStatus
+
 from ...db.models import Job, JobItem
-from ..deps import get_db, require_api_key, templates
+from ..deps import get_async_db, get_settings, require_api_key, templates
+from ..utils.http_cache import job_etag, not_modified, not_modified_response, revalidate_headers
 from ..utils.job_rows import build_rows_for_items
-from ..utils.table_shape import build_table
+from ..utils.table_shape import build_table, columns_cover, shape_rows
 
 router = APIRouter(dependencies=[Depends(require_api_key)])
 
+_LIVE = (str(JobStatus.PENDING), str(JobStatus.RUNNING))
 
-@router.get("/jobs/{job_id}/items")
-def job_items_tbody(
-    request: Request,
-    job_id: str,
-    db: Session = Depends(get_db),
-) -> Response:
-    job: Job | None = db.get(Job, job_id)
-    if not job:
-        raise HTTPException(404, "job_not_found")
 
-    # Fetch items rows as dicts.
-    q = db.query(JobItem).filter(JobItem.job_id == job_id).order_by(JobItem.id.asc())
-    raw_items = q.all()
-    items = cast(list[JobItem], cast(object, raw_items))
+def _poller_ctx(job: Job, version: int, columns: list[str]) -> dict[str, Any]:
+    """State the delta poller echoes back: watermark + the columns on screen."""
+    return {
+        "live": job.status in _LIVE,
+        "version": version,
+        "cols": ",".join(columns),
+        "poll_ms": int(getattr(get_settings(), "ui_poll_ms", 5000)),
+    }
+
+
+async def _full_table(request: Request, db: AsyncSession, job: Job, *, delta: bool) -> Response:
+    # Read the watermark before the rows: a concurrent write can only be re-sent, never lost.
+    version = int(job.version or 0)
+    q = select(JobItem).where(JobItem.job_id == job.id).order_by(JobItem.idx.asc())
+    items = list((await db.execute(q)).scalars().all())
 
     rows = build_rows_for_items(items)
     columns, shaped = build_table(rows)
 
     return templates.TemplateResponse(
-        "components/items_table.html",
+        "components/items_delta.html" if delta else "components/items_table.html",
         {
             "request": request,
             "columns": columns,
-            "rows": shaped,
+            "rows": list(zip([r["idx"] for r in rows], shaped, strict=True)),
             "job": job,
+            "poller": _poller_ctx(job, version, columns),
+            "full": True,
         },
     )
+
+
+@router.get("/jobs/{job_id}/items")
+async def job_items_tbody(
+    request: Request,
+    job_id: str,
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    job: Job | None = await db.get(Job, job_id)
+    if not job:
+        raise HTTPException(404, "job_not_found")
+    etag = job_etag(job, "table")
+    if not_modified(request, etag):
+        return not_modified_response(etag)
+    resp = await _full_table(request, db, job, delta=False)
+    resp.headers.update(revalidate_headers(etag))
+    return resp
+
+
+@router.get("/jobs/{job_id}/items/delta")
+async def job_items_delta(
+    request: Request,
+    job_id: str,
+    since: int = Query(0, ge=0),
+    cols: str = "",
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """Rows written after `since` as out-of-band <tr> swaps, plus the next poller.
+
+    Falls back to an out-of-band full table when a changed row needs a column
+    the page does not have yet (first failure, new output keys, ...).
+    The body depends only on the URL (since/cols) and Job.version, so an idle
+    poll revalidates to a 304 and the browser replays its cached poller.
+    """
+    job: Job | None = await db.get(Job, job_id)
+    if not job:
+        raise HTTPException(404, "job_not_found")
+    etag = job_etag(job, "delta")
+    if not_modified(request, etag):
+        return not_modified_response(etag)
+
+    version = int(job.version or 0)
+    q = (
+        select(JobItem)
+        .where(JobItem.job_id == job_id, JobItem.version > since)
+        .order_by(JobItem.idx.asc())
+    )
+    rows = build_rows_for_items((await db.execute(q)).scalars().all())
+    columns = [c for c in cols.split(",") if c]
+
+    if not columns_cover(columns, rows):
+        resp = await _full_table(request, db, job, delta=True)
+    else:
+        resp = templates.TemplateResponse(
+            "components/items_delta.html",
+            {
+                "request": request,
+                "columns": columns,
+                "rows": list(zip([r["idx"] for r in rows], shape_rows(columns, rows), strict=True)),
+                "job": job,
+                "poller": _poller_ctx(job, version, columns),
+            },
+        )
+    resp.headers.update(revalidate_headers(etag))
+    return resp
@@ -0,0 +1,69 @@
+# root/service/db/migrations.py
+"""Idempotent startup migrations that create_all cannot express."""
+# Why: no Alembic yet; keep existing deployments in step with the models.
+
+from __future__ import annotations
+
+import structlog
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+from .models import Base
+from .types import JSONFlex
+
+_logger = structlog.get_logger(__name__)
+
+
+def ensure_columns(engine: Engine) -> None:
+    """Add model columns missing on existing tables (they must carry a server_default)."""
+    insp = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            present = {c["name"] for c in insp.get_columns(table.name)}
+            for col in table.columns:
+                if col.name in present or col.server_default is None:
+                    continue
+                ddl_type = col.type.compile(dialect=engine.dialect)
+                default = col.server_default.arg  # type: ignore[attr-defined]
+                conn.execute(
+                    text(
+                        f'ALTER TABLE "{table.name}" ADD COLUMN "{col.name}" '  # noqa: S608
+                        f"{ddl_type} NOT NULL DEFAULT {default}"
+                    )
+                )
+                _logger.info("added_column", table=table.name, column=col.name)
+
+
+def ensure_indexes(engine: Engine) -> None:
+    """Create model indexes missing on tables that predate them (create_all skips them)."""
+    insp = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            present = {ix["name"] for ix in insp.get_indexes(table.name)}
+            for index in sorted(table.indexes, key=lambda ix: str(ix.name)):
+                if index.name in present:
+                    continue
+                index.create(conn)
+                _logger.info("created_index", table=table.name, index=index.name)
+
+
+def ensure_jsonb_columns(engine: Engine) -> None:
+    """Postgres: convert JSONFlex columns created as TEXT (pre-JSONB) in place."""
+    if engine.dialect.name != "postgresql":
+        return
+    insp = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {c["name"]: c["type"] for c in insp.get_columns(table.name)}
+            for col in table.columns:
+                if not isinstance(col.type, JSONFlex) or col.name not in existing:
+                    continue
+                if existing[col.name].__class__.__name__.upper() == "JSONB":
+                    continue
+                conn.execute(
+                    text(
+                        f'ALTER TABLE "{table.name}" ALTER COLUMN "{col.name}" '  # noqa: S608
+                        f'TYPE JSONB USING "{col.name}"::jsonb'
+                    )
+                )
+                _logger.info("migrated_column_to_jsonb", table=table.name, column=col.name)
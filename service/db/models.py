@@ -7,7 +7,7 @@ from __future__ import annotations
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from .types import JSONFlex
@@ -19,6 +19,12 @@ class Base(DeclarativeBase):
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Keyset pagination (history / list_jobs) walks this newest-first.
+        Index("ix_jobs_created_at_id", "created_at", "id"),
+        # Scheduler: FIFO pick of PENDING jobs and RUNNING slot count.
+        Index("ix_jobs_status_created_at", "status", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     flow_type: Mapped[str] = mapped_column(String, index=True)
@@ -28,6 +34,8 @@ class Job(Base):
     count_done: Mapped[int] = mapped_column(Integer, default=0)
     count_failed: Mapped[int] = mapped_column(Integer, default=0)
     count_cancelled: Mapped[int] = mapped_column(Integer, default=0)
+    # Bumped on every item write; items carry the value they were written at.
+    version: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -42,6 +50,14 @@ class Job(Base):
 
 class JobItem(Base):
     __tablename__ = "job_items"
+    __table_args__ = (
+        # Item loads/exports/partials: WHERE job_id = ? ORDER BY idx.
+        Index("ix_job_items_job_id_idx", "job_id", "idx"),
+        # Per-job status counters: WHERE job_id = ? [AND status = ?] / GROUP BY status.
+        Index("ix_job_items_job_id_status", "job_id", "status"),
+        # Delta refresh: WHERE job_id = ? AND version > ?.
+        Index("ix_job_items_job_id_version", "job_id", "version"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     job_id: Mapped[str] = mapped_column(
@@ -55,10 +71,13 @@ class JobItem(Base):
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     input: Mapped[dict | None] = mapped_column(JSONFlex, nullable=True)
-    output: Mapped[dict | None] = mapped_column(JSONFlex, nullable=True)
+    # Meta-tag maps / page snapshots get big: packed past the threshold (SQLite).
+    output: Mapped[dict | None] = mapped_column(JSONFlex(compress=True), nullable=True)
     timings: Mapped[dict | None] = mapped_column(JSONFlex, nullable=True)
 
-    extras: Mapped[dict | None] = mapped_column(JSONFlex, nullable=True)
+    extras: Mapped[dict | None] = mapped_column(JSONFlex(compress=True), nullable=True)
+    # Job.version at the time this row last changed (0 = untouched since create).
+    version: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -2,4 +2,145 @@
 """Thin repository helpers for jobs and items."""
 # Why: keep routers short; real logic stays in engine.
 
-# from __future__ import annotations
+from __future__ import annotations
+
+import base64
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+import orjson
+from sqlalchemy import Select, desc, func, literal, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .models import Job, JobItem
+
+
+def encode_cursor(created_at: datetime, job_id: str) -> str:
+    """Opaque keyset cursor for (created_at, id) DESC ordering."""
+    raw = orjson.dumps([created_at.isoformat(), job_id])
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Inverse of encode_cursor; ValueError on anything malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, job_id = orjson.loads(raw)
+        return datetime.fromisoformat(created_at), str(job_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("invalid_cursor") from exc
+
+
+def jobs_page_stmt(
+    limit: int,
+    cursor: str | None = None,
+    status: str | None = None,
+    flow_type: str | None = None,
+) -> Select[tuple[Job]]:
+    """Keyset SELECT for one page (+1 probe row); ValueError on a bad cursor."""
+    stmt = select(Job).order_by(desc(Job.created_at), desc(Job.id))
+    if status:
+        stmt = stmt.where(Job.status == status)
+    if flow_type:
+        stmt = stmt.where(Job.flow_type == flow_type)
+    if cursor:
+        created_at, job_id = decode_cursor(cursor)
+        after = tuple_(literal(created_at, Job.created_at.type), literal(job_id, Job.id.type))
+        stmt = stmt.where(tuple_(Job.created_at, Job.id) < after)
+    return stmt.limit(limit + 1)
+
+
+async def page_jobs(
+    db: AsyncSession,
+    *,
+    limit: int,
+    cursor: str | None = None,
+    status: str | None = None,
+    flow_type: str | None = None,
+) -> tuple[Sequence[Job], str | None]:
+    """Newest-first page of jobs after `cursor`; returns (rows, next_cursor).
+
+    Keyset on (created_at, id) walks ix_jobs_created_at_id, so page N costs the
+    same as page 1 and rows do not shift when new jobs arrive.
+    """
+    stmt = jobs_page_stmt(limit, cursor, status, flow_type)
+    rows = (await db.execute(stmt)).scalars().all()
+    if len(rows) <= limit:
+        return rows, None
+    last = rows[limit - 1]
+    return rows[:limit], encode_cursor(last.created_at, last.id)
+
+
+def items_page_stmt(
+    job_id: str,
+    columns: Sequence[str],
+    *,
+    statuses: Sequence[str] = (),
+    limit: int | None = None,
+    after_idx: int | None = None,
+) -> Select[Any]:
+    """Column-projected SELECT of one job's items in idx order (+1 probe row when paged).
+
+    Only `columns` are read, so unselected JSON blobs are never fetched or decoded.
+    """
+    names = list(columns) if "idx" in columns else ["idx", *columns]  # idx: order + cursor
+    stmt = select(*(getattr(JobItem, c) for c in names)).where(JobItem.job_id == job_id)
+    if statuses:
+        stmt = stmt.where(JobItem.status.in_(statuses))
+    if after_idx is not None:
+        stmt = stmt.where(JobItem.idx > after_idx)
+    stmt = stmt.order_by(JobItem.idx.asc())
+    return stmt if limit is None else stmt.limit(limit + 1)
+
+
+async def page_items(
+    db: AsyncSession,
+    job_id: str,
+    columns: Sequence[str],
+    *,
+    statuses: Sequence[str] = (),
+    limit: int | None = None,
+    after_idx: int | None = None,
+) -> tuple[list[dict[str, Any]], int | None]:
+    """Items after `after_idx` as {column: value}; returns (rows, next_after_idx).
+
+    Keyset on idx walks ix_job_items_job_id_idx (job_id = ? AND idx > ?), so a
+    late page costs what the first one does.
+    """
+    stmt = items_page_stmt(job_id, columns, statuses=statuses, limit=limit, after_idx=after_idx)
+    rows = [dict(r._mapping) for r in (await db.execute(stmt)).all()]
+    if limit is None or len(rows) <= limit:
+        return rows, None
+    return rows[:limit], int(rows[limit - 1]["idx"])
+
+
+def items_by_status_stmt(job_id: str) -> Select[Any]:
+    """(status, n) rows for one job in a single GROUP BY (covered by ix_job_items_job_id_status)."""
+    return (
+        select(JobItem.status, func.count())
+        .where(JobItem.job_id == job_id)
+        .group_by(JobItem.status)
+    )
+
+
+async def count_items_by_status(db: AsyncSession, job_id: str) -> dict[str, int]:
+    """{status: n} for one job."""
+    rows = (await db.execute(items_by_status_stmt(job_id))).all()
+    return {str(status): int(n) for status, n in rows}
+
+
+def bump_job_version(db: Session, job_id: str, **values: object) -> int:
+    """Increment Job.version (plus any extra column values); return the new version.
+
+    Callers stamp the rows they write in the same transaction with it. The job
+    row stays locked until commit, so versions are handed out in commit order.
+    Every item or status write goes through a bump, so the version doubles as the
+    job's ETag (a 304 never hides a change).
+    """
+    stmt = update(Job).where(Job.id == job_id).values(version=Job.version + 1, **values)
+    if db.get_bind().dialect.update_returning:
+        return int(db.execute(stmt.returning(Job.version)).scalar_one_or_none() or 0)
+    db.execute(stmt)
+    return int(db.scalar(select(Job.version).where(Job.id == job_id)) or 0)
@@ -1,3 +1,78 @@
 # root/service/db/session.py
-"""(Reserved) If we switch to async engine later, it will live here."""
+"""Async engine/session for read-heavy routes (aiosqlite / asyncpg)."""
 # Why: keep a single place to upgrade DB stack without touching routers.
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import structlog
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from .types import json_dumps, json_loads
+
+_logger = structlog.get_logger(__name__)
+
+# Sync driver -> async driver for the same database.
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+# Native JSON/JSONB columns (Postgres) encode/decode through orjson too.
+JSON_ENGINE_KWARGS = {"json_serializer": json_dumps, "json_deserializer": json_loads}
+
+_ASYNC_ENGINE: AsyncEngine | None = None
+_AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
+
+
+def to_async_url(db_url: str) -> str:
+    """Map AUTOSUITE_DB_URL to its async twin; async drivers pass through."""
+    url = make_url(db_url)
+    if url.drivername in ("sqlite+aiosqlite", "postgresql+asyncpg", "postgresql+psycopg"):
+        return url.render_as_string(hide_password=False)
+    driver = _ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"no async driver for {url.drivername}")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def init_async_engine(db_url: str, echo: bool = False) -> None:
+    """Create the async engine + session factory once (API process only)."""
+    global _ASYNC_ENGINE, _AsyncSessionLocal
+    if _ASYNC_ENGINE is not None:
+        return
+    _ASYNC_ENGINE = create_async_engine(
+        to_async_url(db_url), echo=echo, pool_pre_ping=True, **JSON_ENGINE_KWARGS
+    )
+    _AsyncSessionLocal = async_sessionmaker(
+        bind=_ASYNC_ENGINE, expire_on_commit=False, autoflush=False
+    )
+    _logger.info("async_db_ready", driver=_ASYNC_ENGINE.dialect.driver)
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession] | None:
+    return _AsyncSessionLocal
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Yield an AsyncSession per request; no threadpool slot is held while waiting."""
+    if _AsyncSessionLocal is None:
+        raise RuntimeError("Async DB not initialized")
+    async with _AsyncSessionLocal() as db:
+        yield db
+
+
+async def close_async_engine() -> None:
+    """Dispose the async engine at shutdown."""
+    global _ASYNC_ENGINE, _AsyncSessionLocal
+    if _ASYNC_ENGINE is not None:
+        await _ASYNC_ENGINE.dispose()
+    _ASYNC_ENGINE = None
+    _AsyncSessionLocal = None
@@ -1,5 +1,5 @@
 # root/service/db/types.py
-"""Cross-DB JSON type that maps to JSONB in PG and TEXT in SQLite."""
+"""Cross-DB JSON type that maps to JSONB in PG and TEXT in SQLite (large values zstd-packed)."""
 # Why: keep column names generic (input/output/timings/options) yet flexible.
 
 from __future__ import annotations
@@ -7,22 +7,105 @@ from __future__ import annotations
 import json
 from typing import Any
 
+import orjson
+import zstandard
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.engine import Dialect
-from sqlalchemy.types import TEXT, TypeDecorator
+from sqlalchemy.types import TEXT, TypeDecorator, TypeEngine
+
+# Non-str keys (e.g. {1: ...}) were accepted by json.dumps; keep that contract.
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+
+
+# orjson's integer range; anything wider is stored as its decimal string.
+_INT_MIN, _INT_MAX = -(2**63), 2**64 - 1
+
+
+def _widen_ints(value: Any) -> Any:
+    """Copy of `value` with out-of-range ints (values and keys) as strings."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value if _INT_MIN <= value <= _INT_MAX else str(value)
+    if isinstance(value, dict):
+        return {_widen_ints(k): _widen_ints(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [_widen_ints(v) for v in value]
+    return value
+
+
+def json_dumps(value: Any) -> str:
+    """orjson; ints wider than 64 bit become strings (orjson would read them back as floats)."""
+    try:
+        return orjson.dumps(value, option=_ORJSON_OPTS).decode("utf-8")
+    except orjson.JSONEncodeError:
+        # Only integer overflow is recoverable; anything else raises from the retry.
+        return orjson.dumps(_widen_ints(value), option=_ORJSON_OPTS).decode("utf-8")
+
+
+def json_loads(value: str | bytes) -> Any:
+    """orjson; stdlib for rows json.dumps wrote earlier (NaN/Infinity literals)."""
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return json.loads(value)
+
+
+# Prefix of a zstd-packed value (stored as a BLOB); JSON text never starts with NUL.
+ZSTD_MARKER = b"\x00zj1"
+_ZSTD_LEVEL = 3
+# JSONFlex(compress=True) values of at least this many characters are packed; <= 0 disables.
+# init_db applies AUTOSUITE_JSON_COMPRESS_MIN_BYTES; scripts keep this default.
+_compress_min_bytes = 1024
+
+
+def configure_json_compression(min_bytes: int) -> None:
+    global _compress_min_bytes
+    _compress_min_bytes = int(min_bytes)
+
+
+def pack_json(text: str, min_bytes: int | None = None) -> str | bytes:
+    """JSON text as-is, or marker + zstd frame when big enough and actually smaller."""
+    limit = _compress_min_bytes if min_bytes is None else min_bytes
+    if limit <= 0 or len(text) < limit:
+        return text
+    raw = text.encode("utf-8")
+    packed = ZSTD_MARKER + zstandard.compress(raw, _ZSTD_LEVEL)
+    return packed if len(packed) < len(raw) else text
+
+
+def unpack_json(value: str | bytes) -> str | bytes:
+    """Inverse of pack_json: JSON text (str or bytes) ready for json_loads."""
+    if isinstance(value, bytes) and value.startswith(ZSTD_MARKER):
+        return zstandard.decompress(value[len(ZSTD_MARKER) :])
+    return value
 
 
 class JSONFlex(TypeDecorator):
-    """Serialize dict/list to TEXT; PG can swap to JSONB later."""
+    """JSONB on Postgres (driver encodes via engine json_serializer); orjson TEXT elsewhere.
+
+    compress=True: on SQLite, values past the size threshold are stored zstd-packed
+    (BLOB with ZSTD_MARKER) and unpacked on read. Postgres already TOASTs big JSONB.
+    """
 
     impl = TEXT
     cache_ok = True
 
-    def process_bind_param(self, value: Any, dialect: Dialect) -> str | None:
-        if value is None:
-            return None
-        return json.dumps(value, ensure_ascii=False)
+    def __init__(self, compress: bool = False) -> None:
+        super().__init__()
+        self.compress = compress
 
-    def process_result_value(self, value: str | None, dialect: Dialect) -> Any | None:
-        if value is None:
-            return None
-        return json.loads(value)
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(TEXT())
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        if value is None or dialect.name == "postgresql":
+            return value
+        if self.compress and dialect.name == "sqlite":
+            return pack_json(json_dumps(value))
+        return json_dumps(value)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Any | None:
+        if value is None or dialect.name == "postgresql":
+            return value
+        return json_loads(unpack_json(value))
@@ -0,0 +1,153 @@
+# root/service/executor/dispatcher.py
+"""Background scheduler loop woken by job events instead of HTTP requests."""
+# Why: queueing latency should not depend on traffic hitting create/cancel.
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from service.app.deps import get_session_factory, get_settings
+
+_logger = structlog.get_logger(__name__)
+
+NOTIFY_CHANNEL = "autosuite_jobs"
+
+
+def _is_postgres(db_url: str) -> bool:
+    return make_url(db_url).get_backend_name() == "postgresql"
+
+
+class Dispatcher:
+    """Single thread that runs schedule_jobs on wake-ups plus a fallback tick.
+
+    Wake-ups coalesce: ten job events arriving during one pass cause one more pass.
+    """
+
+    def __init__(self, factory: Callable[[], Session], tick_s: float = 5.0) -> None:
+        self._factory = factory
+        self.tick_s = max(float(tick_s), 0.1)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self.passes = 0
+
+    def start(self, db_url: str | None = None) -> Dispatcher:
+        self._spawn(self._loop, "scheduler-dispatch")
+        if db_url and _is_postgres(db_url):
+            self._spawn(self._listen, "scheduler-listen", db_url)
+        _logger.info("dispatcher_started", tick_s=self.tick_s, listen=len(self._threads) > 1)
+        return self
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        for t in self._threads:
+            t.join(timeout=self.tick_s + 1)
+        _logger.info("dispatcher_stopped", passes=self.passes)
+
+    def _spawn(self, target: Callable[..., None], name: str, *args: Any) -> None:
+        t = threading.Thread(target=target, args=args, name=name, daemon=True)
+        t.start()
+        self._threads.append(t)
+
+    def _loop(self) -> None:
+        from .scheduler import schedule_jobs
+
+        while not self._stop.is_set():
+            self._wake.wait(self.tick_s)
+            self._wake.clear()
+            if self._stop.is_set():
+                return
+            db = self._factory()
+            try:
+                schedule_jobs(db)
+                self.passes += 1
+            except Exception as e:
+                db.rollback()
+                _logger.error("dispatcher_pass_failed", err=str(e))
+            finally:
+                db.close()
+
+    def _listen(self, db_url: str) -> None:
+        """Postgres only: other processes (workers, replicas) wake us via NOTIFY."""
+        import psycopg
+
+        dsn = make_url(db_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(dsn, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                    while not self._stop.is_set():
+                        for _ in conn.notifies(timeout=self.tick_s, stop_after=1):
+                            self.wake()
+            except Exception as e:
+                _logger.warning("dispatcher_listen_failed", err=str(e))
+                self._stop.wait(self.tick_s)
+
+
+_DISPATCHER: Dispatcher | None = None
+
+
+def get_dispatcher() -> Dispatcher | None:
+    """Return the running dispatcher, if this process owns one."""
+    return _DISPATCHER
+
+
+def start_dispatcher(factory: Callable[[], Session]) -> Dispatcher:
+    """Start the process-wide dispatcher (API process only)."""
+    global _DISPATCHER
+    if _DISPATCHER is None:
+        s = get_settings()
+        tick_s = getattr(s, "executor_dispatch_tick_ms", 5000) / 1000
+        _DISPATCHER = Dispatcher(factory, tick_s=tick_s).start(getattr(s, "db_url", None))
+        _DISPATCHER.wake()  # first pass picks up anything queued before startup
+    return _DISPATCHER
+
+
+def stop_dispatcher() -> None:
+    """Stop the dispatcher at shutdown; safe to call when none is running."""
+    global _DISPATCHER
+    dispatcher, _DISPATCHER = _DISPATCHER, None
+    if dispatcher is not None:
+        dispatcher.stop()
+
+
+def request_schedule(db: Session | None = None) -> None:
+    """Signal 'a slot or a job appeared'.
+
+    Local dispatcher -> in-process wake; Postgres -> NOTIFY for the API's listener;
+    otherwise fall back to an inline schedule pass (old behaviour).
+    """
+    dispatcher = get_dispatcher()
+    if dispatcher is not None:
+        dispatcher.wake()
+        return
+
+    from .scheduler import schedule_jobs
+
+    own = db is None
+    if db is None:
+        factory = get_session_factory()
+        if factory is None:
+            return
+        db = factory()
+    try:
+        s = get_settings()
+        if getattr(s, "executor_dispatcher", False) and db.get_bind().dialect.name == "postgresql":
+            db.execute(text("SELECT pg_notify(:ch, '')"), {"ch": NOTIFY_CHANNEL})
+            db.commit()
+            return
+        schedule_jobs(db)
+    finally:
+        if own:
+            db.close()
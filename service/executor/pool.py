@@ -0,0 +1,245 @@
+# root/service/executor/pool.py
+"""Long-lived worker processes fed job ids over stdin."""
+# Why: warm processes keep imports, DB engine and browser between jobs.
+
+from __future__ import annotations
+
+import contextlib
+import subprocess
+import sys
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+_logger = structlog.get_logger(__name__)
+
+# Worker → pool protocol line on stdout; anything else is passed through as logs.
+DONE_MARK = "@@autosuite-job-done"
+
+WORKER_CMD = [sys.executable, "-m", "service.executor.worker", "--serve"]
+
+
+@dataclass(slots=True)
+class PoolWorker:
+    """One warm process and the job ids it has been handed.
+
+    `busy` keeps dispatch order: the worker reads stdin FIFO, so the first id is
+    the job it is running and the rest are queued behind it.
+    """
+
+    proc: Any
+    busy: dict[str, None] = field(default_factory=dict)
+
+    @property
+    def running(self) -> str | None:
+        return next(iter(self.busy), None)
+
+    @property
+    def pid(self) -> int:
+        return int(self.proc.pid)
+
+
+class WorkerPool:
+    """Fixed-size pool; capacity is still enforced by the DB-based scheduler."""
+
+    def __init__(
+        self,
+        size: int,
+        on_job_done: Callable[[str], None],
+        on_worker_lost: Callable[[int, set[str]], None],
+        on_jobs_released: Callable[[int, set[str]], None] | None = None,
+    ) -> None:
+        self.size = max(int(size), 1)
+        self._on_job_done = on_job_done
+        self._on_worker_lost = on_worker_lost
+        self._on_jobs_released = on_jobs_released
+        self._workers: list[PoolWorker] = []
+        self._lock = threading.Lock()
+        self._running = False
+
+    def start(self) -> None:
+        """Spawn all workers up front so the first job starts warm."""
+        with self._lock:
+            self._running = True
+            while len(self._workers) < self.size:
+                self._workers.append(self._spawn())
+        _logger.info("worker_pool_started", size=self.size, pids=self.pids())
+
+    def stop(self) -> None:
+        """Close stdin (workers exit after their current job) then reap."""
+        with self._lock:
+            self._running = False
+            workers, self._workers = self._workers, []
+        for w in workers:
+            try:
+                w.proc.stdin.close()
+            except Exception as e:
+                _logger.warning("worker_pool_stdin_close_failed", pid=w.pid, err=str(e))
+        for w in workers:
+            try:
+                w.proc.wait(timeout=10)
+            except Exception:
+                w.proc.kill()
+        _logger.info("worker_pool_stopped", size=len(workers))
+
+    def pids(self) -> list[int]:
+        return [w.pid for w in self._workers]
+
+    def dispatch(self, job_id: str) -> int:
+        """Hand a claimed job to the least busy worker and return its pid."""
+        with self._lock:
+            if not self._running or not self._workers:
+                raise RuntimeError("worker_pool_not_running")
+            worker = min(self._workers, key=lambda w: len(w.busy))
+            worker.busy[job_id] = None
+            try:
+                worker.proc.stdin.write(f"{job_id}\n")
+                worker.proc.stdin.flush()
+            except Exception:
+                worker.busy.pop(job_id, None)
+                raise
+        _logger.info("worker_pool_dispatched", job_id=job_id, pid=worker.pid)
+        return worker.pid
+
+    def cancel(self, job_id: str) -> bool:
+        """Stop one job without taking down other jobs handed to the same worker.
+
+        Queued behind another job: just forgotten here; the worker skips it once the
+        DB says CANCELLED. Running: the jobs queued behind it are released back to
+        the queue first, then the process is terminated (and respawned).
+        Returns True when a process was signalled.
+        """
+        with self._lock:
+            worker = next((w for w in self._workers if job_id in w.busy), None)
+            if worker is None:
+                return False
+            if worker.running != job_id:
+                worker.busy.pop(job_id, None)
+                return False
+            queued = set(worker.busy) - {job_id}
+            worker.busy = {job_id: None}
+        if queued and self._on_jobs_released is not None:
+            self._safe_call(self._on_jobs_released, worker.pid, queued)
+        with contextlib.suppress(ProcessLookupError):  # already gone; _read_loop reports it
+            worker.proc.terminate()
+        _logger.info("worker_pool_cancelled", job_id=job_id, pid=worker.pid, requeued=len(queued))
+        return True
+
+    def _spawn(self) -> PoolWorker:
+        proc = subprocess.Popen(  # noqa: S603 - fixed, trusted args
+            WORKER_CMD,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            close_fds=True,
+        )
+        worker = PoolWorker(proc=proc)
+        threading.Thread(
+            target=self._read_loop, args=(worker,), name=f"pool-reader-{proc.pid}", daemon=True
+        ).start()
+        return worker
+
+    def _read_loop(self, worker: PoolWorker) -> None:
+        """Track completions; respawn when a worker dies (e.g. hard cancel)."""
+        for line in worker.proc.stdout:
+            if line.startswith(DONE_MARK):
+                job_id = line[len(DONE_MARK) :].strip()
+                with self._lock:
+                    worker.busy.pop(job_id, None)
+                self._safe_call(self._on_job_done, job_id)
+            else:
+                sys.stdout.write(line)
+
+        with self._lock:
+            lost = set(worker.busy)
+            worker.busy.clear()
+            if worker in self._workers:
+                self._workers.remove(worker)
+                if self._running:
+                    self._workers.append(self._spawn())
+        _logger.warning("worker_pool_worker_exited", pid=worker.pid, lost=sorted(lost))
+        self._safe_call(self._on_worker_lost, worker.pid, lost)
+
+    @staticmethod
+    def _safe_call(fn: Callable[..., None], *args: Any) -> None:
+        try:
+            fn(*args)
+        except Exception as e:
+            _logger.error("worker_pool_callback_failed", err=str(e))
+
+
+_POOL: WorkerPool | None = None
+
+
+def get_worker_pool() -> WorkerPool | None:
+    """Return the running pool, if this process owns one."""
+    return _POOL
+
+
+def _after_job(job_id: str) -> None:
+    """A slot freed up: wake the dispatcher or run a scheduler pass."""
+    from .dispatcher import request_schedule
+
+    request_schedule()
+
+
+def _after_jobs_released(pid: int, job_ids: set[str]) -> None:
+    """Jobs queued on a worker that is being stopped: back to PENDING, then reschedule."""
+    from service.app.deps import get_session_factory
+
+    from .dispatcher import request_schedule
+    from .scheduler import requeue_worker_jobs
+
+    factory = get_session_factory()
+    if factory is None:
+        return
+    db = factory()
+    try:
+        requeue_worker_jobs(db, pid, job_ids)
+        request_schedule(db)
+    finally:
+        db.close()
+
+
+def _after_worker_lost(pid: int, job_ids: set[str]) -> None:
+    """Fail jobs the dead worker still owned, then refill the slots."""
+    from service.app.deps import get_session_factory
+
+    from .dispatcher import request_schedule
+    from .scheduler import fail_lost_jobs
+
+    factory = get_session_factory()
+    if factory is None:
+        return
+    db = factory()
+    try:
+        fail_lost_jobs(db, pid, job_ids)
+        request_schedule(db)
+    finally:
+        db.close()
+
+
+def start_worker_pool(size: int) -> WorkerPool:
+    """Create and start the process-wide pool (API process only)."""
+    global _POOL
+    if _POOL is None:
+        _POOL = WorkerPool(
+            size,
+            on_job_done=_after_job,
+            on_worker_lost=_after_worker_lost,
+            on_jobs_released=_after_jobs_released,
+        )
+        _POOL.start()
+    return _POOL
+
+
+def stop_worker_pool() -> None:
+    """Stop the pool at shutdown; safe to call when none is running."""
+    global _POOL
+    pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.stop()
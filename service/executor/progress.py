@@ -0,0 +1,120 @@
+# root/service/executor/progress.py
+"""Worker-side event sinks: DB progress writer and Postgres NOTIFY relay."""
+# Why: SSE watchers live in the API process; item starts are never written by the result sink.
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+import structlog
+from sqlalchemy import Update, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from engine.core.constants.statuses import ItemStatus
+from engine.orchestration.event_bus import EventBus, EventSink
+from engine.orchestration.events import ItemStarted, event_payload
+from engine.orchestration.sinks import install_default_sinks
+from service.db.models import JobItem
+from service.db.repo import bump_job_version
+
+_logger = structlog.get_logger(__name__)
+
+EVENTS_CHANNEL = "autosuite_job_events"
+
+# Finished events reach the API through the DB tail (rows are persisted by then);
+# NOTIFY only carries what the DB does not see first.
+RELAYED_EVENTS = frozenset({"JobStarted", "ItemStarted"})
+
+
+def started_items_stmt(job_id: str, idxs: list[int], version: int) -> Update:
+    """PENDING -> RUNNING for the started items of one job, stamped with `version`."""
+    return (
+        update(JobItem)
+        .where(
+            JobItem.job_id == job_id,
+            JobItem.idx.in_(idxs),
+            JobItem.status == str(ItemStatus.PENDING),
+            JobItem.finished_at.is_(None),
+        )
+        .values(status=str(ItemStatus.RUNNING), version=version)
+    )
+
+
+class DbProgressSink(EventSink):
+    """Flip started items PENDING -> RUNNING, one UPDATE per job per batch.
+
+    The status guard keeps a late batch from overwriting a row the result sink
+    already finished; the version bump lets the delta poller and SSE tail see it.
+    """
+
+    name = "db_progress"
+
+    def __init__(self, factory: Callable[[], Session]) -> None:
+        self._factory = factory
+
+    def handle(self, events: list[Any]) -> None:
+        started: dict[str, list[int]] = {}
+        for evt in events:
+            if isinstance(evt, ItemStarted):
+                started.setdefault(evt.job_id, []).append(evt.item_index)
+        if not started:
+            return
+        db = self._factory()
+        try:
+            for job_id, idxs in started.items():
+                version = bump_job_version(db, job_id)
+                db.execute(started_items_stmt(job_id, idxs, version))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+class NotifySink(EventSink):
+    """pg_notify per relayed event; the sink thread owns the connection."""
+
+    name = "pg_notify"
+
+    def __init__(self, db_url: str) -> None:
+        self._dsn = (
+            make_url(db_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        )
+        self._conn: Any = None
+
+    def handle(self, events: list[Any]) -> None:
+        import psycopg
+
+        payloads = [p for p in map(event_payload, events) if p["type"] in RELAYED_EVENTS]
+        if not payloads:
+            return
+        try:
+            if self._conn is None:
+                self._conn = psycopg.connect(self._dsn, autocommit=True)
+            for p in payloads:
+                self._conn.execute(
+                    "SELECT pg_notify(%s, %s)", (EVENTS_CHANNEL, orjson.dumps(p).decode())
+                )
+        except Exception:
+            self._conn = None  # reconnect on the next batch
+            raise
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def install_worker_sinks(
+    bus: EventBus, factory: Callable[[], Session], settings: Any
+) -> list[EventSink]:
+    """Everything a job-running process publishes to; NOTIFY on Postgres only."""
+    sinks = [bus.add_sink(DbProgressSink(factory))]
+    db_url = getattr(settings, "db_url", None)
+    if db_url and make_url(db_url).get_backend_name() == "postgresql":
+        sinks.append(bus.add_sink(NotifySink(db_url)))
+    return sinks + install_default_sinks(bus, settings)
@@ -0,0 +1,200 @@
+# root/service/executor/result_sink.py
+"""Stream ItemResults to the DB in small batches while the job is running."""
+# Why: partial results show up in the UI and survive a worker crash.
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+import structlog
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from engine.core.constants.statuses import ItemStatus, JobStatus
+from service.db.models import Job, JobItem
+from service.db.repo import bump_job_version
+
+_logger = structlog.get_logger(__name__)
+
+# (idx, result, finished_at)
+Pending = tuple[int, Any, datetime]
+
+
+def load_item_ids(db: Session, job_id: str) -> dict[int, str]:
+    """Map idx -> JobItem.id so batches can UPDATE by primary key."""
+    rows = db.execute(select(JobItem.idx, JobItem.id).where(JobItem.job_id == job_id)).all()
+    return {int(idx): str(item_id) for idx, item_id in rows}
+
+
+def write_results(
+    db: Session, job_id: str, batch: Iterable[Pending], ids_by_idx: dict[int, str]
+) -> int:
+    """One bulk UPDATE for the items + one counter UPDATE for the job; commits."""
+    rows: list[dict[str, Any]] = []
+    done = failed = cancelled = 0
+    for idx, r, finished_at in batch:
+        item_id = ids_by_idx.get(idx)
+        if item_id is None:
+            continue
+        rows.append(
+            {
+                "id": item_id,
+                "status": str(r.status),
+                "retry_count": int(r.retry_count),
+                "error_code": str(r.error_code) if r.error_code else None,
+                "error_message": r.error_message,
+                "output": r.output or None,
+                "timings": r.timings or None,
+                "extras": r.extras or None,
+                "finished_at": finished_at,
+            }
+        )
+        if r.status == ItemStatus.DONE:
+            done += 1
+        elif r.status == ItemStatus.FAILED:
+            failed += 1
+        else:
+            cancelled += 1
+
+    if not rows:
+        return 0
+
+    version = bump_job_version(
+        db,
+        job_id,
+        count_done=Job.count_done + done,
+        count_failed=Job.count_failed + failed,
+        count_cancelled=Job.count_cancelled + cancelled,
+    )
+    for row in rows:
+        row["version"] = version
+    db.execute(update(JobItem), rows)  # ORM bulk UPDATE by primary key (executemany)
+    db.commit()
+    return len(rows)
+
+
+def finalize_job(db: Session, job_id: str, total: int) -> JobStatus:
+    """Derive final status from the counters the batches already wrote."""
+    row = db.execute(
+        select(Job.count_done, Job.count_failed, Job.count_cancelled).where(Job.id == job_id)
+    ).one()
+    done, failed, cancelled = (int(v or 0) for v in row)
+
+    if cancelled > 0 and (done + failed) < total:
+        final_status = JobStatus.CANCELLED
+    elif failed > 0:
+        final_status = JobStatus.FAILED
+    else:
+        final_status = JobStatus.DONE
+
+    bump_job_version(
+        db,
+        job_id,
+        status=str(final_status),
+        finished_at=datetime.now(UTC),
+        worker_pid=None,  # clear worker_pid and save to db
+    )
+    db.commit()
+    _logger.info(
+        "worker_job_finished",
+        job_id=job_id,
+        status=str(final_status),
+        done=done,
+        failed=failed,
+        cancelled=cancelled,
+    )
+    return final_status
+
+
+class ResultSink:
+    """Thread-safe buffer flushed by size (caller thread) or age (flusher thread).
+
+    `emit` is the runner's on_result callback; lanes may call it concurrently.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Session],
+        job_id: str,
+        batch_size: int = 20,
+        flush_interval_s: float = 1.0,
+        already_written: Iterable[int] = (),
+    ) -> None:
+        self._factory = factory
+        self.job_id = job_id
+        self.batch_size = max(int(batch_size), 1)
+        self.flush_interval_s = max(float(flush_interval_s), 0.05)
+        self._pending: list[Pending] = []
+        self._seen: set[int] = set(already_written)  # resumed items are already counted
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._ids: dict[int, str] = {}
+        self._thread: threading.Thread | None = None
+        self.flushes = 0
+
+    def start(self) -> ResultSink:
+        db = self._factory()
+        try:
+            self._ids = load_item_ids(db, self.job_id)
+        finally:
+            db.close()
+        self._thread = threading.Thread(
+            target=self._flush_loop, name=f"result-sink-{self.job_id}", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def emit(self, idx: int, result: Any) -> None:
+        """Buffer one finished item; flush inline once the batch is full."""
+        with self._lock:
+            if idx in self._seen:
+                return
+            self._seen.add(idx)
+            self._pending.append((idx, result, datetime.now(UTC)))
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write everything buffered so far; returns rows written."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return 0
+        with self._write_lock:
+            db = self._factory()
+            try:
+                written = write_results(db, self.job_id, batch, self._ids)
+            except Exception as e:
+                db.rollback()
+                _logger.error("result_sink_flush_failed", job_id=self.job_id, err=str(e))
+                with self._lock:
+                    self._pending[:0] = batch  # retry on next flush
+                return 0
+            finally:
+                db.close()
+        self.flushes += 1
+        _logger.debug("result_sink_flushed", job_id=self.job_id, rows=written)
+        return written
+
+    def close(self, results: list[Any] | None = None) -> None:
+        """Stop the flusher, backfill results the runner never emitted, final flush."""
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        for idx, r in enumerate(results or []):
+            self.emit(idx, r)
+        self.flush()
+
+    def _flush_loop(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval_s)
+            if self._closed:
+                return
+            self.flush()
@@ -8,12 +8,15 @@ import subprocess
 import sys
 
 import structlog
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 
 from engine.core.constants.statuses import ItemStatus, JobStatus
 from service.app.deps import get_settings
 from service.db.models import Job, JobItem
+from service.db.repo import bump_job_version
+
+from .pool import get_worker_pool
 
 _logger = structlog.get_logger(__name__)
 
@@ -27,7 +30,11 @@ def _running_jobs_count(db: Session) -> int:
 
 
 def _spawn_worker(job_id: str) -> int:
-    """Start worker subprocess for a job and return its PID."""
+    """Start worker subprocess for a job (or hand it to the warm pool) and return its PID."""
+    pool = get_worker_pool()
+    if pool is not None:
+        return pool.dispatch(job_id)
+
     cmd = [
         sys.executable,
         "-m",
@@ -40,9 +47,69 @@ def _spawn_worker(job_id: str) -> int:
     return int(proc.pid)
 
 
+def _cancel_unfinished_items(db: Session, job_id: str) -> None:
+    """Mark unfinished items as cancelled due to system failure."""
+    version = bump_job_version(db, job_id)
+    db.query(JobItem).filter(
+        JobItem.job_id == job_id,
+        JobItem.finished_at.is_(None),
+    ).update(
+        {
+            "status": str(ItemStatus.CANCELLED),
+            "error_code": "SYSTEM_FAILURE",
+            "error_message": "worker process lost before completion",
+            "version": version,
+        },
+        synchronize_session=False,
+    )
+
+
+def fail_lost_jobs(db: Session, pid: int, job_ids: set[str]) -> None:
+    """Fail RUNNING jobs still owned by a pool worker that exited.
+    Why: a cancelled job is already terminal; only crashes leave RUNNING rows behind.
+    """
+    if not job_ids:
+        return
+    lost: list[Job] = list(
+        db.execute(
+            select(Job).where(
+                Job.id.in_(job_ids),
+                Job.status == str(JobStatus.RUNNING),
+                Job.worker_pid == pid,
+            )
+        ).scalars()
+    )
+    for job in lost:
+        _cancel_unfinished_items(db, job.id)
+        job.status = str(JobStatus.FAILED)
+        job.worker_pid = None
+        _logger.warning("pool_worker_lost_job", job_id=job.id, pid=pid)
+    db.commit()
+
+
+def requeue_worker_jobs(db: Session, pid: int, job_ids: set[str]) -> None:
+    """Hand jobs queued on a pool worker (not started yet) back to PENDING.
+    Why: cancelling the job that worker is running kills the process, not its queue.
+    """
+    if not job_ids:
+        return
+    db.query(Job).filter(
+        Job.id.in_(job_ids),
+        Job.status == str(JobStatus.RUNNING),
+        Job.worker_pid == pid,
+    ).update(
+        {"status": str(JobStatus.PENDING), "worker_pid": None, "version": Job.version + 1},
+        synchronize_session=False,
+    )
+    db.commit()
+    _logger.warning("pool_worker_jobs_requeued", pid=pid, job_ids=sorted(job_ids))
+
+
 def reconcile_stale_jobs(db: Session) -> None:
     """Mark orphan RUNNING jobs as failed so queue can move on.
     Why: In our model, a process restart kills workers. Any RUNNING here is orphaned.
+    With AUTOSUITE_EXECUTOR_RESUME they go back to PENDING instead; finished items
+    keep their stored results and the worker only runs the rest.
     """
 
     stale_rows = db.execute(select(Job).where(Job.status == str(JobStatus.RUNNING))).scalars().all()
@@ -52,19 +119,16 @@ def reconcile_stale_jobs(db: Session) -> None:
     if not stale:
         return
 
+    resume = bool(getattr(get_settings(), "executor_resume", False))
     for job in stale:
-        # Mark unfinished items as cancelled due to system failure.
-        db.query(JobItem).filter(
-            JobItem.job_id == job.id,
-            JobItem.finished_at.is_(None),
-        ).update(
-            {
-                "status": str(ItemStatus.CANCELLED),
-                "error_code": "SYSTEM_FAILURE",
-                "error_message": "worker process lost before completion",
-            },
-            synchronize_session=False,
-        )
+        if resume:
+            job.status = str(JobStatus.PENDING)
+            job.worker_pid = None
+            job.version = Job.version + 1
+            _logger.warning("requeued_stale_job", job_id=job.id)
+            continue
+
+        _cancel_unfinished_items(db, job.id)
 
         job.status = str(JobStatus.FAILED)
         job.worker_pid = None
@@ -74,73 +138,155 @@ def reconcile_stale_jobs(db: Session) -> None:
     db.commit()
 
 
-def schedule_jobs(db: Session) -> None:
-    """Fill available slots with oldest PENDING jobs in a race-safe way.
+def _pending_candidates(db: Session, limit: int) -> list[str]:
+    """Oldest PENDING job ids (FIFO), up to `limit`, in one round trip."""
+    rows = db.scalars(
+        select(Job.id)
+        .where(
+            Job.status == str(JobStatus.PENDING),
+            Job.worker_pid.is_(None),
+        )
+        .order_by(Job.created_at.asc())
+        .limit(limit)
+    )
+    return [str(r) for r in rows]
+
+
+def _claim(db: Session, job_id: str) -> bool:
+    """Atomic claim: only flip to RUNNING if still PENDING and no pid."""
+    updated = (
+        db.query(Job)
+        .filter(
+            Job.id == job_id,
+            Job.status == str(JobStatus.PENDING),
+            Job.worker_pid.is_(None),
+        )
+        .update(
+            {"status": str(JobStatus.RUNNING), "version": Job.version + 1},
+            synchronize_session=False,
+        )
+    )
+    if updated != 1:
+        # Someone else claimed concurrently.
+        db.rollback()
+        return False
+    db.commit()  # persist RUNNING state before spawning
+    return True
+
+
+def _start_claimed(db: Session, job_id: str) -> None:
+    """We own this job id now: start its worker and record the pid."""
+    pid = _spawn_worker(job_id)
 
-    Pattern: pick candidate id -> atomic UPDATE where still PENDING -> if 1 row affected, spawn worker.
-    This avoids two schedulers claiming the same job.
+    # Why: a warm pool worker may already have finished; never re-tag a terminal job.
+    db.query(Job).filter(Job.id == job_id, Job.status == str(JobStatus.RUNNING)).update(
+        {"worker_pid": pid},
+        synchronize_session=False,
+    )
+    db.commit()
+
+    _logger.info("scheduler_started_job", job_id=job_id, pid=pid)
+
+
+def _claim_batch(db: Session, limit: int) -> list[str] | None:
+    """Claim up to `limit` oldest PENDING jobs in one statement.
+
+    Postgres: UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED) RETURNING id,
+    so concurrent schedulers skip each other's rows instead of conflicting.
+    SQLite: same statement without the lock clause; the write lock makes it atomic.
+    Returns None when the dialect has no UPDATE ... RETURNING (caller uses the loop).
     """
-    s = get_settings()
-    max_workers = max(int(s.executor_max_workers), 1)
+    if not db.get_bind().dialect.update_returning:
+        return None
+    pick = (
+        select(Job.id)
+        .where(
+            Job.status == str(JobStatus.PENDING),
+            Job.worker_pid.is_(None),
+        )
+        .order_by(Job.created_at.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    stmt = (
+        update(Job)
+        .where(Job.id.in_(pick))
+        .values(status=str(JobStatus.RUNNING), version=Job.version + 1)
+        .returning(Job.id)
+        .execution_options(synchronize_session=False)
+    )
+    claimed = [str(r) for r in db.execute(stmt).scalars()]
+    db.commit()  # persist RUNNING state before spawning
+    return claimed
+
+
+def _release_claims(db: Session, job_ids: list[str]) -> None:
+    """Hand unspawned claims back to the queue (spawn failed mid-batch)."""
+    if not job_ids:
+        return
+    db.rollback()
+    db.query(Job).filter(
+        Job.id.in_(job_ids),
+        Job.status == str(JobStatus.RUNNING),
+        Job.worker_pid.is_(None),
+    ).update(
+        {"status": str(JobStatus.PENDING), "version": Job.version + 1},
+        synchronize_session=False,
+    )
+    db.commit()
+    _logger.warning("scheduler_released_claims", job_ids=job_ids)
+
 
+def _start_all(db: Session, claimed: list[str]) -> None:
+    """Spawn claimed jobs in order; on failure the failed one stays RUNNING (reconcile
+    owns it, so we never respawn-loop) and the untried rest go back to PENDING."""
+    for i, job_id in enumerate(claimed):
+        try:
+            _start_claimed(db, job_id)
+        except Exception:
+            _release_claims(db, claimed[i + 1 :])
+            raise
+
+
+def _schedule_loop(db: Session, max_workers: int) -> None:
+    """Portable path: fetch candidates, then one optimistic UPDATE per job."""
     while True:
-        running = _running_jobs_count(db)
-        if running >= max_workers:
+        slots = max_workers - _running_jobs_count(db)
+        if slots <= 0:
             return
 
-        slots = max_workers - running
-        if slots <= 0:
+        candidates = _pending_candidates(db, slots)
+        if not candidates:
             return
 
-        claimed_any = False
-
-        for _ in range(slots):
-            # Oldest PENDING first (FIFO) job id only.
-            candidate_id: str | None = db.scalar(
-                select(Job.id)
-                .where(
-                    Job.status == str(JobStatus.PENDING),
-                    Job.worker_pid.is_(None),
-                )
-                .order_by(Job.created_at.asc())
-                .limit(1)
-            )
-            if candidate_id is None:
-                # No more pending jobs.
-                break
-
-            # Atomic claim: only flip to RUNNING if still PENDING and no pid.
-            updated = (
-                db.query(Job)
-                .filter(
-                    Job.id == candidate_id,
-                    Job.status == str(JobStatus.PENDING),
-                    Job.worker_pid.is_(None),
-                )
-                .update(
-                    {"status": str(JobStatus.RUNNING)},
-                    synchronize_session=False,
-                )
-            )
-            if updated != 1:
-                # Someone else claimed concurrently; retry with next slot.
-                db.rollback()
-                continue
+        lost = 0
+        for candidate_id in candidates:
+            if _claim(db, candidate_id):
+                _start_all(db, [candidate_id])
+            else:
+                lost += 1
 
-            db.commit()  # persist RUNNING state before spawning
+        # Everything we saw was claimed (by us or others) and nothing raced: done.
+        if lost == 0 or lost == len(candidates):
+            return
 
-            # Now we are the owner for this job id.
-            pid = _spawn_worker(str(candidate_id))
 
-            db.query(Job).filter(Job.id == candidate_id).update(
-                {"worker_pid": pid},
-                synchronize_session=False,
-            )
-            db.commit()
+def schedule_jobs(db: Session) -> None:
+    """Fill available slots with oldest PENDING jobs in a race-safe way.
+
+    Pattern: count running -> claim up to `slots` jobs in one UPDATE ... RETURNING ->
+    spawn one worker per claimed id. Dialects without RETURNING fall back to the
+    per-job optimistic claim loop.
+    """
+    s = get_settings()
+    max_workers = max(int(s.executor_max_workers), 1)
 
-            _logger.info("scheduler_started_job", job_id=str(candidate_id), pid=pid)
-            claimed_any = True
+    slots = max_workers - _running_jobs_count(db)
+    if slots <= 0:
+        return
 
-        # If in this loop iteration we couldn't claim anything, stop to avoid tight spin.
-        if not claimed_any:
-            return
+    claimed = _claim_batch(db, slots)
+    if claimed is None:
+        _schedule_loop(db, max_workers)
+        return
+    _start_all(db, claimed)
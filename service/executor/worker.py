@@ -1,27 +1,55 @@
 # root/service/executor/worker.py
 """Standalone job worker subprocess."""
-# Why: each process bootstraps DB, runs one job, exits.
+# Why: each process bootstraps DB, runs one job and exits (or serves many in pool mode).
 
 from __future__ import annotations
 
 import argparse
 import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import Any, cast
 
 import structlog
+from prometheus_client import Histogram
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from engine.core.constants.flows import FlowType
 from engine.core.constants.statuses import ItemStatus, JobStatus
+from engine.core.errors import ErrorCode
+from engine.core.models.item_result import ItemResult
+from engine.orchestration.event_bus import get_event_bus
 from engine.orchestration.runner import run_job
-from service.app.deps import get_session_factory, init_db
+from service.app.deps import get_session_factory, get_settings, init_db
+from service.app.exporters.export_cache import prebuild_exports, prebuild_formats
 from service.db.models import Job, JobItem
-from service.executor.scheduler import schedule_jobs
+from service.db.repo import bump_job_version
+from service.executor.dispatcher import request_schedule
+from service.executor.pool import DONE_MARK
+from service.executor.progress import install_worker_sinks
+from service.executor.result_sink import ResultSink, finalize_job
 
 _logger = structlog.get_logger(__name__)
 
+QUEUE_WAIT = Histogram(
+    "autosuite_job_queue_wait_seconds",
+    "Time from job creation until a worker starts running it.",
+    ["flow"],
+    buckets=(0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 300.0, 900.0, 3600.0),
+)
+
+
+def _observe_queue_wait(row: Job) -> None:
+    created = row.created_at
+    if created is None:
+        return
+    if created.tzinfo is None:  # SQLite hands back naive UTC
+        created = created.replace(tzinfo=UTC)
+    waited = (datetime.now(UTC) - created).total_seconds()
+    QUEUE_WAIT.labels(flow=str(row.flow_type)).observe(max(waited, 0.0))
+
 
 def _load_items(db: Session, job_id: str) -> list[dict[str, Any]]:
     """Load enriched items for this job."""
@@ -33,123 +61,156 @@ def _load_items(db: Session, job_id: str) -> list[dict[str, Any]]:
     return [cast(dict[str, Any], row.input or {}) for row in rows]
 
 
-def _persist_results(db: Session, job_id: str, results: list[Any]) -> None:
-    """Map ItemResult list back to JobItem + Job summary."""
-    # Load object into session:
+def _load_completed(db: Session, job_id: str) -> dict[int, ItemResult]:
+    """Stored outcomes of items that already finished (resumed jobs)."""
     rows: list[JobItem] = list(
         db.execute(
-            select(JobItem).where(JobItem.job_id == job_id).order_by(JobItem.idx.asc())
+            select(JobItem).where(JobItem.job_id == job_id, JobItem.finished_at.is_not(None))
         ).scalars()
     )
+    completed: dict[int, ItemResult] = {}
+    for row in rows:
+        try:
+            code = ErrorCode(row.error_code) if row.error_code else ErrorCode.NONE
+        except ValueError:
+            code = ErrorCode.UNKNOWN
+        completed[int(row.idx)] = ItemResult(
+            status=ItemStatus(row.status),
+            retry_count=int(row.retry_count or 0),
+            error_code=code,
+            error_message=row.error_message,
+            output=cast(dict[str, Any], row.output or {}),
+            extras=cast(dict[str, Any], row.extras or {}),
+            timings=cast(dict[str, float], row.timings or {}),
+        )
+    return completed
 
-    by_idx: dict[int, JobItem] = {}
-    for rec in rows:
-        idx_val: int = int(cast(Any, rec).idx)  # avoid Mapped[int] issues
-        by_idx[idx_val] = rec
-
-    done = failed = cancelled = 0
-    now = datetime.now(UTC)
-
-    for idx, r in enumerate(results):
-        item_rec: JobItem | None = by_idx.get(idx)
-        if item_rec is None:
-            continue
-
-        item_rec.status = str(r.status)
-        item_rec.retry_count = int(r.retry_count)
-        item_rec.error_code = str(r.error_code) if r.error_code else None
-        item_rec.error_message = r.error_message
-        item_rec.output = r.output or None
-        item_rec.timings = r.timings or None
-        item_rec.extras = r.extras or None
-        item_rec.finished_at = now
-
-        if r.status == ItemStatus.DONE:
-            done += 1
-        elif r.status == ItemStatus.FAILED:
-            failed += 1
-        else:
-            cancelled += 1
-
-    # No need for bulk_save_objects: ORM already tracks JobItem instances.
-    # db.bulk_save_objects(list(by_idx.values()))
-
-    total = len(results)
-    if cancelled > 0 and (done + failed) < total:
-        final_status = JobStatus.CANCELLED
-    elif failed > 0:
-        final_status = JobStatus.FAILED
-    else:
-        final_status = JobStatus.DONE
-
-    db.query(Job).filter(Job.id == job_id).update(
-        {
-            "status": str(final_status),
-            "finished_at": now,
-            "count_done": done,
-            "count_failed": failed,
-            "count_cancelled": cancelled,
-            # clear worker_pid and save to db
-            "worker_pid": None,
-        },
-        synchronize_session=False,
-    )
-    db.commit()
-    _logger.info(
-        "worker_job_finished",
-        job_id=job_id,
-        status=str(final_status),
-        done=done,
-        failed=failed,
-        cancelled=cancelled,
-    )
 
+def _prebuild_exports(factory: Any, job_id: str, settings: Any) -> None:
+    """Warm the export cache after the slot is released; never fails the job."""
+    formats = prebuild_formats(settings)
+    if not formats:
+        return
+    try:
+        with factory() as db:  # fresh session: the job row must read as finished
+            prebuild_exports(db, job_id, formats, settings)
+    except Exception as exc:
+        _logger.warning("worker_export_prebuild_failed", job_id=job_id, err=str(exc))
 
-def main() -> None:
-    """Read job from DB, run engine, flush results."""
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--job-id", required=True)
-    args = parser.parse_args()
-    job_id = args.job_id
 
-    # Ensure DB engine/session are initialized in this process.
-    asyncio.run(init_db())
-    factory = get_session_factory()
-    if factory is None:
-        raise RuntimeError("Session factory not initialized in worker")
+def _execute_job(factory: Any, job_id: str, *, reschedule: bool = True) -> bool:
+    """Run one job end-to-end; True once it is finalized.
 
+    Pool workers (reschedule=False) leave rescheduling to the parent and build
+    exports in the background after reporting the job done.
+    """
     db = factory()
     try:
         row: Job | None = db.query(Job).filter(Job.id == job_id).first()
         if not row:
             _logger.error("worker_job_missing", job_id=job_id)
-            return
+            return False
+        if row.status in (str(JobStatus.DONE), str(JobStatus.FAILED), str(JobStatus.CANCELLED)):
+            # Cancelled while queued on this pool worker.
+            _logger.info("worker_job_skipped", job_id=job_id, status=row.status)
+            return False
 
-        db.query(Job).filter(Job.id == job_id).update(
-            {"status": str(JobStatus.RUNNING)},
-            synchronize_session=False,
-        )
+        bump_job_version(db, job_id, status=str(JobStatus.RUNNING))
         db.commit()
 
         flow = FlowType(row.flow_type)
         items = _load_items(db, job_id)
+        completed = _load_completed(db, job_id)
         options = dict(row.options or {})
         options["job_id"] = job_id
-
-        results = run_job(flow=flow, items=items, options=options)
-        _persist_results(db, job_id, results)
-        schedule_jobs(db)
+        db.commit()  # end the read txn; the sink writes on its own sessions
+        if completed:
+            _logger.info("worker_job_resumed", job_id=job_id, skipped=len(completed))
+        else:
+            _observe_queue_wait(row)  # a resumed job's created_at says nothing about queueing
+
+        s = get_settings()
+        sink = ResultSink(
+            factory,
+            job_id,
+            batch_size=getattr(s, "result_flush_items", 20),
+            flush_interval_s=getattr(s, "result_flush_ms", 1000) / 1000,
+            already_written=completed.keys(),
+        ).start()
+        try:
+            results = run_job(
+                flow=flow,
+                items=items,
+                options=options,
+                on_result=sink.emit,
+                completed=completed,
+            )
+        except BaseException:
+            sink.close()  # keep what finished before the runner blew up
+            raise
+        sink.close(results)  # backfill anything the runner did not stream
+        finalize_job(db, job_id, len(results))
+        if reschedule:
+            request_schedule(db)
+            _prebuild_exports(factory, job_id, s)
+        return True
     except Exception as exc:
         _logger.error("worker_job_failed", job_id=job_id, err=str(exc))
-        db.query(Job).filter(Job.id == job_id).update(
-            {"status": str(JobStatus.FAILED), "worker_pid": None},
-            synchronize_session=False,
-        )
+        db.rollback()
+        bump_job_version(db, job_id, status=str(JobStatus.FAILED), worker_pid=None)
         db.commit()
-        schedule_jobs(db)
+        if reschedule:
+            request_schedule(db)
+        return False
     finally:
         db.close()
 
 
+def _serve(factory: Any) -> None:
+    """Pool mode: take job ids from stdin until EOF, report each one on stdout.
+
+    Export warm-ups run on one background thread so the next job dispatched to
+    this worker starts right away instead of waiting for an xlsx build.
+    """
+    prebuilds = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export-prebuild")
+    try:
+        for line in sys.stdin:
+            job_id = line.strip()
+            if not job_id:
+                continue
+            finished = _execute_job(factory, job_id, reschedule=False)
+            print(f"{DONE_MARK} {job_id}", flush=True)
+            if finished:
+                prebuilds.submit(_prebuild_exports, factory, job_id, get_settings())
+    finally:
+        prebuilds.shutdown(wait=True)  # best effort: the parent kills us after its grace period
+    _logger.info("worker_serve_exit")
+
+
+def main() -> None:
+    """Read job from DB, run engine, flush results."""
+    parser = argparse.ArgumentParser()
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--job-id")
+    mode.add_argument("--serve", action="store_true", help="stay alive; read job ids on stdin")
+    args = parser.parse_args()
+
+    # Ensure DB engine/session are initialized in this process.
+    asyncio.run(init_db())
+    factory = get_session_factory()
+    if factory is None:
+        raise RuntimeError("Session factory not initialized in worker")
+
+    bus = get_event_bus()
+    install_worker_sinks(bus, factory, get_settings())
+    try:
+        if args.serve:
+            _serve(factory)
+        else:
+            _execute_job(factory, args.job_id)
+    finally:
+        bus.close()  # drain progress/metrics/file sinks before the process exits
+
+
 if __name__ == "__main__":
     main()
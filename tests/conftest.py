@@ -14,6 +14,7 @@ import pytest
 from engine.core.config.envkeys import (
     ARTIFACTS_DIR,
     EXECUTOR_MAX_WORKERS,
+    EXPORT_PREBUILD,
     PW_HEADLESS,
     PW_TRACING,
     REPORTS_DIR,
@@ -64,6 +65,7 @@ def test_env() -> None:
     os.environ.setdefault(EXECUTOR_MAX_WORKERS, "1")
     os.environ.setdefault(PW_HEADLESS, "1")
     os.environ.setdefault(PW_TRACING, "off")
+    os.environ.setdefault(EXPORT_PREBUILD, "")  # worker tests must not leave exports in var/
 
 
 @pytest.fixture
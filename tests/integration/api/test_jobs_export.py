@@ -0,0 +1,218 @@
+# root/tests/integration/api/test_jobs_export.py
+"""API: streamed job exports (.xlsx/.csv/.jsonl)."""
+# Why: exports are planned in one pass and streamed in another; both must agree.
+
+from __future__ import annotations
+
+import csv
+import io
+import zipfile
+
+import orjson
+import pytest
+
+from engine.core.constants.flows import FlowType
+
+N_ITEMS = 25  # past the 20 rows that decide domain columns
+
+
+@pytest.fixture
+def finished_job(api_client, api_base, monkeypatch: pytest.MonkeyPatch) -> str:
+    # WHY: Claim the job without launching a real worker subprocess.
+    monkeypatch.setattr("service.executor.scheduler._spawn_worker", lambda job_id: 4242)
+    payload = {
+        "flow_type": FlowType.CRAWL_SIMPLE.value,
+        "items": [{"url": f"https://example.com/{i}"} for i in range(N_ITEMS)],
+        "options": {},
+    }
+    resp = api_client.post(f"{api_base}/jobs", json=payload)
+    assert resp.status_code == 201
+    job_id = str(resp.json()["job_id"])
+
+    from service.app.deps import get_session_factory
+    from service.db.models import JobItem
+
+    factory = get_session_factory()
+    assert factory is not None
+    with factory() as db:
+        for item in db.query(JobItem).filter(JobItem.job_id == job_id):
+            failed = item.idx == N_ITEMS - 1  # only the last row needs diagnostics
+            item.status = "FAILED" if failed else "DONE"
+            item.error_code = "TIMEOUT" if failed else "NONE"
+            item.output = {"title": f"Page {item.idx}", "http_status": 200}
+            item.timings = {"navigate": 0.5, "snapshot": 0.25, "total": 0.8}
+        db.commit()
+    return job_id
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_export_csv_streams_all_rows(api_client, api_base, finished_job) -> None:
+    resp = api_client.get(f"{api_base}/jobs/{finished_job}/export.csv")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert f'filename="job_{finished_job}.csv"' in resp.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(resp.content.decode("utf-8-sig"))))
+    assert len(rows) == N_ITEMS
+    # Diagnostics appear because of the last row, like the UI table.
+    assert list(rows[0]) == [
+        "status",
+        "timings",
+        "retry_count",
+        "error_code",
+        "error_message",
+        "http_status",
+        "title",
+        "timings.navigate",
+        "timings.snapshot",
+    ]
+    assert rows[3]["title"] == "Page 3"
+    assert rows[-1]["error_code"] == "TIMEOUT"
+    assert orjson.loads(rows[0]["timings"])["total"] == 0.8
+    assert rows[0]["timings.navigate"] == "0.5"
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_export_jsonl_one_stored_row_per_line(api_client, api_base, finished_job) -> None:
+    resp = api_client.get(f"{api_base}/jobs/{finished_job}/export.jsonl")
+
+    assert resp.status_code == 200
+    lines = [orjson.loads(x) for x in resp.content.splitlines()]
+    assert [r["idx"] for r in lines] == list(range(N_ITEMS))
+    assert lines[0]["input"]["url"] == "https://example.com/0"
+    assert lines[0]["output"]["title"] == "Page 0"
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_export_xlsx_written_in_constant_memory(api_client, api_base, finished_job) -> None:
+    resp = api_client.get(f"{api_base}/jobs/{finished_job}/export.xlsx")
+
+    assert resp.status_code == 200
+    assert f'filename="job_{finished_job}.xlsx"' in resp.headers["content-disposition"]
+    sheet = zipfile.ZipFile(io.BytesIO(resp.content)).read("xl/worksheets/sheet1.xml").decode()
+    # constant_memory writes inline strings; header row 2, data rows 3..N+2.
+    assert "<t>timings.navigate</t>" in sheet
+    assert "<t>Page 24</t>" in sheet
+    assert f'<row r="{N_ITEMS + 2}"' in sheet
+    assert "<autoFilter" in sheet
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_export_unknown_job_is_404(api_client, api_base) -> None:
+    for ext in ("xlsx", "csv", "jsonl"):
+        assert api_client.get(f"{api_base}/jobs/nope/export.{ext}").status_code == 404
+
+
+@pytest.fixture
+def done_job(finished_job, tmp_path, monkeypatch: pytest.MonkeyPatch):
+    # WHY: Point the export cache at tmp and mark the job final, as the worker would.
+    from datetime import UTC, datetime
+
+    from engine.core.config.envkeys import REPORTS_DIR
+    from service.app.deps import get_session_factory, reset_settings_cache
+    from service.db.models import Job
+
+    monkeypatch.setenv(REPORTS_DIR, str(tmp_path / "reports"))
+    reset_settings_cache()
+    factory = get_session_factory()
+    assert factory is not None
+    with factory() as db:
+        job = db.get(Job, finished_job)
+        assert job is not None
+        job.status = "FAILED"
+        job.finished_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+        db.commit()
+    return finished_job, tmp_path / "reports" / "exports" / finished_job
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_finished_job_export_is_cached_and_revalidated(api_client, api_base, done_job) -> None:
+    job_id, cache_dir = done_job
+    url = f"{api_base}/jobs/{job_id}/export.xlsx"
+
+    first = api_client.get(url)
+    etag = first.headers["etag"]
+
+    assert first.status_code == 200
+    assert first.headers["last-modified"] == "Fri, 02 Jan 2026 03:04:05 GMT"
+    assert [p.name for p in cache_dir.iterdir()] == [f"{etag.strip(chr(34))}.xlsx"]
+
+    again = api_client.get(url)
+    assert again.content == first.content
+    assert again.headers["etag"] == etag
+
+    assert api_client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    assert api_client.get(url, headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+    assert api_client.get(url, headers={"If-None-Match": '"other"'}).status_code == 200
+    since = {"If-Modified-Since": "Fri, 02 Jan 2026 03:04:05 GMT"}
+    assert api_client.get(url, headers=since).status_code == 304
+    older = {"If-Modified-Since": "Thu, 01 Jan 2026 00:00:00 GMT"}
+    assert api_client.get(url, headers=older).status_code == 200
+
+    # Other formats get their own entries and ETags.
+    csv_resp = api_client.get(f"{api_base}/jobs/{job_id}/export.csv")
+    assert csv_resp.headers["etag"] != etag
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_expired_cache_entry_is_still_served(
+    api_client, api_base, done_job, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import os
+    import time
+
+    from service.app.exporters import export_cache
+
+    job_id, cache_dir = done_job
+    url = f"{api_base}/jobs/{job_id}/export.csv"
+    first = api_client.get(url)
+    (entry,) = cache_dir.iterdir()
+    past = time.time() - 30 * 86400
+    os.utime(entry, (past, past))
+    # WHY: A fresh process prunes on its first export request.
+    monkeypatch.setattr(export_cache, "_last_prune", 0.0)
+
+    again = api_client.get(url)
+
+    assert again.status_code == 200
+    assert again.content == first.content
+    assert entry.exists()
+    assert entry.stat().st_mtime > past  # served entries restart their TTL
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_running_job_export_is_not_cached(api_client, api_base, finished_job) -> None:
+    resp = api_client.get(f"{api_base}/jobs/{finished_job}/export.csv")
+
+    assert resp.status_code == 200
+    assert "etag" not in resp.headers
+    assert resp.headers["cache-control"] == "no-store"
+
+
+@pytest.mark.integration
+def test_prune_exports_drops_entries_past_ttl(tmp_path) -> None:
+    import os
+    import time
+
+    from service.app.exporters.export_cache import prune_exports
+
+    old_dir, fresh_dir = tmp_path / "job-old", tmp_path / "job-new"
+    old_dir.mkdir()
+    fresh_dir.mkdir()
+    (old_dir / "a.xlsx").write_bytes(b"x")
+    (fresh_dir / "b.xlsx").write_bytes(b"x")
+    past = time.time() - 8 * 86400
+    os.utime(old_dir / "a.xlsx", (past, past))
+
+    assert prune_exports(tmp_path, ttl_days=7) == 1
+    assert not old_dir.exists()
+    assert (fresh_dir / "b.xlsx").exists()
+    assert prune_exports(tmp_path, ttl_days=0) == 0
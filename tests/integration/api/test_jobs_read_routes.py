@@ -0,0 +1,233 @@
+# root/tests/integration/api/test_jobs_read_routes.py
+"""API: read routes served from the async session."""
+# Why: read-heavy polling endpoints moved to AsyncSession; keep their contracts.
+
+from __future__ import annotations
+
+import pytest
+
+from engine.core.constants.flows import FlowType
+
+
+@pytest.fixture
+def created_job(api_client, api_base, monkeypatch: pytest.MonkeyPatch) -> str:
+    # WHY: Claim the job without launching a real worker subprocess.
+    monkeypatch.setattr("service.executor.scheduler._spawn_worker", lambda job_id: 4242)
+    payload = {
+        "flow_type": FlowType.CRAWL_SIMPLE.value,
+        "items": [{"url": "https://example.com/a"}, {"url": "https://example.com/b"}],
+        "options": {},
+    }
+    resp = api_client.post(f"{api_base}/jobs", json=payload)
+    assert resp.status_code == 201
+    return str(resp.json()["job_id"])
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_job_meta_items_and_history(api_client, api_base, created_job) -> None:
+    meta = api_client.get(f"{api_base}/jobs/{created_job}")
+    items = api_client.get(f"{api_base}/jobs/{created_job}/items")
+    listing = api_client.get(f"{api_base}/jobs", params={"page_size": 5})
+    history = api_client.get(f"{api_base}/history", params={"limit": 5})
+
+    assert meta.status_code == 200
+    assert meta.json()["counts"] == {"done": 0, "failed": 0, "cancelled": 0}
+    assert [i["idx"] for i in items.json()["items"]] == [0, 1]
+    assert created_job in [j["id"] for j in listing.json()["items"]]
+    assert created_job in [j["id"] for j in history.json()["items"]]
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_job_pages_render_from_async_session(api_client, created_job) -> None:
+    page = api_client.get(f"/jobs/{created_job}")
+    partial = api_client.get(f"/jobs/{created_job}/items")
+
+    assert page.status_code == 200
+    assert created_job in page.text
+    assert partial.status_code == 200
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_unknown_job_is_404(api_client, api_base) -> None:
+    assert api_client.get(f"{api_base}/jobs/nope").status_code == 404
+    assert api_client.get(f"{api_base}/jobs/nope/items").status_code == 404
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_history_cursor_walks_every_job_once(api_client, api_base, monkeypatch) -> None:
+    monkeypatch.setattr("service.executor.scheduler._spawn_worker", lambda job_id: 4242)
+    created = {
+        api_client.post(
+            f"{api_base}/jobs",
+            json={"flow_type": FlowType.CRAWL_SIMPLE.value, "items": [{"url": "https://e.x"}]},
+        ).json()["job_id"]
+        for _ in range(5)
+    }
+
+    seen: list[str] = []
+    cursor = None
+    for _ in range(10):
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        body = api_client.get(f"{api_base}/history", params=params).json()
+        seen += [j["id"] for j in body["items"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(seen) == sorted(created)
+    listing = api_client.get(f"{api_base}/jobs", params={"page_size": 5}).json()
+    assert listing["next_cursor"] is None
+    assert api_client.get(f"{api_base}/history", params={"cursor": "!!"}).status_code == 400
+    for path in ("history", "jobs"):
+        legacy = api_client.get(f"{api_base}/{path}", params={"page": 2})
+        assert legacy.status_code == 400
+        assert legacy.json()["detail"] == "page_removed_use_cursor"
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_job_summary_counts_and_cancel_invalidates(api_client, api_base, created_job) -> None:
+    before = api_client.get(f"{api_base}/jobs/{created_job}/summary").json()
+    api_client.post(f"{api_base}/jobs/{created_job}/cancel")
+    after = api_client.get(f"{api_base}/jobs/{created_job}/summary").json()
+
+    assert before["total"] == 2
+    assert before["counts"]["pending"] == 2
+    assert after["status"] == "CANCELLED"
+    assert after["counts"]["cancelled"] == 2
+    assert api_client.get(f"{api_base}/jobs/nope/summary").status_code == 404
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_items_delta_sends_only_changed_rows(api_client, api_base, created_job) -> None:
+    full = api_client.get(f"/jobs/{created_job}/items").text
+    idle = api_client.get(f"/jobs/{created_job}/items/delta", params={"since": 0, "cols": "status"})
+    api_client.post(f"{api_base}/jobs/{created_job}/cancel")
+    # Cancelled rows need the diagnostics columns -> whole table out-of-band.
+    grown = api_client.get(
+        f"/jobs/{created_job}/items/delta", params={"since": 0, "cols": "status"}
+    )
+    cols = "status,timings,retry_count,error_code,error_message"
+    rows = api_client.get(f"/jobs/{created_job}/items/delta", params={"since": 0, "cols": cols})
+    # Claim bumped the version to 1, cancel to 2.
+    none_left = api_client.get(
+        f"/jobs/{created_job}/items/delta", params={"since": 2, "cols": cols}
+    )
+
+    assert 'id="items_poller" hx-swap-oob="true"' in full
+    assert "item-row-" not in idle.text
+    assert 'id="items_host" hx-swap-oob="true"' in grown.text
+    assert rows.text.count('hx-swap-oob="true"') == 2
+    assert 'id="item-row-1"' in rows.text
+    assert "item-row-" not in none_left.text
+    assert "hx-get" not in none_left.text  # job finished: poller goes inert
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_job_events_stream_until_job_finished(api_client, api_base, created_job) -> None:
+    import threading
+
+    from sqlalchemy import update
+
+    from service.app.deps import get_session_factory
+    from service.db.models import Job, JobItem
+
+    def _finish() -> None:
+        # WHY: Stand-in for the worker: persist one result and close the job
+        # (version 1 is the scheduler's claim).
+        factory = get_session_factory()
+        assert factory is not None
+        with factory() as db:
+            db.execute(update(Job).where(Job.id == created_job).values(version=2, status="DONE"))
+            db.execute(
+                update(JobItem)
+                .where(JobItem.job_id == created_job, JobItem.idx == 0)
+                .values(version=2, status="DONE")
+            )
+            db.commit()
+
+    # WHY: TestClient buffers the whole body, so the "worker" must act on its own thread.
+    threading.Timer(0.3, _finish).start()
+    resp = api_client.get(f"{api_base}/jobs/{created_job}/events")
+    frames = [ln.removeprefix("event: ") for ln in resp.text.splitlines() if ln.startswith("event")]
+
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert frames == ["snapshot", "ItemFinished", "JobFinished"]
+    done = api_client.get(f"{api_base}/jobs/{created_job}/events")
+    assert done.text.count("event: ") == 1  # finished job: snapshot only
+    assert api_client.get(f"{api_base}/jobs/nope/events").status_code == 404
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_job_reads_revalidate_by_version_etag(api_client, api_base, created_job) -> None:
+    urls = [
+        f"{api_base}/jobs/{created_job}",
+        f"{api_base}/jobs/{created_job}/items",
+        f"/jobs/{created_job}/items",
+        f"/jobs/{created_job}/items/delta?since=1&cols=status",
+    ]
+    first = {u: api_client.get(u) for u in urls}
+    tags = {u: r.headers["etag"] for u, r in first.items()}
+
+    for u, r in first.items():
+        assert r.status_code == 200
+        assert tags[u].startswith('W/"')
+        assert r.headers["cache-control"] == "private, no-cache"
+        idle = api_client.get(u, headers={"If-None-Match": tags[u]})
+        assert idle.status_code == 304
+        assert idle.content == b""
+        assert idle.headers["etag"] == tags[u]
+    assert len(set(tags.values())) == len(urls)  # one tag per view
+
+    # Strong form of the same tag still matches (weak comparison).
+    strong = tags[urls[0]].removeprefix("W/")
+    assert api_client.get(urls[0], headers={"If-None-Match": strong}).status_code == 304
+
+    api_client.post(f"{api_base}/jobs/{created_job}/cancel")  # status + item write
+    for u in urls:
+        changed = api_client.get(u, headers={"If-None-Match": tags[u]})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != tags[u]
+    meta = api_client.get(urls[0], headers={"If-None-Match": tags[urls[0]]})
+    assert meta.json()["status"] == "CANCELLED"
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_items_fields_status_and_pages(api_client, api_base, created_job) -> None:
+    from service.app.deps import get_session_factory
+    from service.db.models import JobItem
+
+    factory = get_session_factory()
+    assert factory is not None
+    with factory() as db:
+        for item in db.query(JobItem).filter(JobItem.job_id == created_job):
+            item.status = "FAILED" if item.idx else "DONE"
+            item.output = {"title": f"T{item.idx}", "meta_tags": {"og:x": "big"}}
+        db.commit()
+    url = f"{api_base}/jobs/{created_job}/items"
+
+    slim = api_client.get(url, params={"fields": "status,output.title"}).json()
+    failed = api_client.get(url, params={"status": "FAILED", "fields": "idx"}).json()
+    first = api_client.get(url, params={"limit": 1, "fields": "status"}).json()
+    rest = api_client.get(
+        url, params={"limit": 1, "fields": "status", "after_idx": first["next_after_idx"]}
+    ).json()
+
+    assert slim["items"][1] == {"idx": 1, "status": "FAILED", "output": {"title": "T1"}}
+    assert failed["items"] == [{"idx": 1}]
+    assert [i["idx"] for i in first["items"]] == [0]
+    assert first["next_after_idx"] == 0
+    assert [i["idx"] for i in rest["items"]] == [1]
+    assert rest["next_after_idx"] is None
+    full = api_client.get(url).json()["items"][0]
+    assert set(full) >= {"id", "input", "output", "timings", "extras", "finished_at"}
+    assert api_client.get(url, params={"fields": "status,secret"}).status_code == 400
+    assert api_client.get(url, params={"status": "NOPE"}).status_code == 400
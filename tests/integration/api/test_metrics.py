@@ -0,0 +1,62 @@
+# root/tests/integration/api/test_metrics.py
+"""API: /metrics exposes DB queue gauges and merges worker-process metrics."""
+# Why: workers are separate processes; their counters only reach Prometheus through the API.
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from engine.core.constants.flows import FlowType
+from service.app.api.v1.metrics import MULTIPROC_ENV
+
+
+@pytest.fixture
+def running_job(api_client, api_base, monkeypatch: pytest.MonkeyPatch) -> None:
+    # WHY: Claim the job without launching a real worker subprocess.
+    monkeypatch.setattr("service.executor.scheduler._spawn_worker", lambda job_id: 4242)
+    payload = {"flow_type": FlowType.CRAWL_SIMPLE.value, "items": [{"url": "https://e.com"}]}
+    assert api_client.post(f"{api_base}/jobs", json=payload).status_code == 201
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_metrics_reports_job_gauges_from_db(api_client, api_base, running_job) -> None:
+    body = api_client.get(f"{api_base}/metrics").text
+
+    assert 'autosuite_jobs_active{status="RUNNING"} 1.0' in body
+    assert 'autosuite_jobs_active{status="PENDING"} 0.0' in body
+
+
+@pytest.mark.integration
+@pytest.mark.api
+def test_metrics_merges_worker_processes(
+    api_client, api_base, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mp_dir = tmp_path / "prom"
+    mp_dir.mkdir()
+    # WHY: A real second process writes its samples the way a job worker would.
+    worker = (
+        "from prometheus_client import Counter;"
+        "Counter('autosuite_test_worker_items', 'x', ['status']).labels(status='DONE').inc(3)"
+    )
+    for _ in range(2):  # spawn mode: one short-lived process per job
+        subprocess.run(  # noqa: S603 - fixed interpreter + inline script
+            [sys.executable, "-c", worker],
+            check=True,
+            env={MULTIPROC_ENV: str(mp_dir)},
+            timeout=60,
+        )
+    monkeypatch.setenv(MULTIPROC_ENV, str(mp_dir))
+
+    body = api_client.get(f"{api_base}/metrics").text
+    again = api_client.get(f"{api_base}/metrics").text
+
+    assert 'autosuite_test_worker_items_total{status="DONE"} 6.0' in body
+    assert 'autosuite_test_worker_items_total{status="DONE"} 6.0' in again
+    assert "autosuite_jobs_active{" in body
+    # Dead workers' files were folded into one archive instead of piling up.
+    assert sorted(p.name for p in mp_dir.glob("counter_*.db")) == ["counter_archive.db"]
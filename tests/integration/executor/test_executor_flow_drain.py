@@ -10,7 +10,8 @@ from sqlalchemy.orm import Session
 from engine.core.constants.statuses import ItemStatus, JobStatus
 from engine.core.models.item_result import ItemResult
 from service.db.models import Job, JobItem
-from service.executor import scheduler, worker
+from service.executor import scheduler
+from service.executor.result_sink import finalize_job, load_item_ids, write_results
 
 pytestmark = pytest.mark.integration
 
@@ -26,6 +27,15 @@ def _item_result(status: ItemStatus, extras: dict | None = None) -> ItemResult:
     )
 
 
+def _finish(db: Session, job_id: str, results: list[ItemResult]) -> None:
+    """What the worker's ResultSink + finalize_job leave behind for a finished job."""
+    now = datetime.now(UTC)
+    write_results(
+        db, job_id, [(i, r, now) for i, r in enumerate(results)], load_item_ids(db, job_id)
+    )
+    finalize_job(db, job_id, len(results))
+
+
 def test_scheduler_worker_drain_queue(
     db_session: Session,
     make_job,
@@ -59,11 +69,7 @@ def test_scheduler_worker_drain_queue(
     first_job = db_session.query(Job).filter(Job.id == job1.id).one()
     assert first_job.status == str(JobStatus.RUNNING)
 
-    worker._persist_results(
-        db_session,
-        job1.id,
-        [_item_result(ItemStatus.DONE)],
-    )
+    _finish(db_session, job1.id, [_item_result(ItemStatus.DONE)])
     db_session.expire_all()
 
     scheduler.schedule_jobs(db_session)
@@ -72,11 +78,7 @@ def test_scheduler_worker_drain_queue(
     second_job = db_session.query(Job).filter(Job.id == job2.id).one()
     assert second_job.status == str(JobStatus.RUNNING)
 
-    worker._persist_results(
-        db_session,
-        job2.id,
-        [_item_result(ItemStatus.DONE)],
-    )
+    _finish(db_session, job2.id, [_item_result(ItemStatus.DONE)])
     db_session.expire_all()
 
     final_jobs = db_session.query(Job).order_by(Job.id.asc()).all()
@@ -49,3 +49,29 @@ def test_reconcile_marks_orphans_failed(
 
     completed_item = db_session.query(JobItem).filter(JobItem.id == done_item.id).one()
     assert completed_item.status == str(ItemStatus.DONE)
+
+
+def test_reconcile_requeues_orphans_when_resume_enabled(
+    db_session: Session,
+    make_job,
+    make_item,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class _Settings:
+        executor_resume = True
+
+    monkeypatch.setattr(scheduler, "get_settings", lambda: _Settings())
+    job = make_job(db_session, "job-resume", JobStatus.RUNNING)
+    db_session.query(Job).filter(Job.id == job.id).update({"worker_pid": 4242})
+    make_item(db_session, job.id, "item-1", 0, ItemStatus.PENDING)
+    db_session.commit()
+
+    scheduler.reconcile_stale_jobs(db_session)
+
+    refreshed = db_session.query(Job).filter(Job.id == job.id).one()
+    assert refreshed.status == str(JobStatus.PENDING)
+    assert refreshed.worker_pid is None
+    # WHY: Unfinished items must stay runnable; nothing is cancelled on requeue.
+    item = db_session.query(JobItem).filter(JobItem.id == "item-1").one()
+    assert item.status == str(ItemStatus.PENDING)
+    assert item.error_code is None
@@ -36,14 +36,14 @@ def test_worker_main_handles_run_job_failure(
     def _schedule(db):
         schedule_calls.append(db.query(Job).count())
 
-    def _run_job(*_) -> None:
+    def _run_job(*_, **__) -> None:
         # WHY: Force worker into failure branch to assert retry + cleanup behaviour.
         raise RuntimeError("engine down")
 
     monkeypatch.setattr(worker, "init_db", _init_db_stub)
     monkeypatch.setattr(worker, "get_session_factory", _get_factory)
     monkeypatch.setattr(worker, "run_job", _run_job)
-    monkeypatch.setattr(worker, "schedule_jobs", _schedule)
+    monkeypatch.setattr(worker, "request_schedule", _schedule)
     monkeypatch.setattr(sys, "argv", ["worker", "--job-id", "job-fail"])
 
     worker.main()
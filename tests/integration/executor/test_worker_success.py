@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import io
 import sys
+import threading
 from datetime import UTC, datetime
 from typing import Any
 
@@ -12,6 +14,7 @@ from engine.core.constants.statuses import ItemStatus, JobStatus
 from engine.core.models.item_result import ItemResult
 from service.db.models import Job, JobItem
 from service.executor import worker
+from service.executor.pool import DONE_MARK
 
 pytestmark = pytest.mark.integration
 
@@ -48,7 +51,7 @@ def test_worker_main_persists_success(
     def _get_factory():
         return session_factory
 
-    def _run_job(flow, items, options):  # noqa: ANN001 - signature mirrors real function
+    def _run_job(flow, items, options, **_):  # noqa: ANN001, ANN003 - mirrors real function
         # WHY: Exercise happy-path persistence with multiple DONE results.
         return [
             _make_result(ItemStatus.DONE, {"idx": 0}),
@@ -61,7 +64,7 @@ def test_worker_main_persists_success(
     monkeypatch.setattr(worker, "init_db", _init_db_stub)
     monkeypatch.setattr(worker, "get_session_factory", _get_factory)
     monkeypatch.setattr(worker, "run_job", _run_job)
-    monkeypatch.setattr(worker, "schedule_jobs", _schedule)
+    monkeypatch.setattr(worker, "request_schedule", _schedule)
 
     monkeypatch.setenv("PYTHONPATH", "")
     monkeypatch.setattr(sys, "argv", ["worker", "--job-id", "job-success"])
@@ -86,3 +89,95 @@ def test_worker_main_persists_success(
     assert items[1].output == {"idx": 1}
     assert len(schedule_calls) == 1  # worker should trigger scheduler tick
     check_session.close()
+
+
+def test_worker_serve_runs_each_stdin_job_and_reports_done(
+    session_factory,
+    make_job,
+    make_item,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    session = session_factory()
+    for job_id in ("job-p1", "job-p2"):
+        make_job(session, job_id, JobStatus.RUNNING, created_at=datetime.now(UTC))
+        make_item(session, job_id, f"{job_id}-item", 0, ItemStatus.PENDING)
+    session.close()
+
+    schedule_calls: list[Any] = []
+
+    second_started = threading.Event()
+
+    def _run_job(flow, items, options, **_):  # noqa: ANN001, ANN003 - mirrors real function
+        if options["job_id"] == "job-p2":
+            second_started.set()
+        return [_make_result(ItemStatus.DONE, {"job": options["job_id"]})]
+
+    prebuilt: list[tuple[str, bool]] = []
+
+    # WHY: p1's warm-up blocks until p2 runs; it only finishes in time off the stdin loop.
+    def _prebuild(factory, job_id, settings):  # noqa: ANN001 - mirrors real function
+        prebuilt.append((job_id, second_started.wait(timeout=5)))
+
+    monkeypatch.setattr(worker, "run_job", _run_job)
+    monkeypatch.setattr(worker, "request_schedule", schedule_calls.append)
+    monkeypatch.setattr(worker, "_prebuild_exports", _prebuild)
+    # WHY: Pool workers read job ids line by line until the parent closes stdin.
+    monkeypatch.setattr(sys, "stdin", io.StringIO("job-p1\n\njob-p2\n"))
+
+    worker._serve(session_factory)
+
+    out = capsys.readouterr().out
+    assert f"{DONE_MARK} job-p1" in out
+    assert f"{DONE_MARK} job-p2" in out
+    # The next job ran while the first job's exports were still building.
+    assert prebuilt == [("job-p1", True), ("job-p2", True)]
+    assert schedule_calls == []  # the parent reschedules in pool mode
+
+    check_session = session_factory()
+    statuses = {
+        j.id: j.status
+        for j in check_session.query(Job).filter(Job.id.in_(["job-p1", "job-p2"])).all()
+    }
+    assert statuses == {"job-p1": str(JobStatus.DONE), "job-p2": str(JobStatus.DONE)}
+    check_session.close()
+
+
+def test_worker_resumes_only_unfinished_items(
+    session_factory,
+    make_job,
+    make_item,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = session_factory()
+    make_job(session, "job-resume", JobStatus.RUNNING, created_at=datetime.now(UTC))
+    make_item(session, "job-resume", "r-0", 0, ItemStatus.PENDING)
+    make_item(session, "job-resume", "r-1", 1, ItemStatus.PENDING)
+    # WHY: idx 0 finished before the restart; its counter is already on the job row.
+    session.query(JobItem).filter(JobItem.id == "r-0").update(
+        {"status": str(ItemStatus.DONE), "output": {"idx": 0}, "finished_at": datetime.now(UTC)}
+    )
+    session.query(Job).filter(Job.id == "job-resume").update({"count_done": 1})
+    session.commit()
+    session.close()
+
+    seen: dict[str, Any] = {}
+
+    def _run_job(flow, items, options, *, on_result, completed):  # noqa: ANN001
+        seen["completed"] = dict(completed)
+        fresh = _make_result(ItemStatus.DONE, {"idx": 1})
+        on_result(1, fresh)
+        return [completed[0], fresh]
+
+    monkeypatch.setattr(worker, "run_job", _run_job)
+    monkeypatch.setattr(worker, "request_schedule", lambda db: None)
+
+    worker._execute_job(session_factory, "job-resume")
+
+    assert set(seen["completed"]) == {0}
+    assert seen["completed"][0].output == {"idx": 0}
+    check_session = session_factory()
+    row = check_session.query(Job).filter(Job.id == "job-resume").one()
+    assert row.status == str(JobStatus.DONE)
+    assert row.count_done == 2  # resumed item is not counted twice
+    check_session.close()
@@ -39,3 +39,24 @@ def test_run_item_returns_expected_snapshot(monkeypatch: pytest.MonkeyPatch) ->
     assert result.value["final_url"] == "https://example.com"
     assert result.value["meta_tags"]["og:title"] == "Example"
     assert result.timings["total"] >= 0
+
+
+class _FakeAsyncCommonPage:
+    def __init__(self, page: object) -> None:
+        self.page = page
+
+    async def navigate_and_collect(self, url: str) -> dict[str, object]:
+        return {"title": "Async", "final_url": url, "http_status": 200, "meta_tags": {}}
+
+
+def test_run_item_async_returns_expected_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    import asyncio
+
+    monkeypatch.setattr(crawl_run, "AsyncCommonPage", _FakeAsyncCommonPage)
+
+    payload = CrawlSimpleInput(url="https://example.com", meta={"job_id": "job-1"})
+    result = asyncio.run(crawl_run.run_item_async(payload, SimpleNamespace()))
+
+    assert result.ok is True
+    assert result.value["title"] == "Async"
+    assert result.value["meta"] == {"job_id": "job-1"}
@@ -0,0 +1,132 @@
+"""Unit tests for the loop-bound async browser pool."""
+
+# WHY: Fake async Playwright objects keep lease rules and loop binding testable without Chromium.
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from engine.automation.playwright.session import async_browser_pool, async_context_factory as acf
+from engine.automation.playwright.session.context_factory import FlowSessionSpec
+from engine.core.constants.session import SessionMode
+from engine.orchestration import async_runner
+
+pytestmark = pytest.mark.unit
+
+
+class _Context:
+    def __init__(self, closed: list[str]) -> None:
+        self.closed = closed
+
+    async def close(self) -> None:
+        self.closed.append("ctx")
+
+
+class _Browser:
+    def __init__(self, closed: list[str]) -> None:
+        self.closed = closed
+        self.connected = True
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def new_context(self, **kwargs: Any) -> _Context:
+        return _Context(self.closed)
+
+    async def close(self) -> None:
+        self.closed.append("browser")
+
+
+@pytest.fixture
+def launches(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    state = SimpleNamespace(browsers=[], closed=[])
+
+    async def _launch(*, headless: bool) -> _Browser:
+        state.browsers.append(_Browser(state.closed))
+        return state.browsers[-1]
+
+    async def _stop() -> None:
+        state.closed.append("pw")
+
+    pw = SimpleNamespace(chromium=SimpleNamespace(launch=_launch), stop=_stop)
+
+    async def _start() -> SimpleNamespace:
+        return pw
+
+    monkeypatch.setattr(
+        async_browser_pool, "async_playwright", lambda: SimpleNamespace(start=_start)
+    )
+    monkeypatch.setattr(acf, "make_seed", lambda seed=None: {})
+    yield state
+    if async_browser_pool._POOL is not None:
+        atexit.unregister(async_browser_pool._POOL.close)
+        async_browser_pool._POOL = None
+
+
+def test_lease_release_reuses_browser_on_the_same_loop(launches: SimpleNamespace) -> None:
+    async def _scenario() -> dict[str, float]:
+        pool = async_browser_pool.AsyncBrowserPool(max_age_s=60, max_jobs=10)
+        first = await pool.lease(headless=True)
+        await pool.release(first)
+        second = await pool.lease(headless=True)
+        assert second is first
+        launches.browsers[0].connected = False
+        await pool.release(second)  # disconnected -> retired, not kept
+        return pool.stats()
+
+    stats = asyncio.run(_scenario())
+
+    assert len(launches.browsers) == 1
+    assert (stats["hits"], stats["misses"], stats["recycled"], stats["idle"]) == (1, 1, 1, 0)
+    assert launches.closed == ["browser"]
+
+
+def test_pool_is_not_served_to_another_loop(launches: SimpleNamespace) -> None:
+    async def _get() -> object:
+        return async_browser_pool.get_async_browser_pool()
+
+    runner = asyncio.Runner()
+    try:
+        owner = runner.run(_get())
+        assert owner is not None
+        with asyncio.Runner() as other:
+            assert other.run(_get()) is None
+        assert runner.run(_get()) is owner
+    finally:
+        runner.close()
+
+
+def test_pooled_bundles_share_one_browser_across_jobs_on_the_job_loop(
+    launches: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # WHY: A private Runner stands in for the worker's long-lived loop without leaking into atexit.
+    monkeypatch.setattr(async_runner, "_JOB_RUNNER", asyncio.Runner())
+    monkeypatch.setattr(async_runner, "_JOB_RUNNER_THREAD", threading.get_ident())
+    spec = FlowSessionSpec(mode=SessionMode.NON_AUTH, secret_names=[], page_reuse=False)
+    opts = {"max_age_s": 60, "max_jobs": 10}
+
+    async def _job() -> list:
+        bundle = await acf.build_session_bundle_async(headless=True, spec=spec, pool=opts)
+        assert bundle.lease is not None
+        await acf.close_bundle_async(bundle)
+        return []
+
+    async def _reset() -> list:
+        await async_browser_pool.reset_async_browser_pool()
+        return []
+
+    try:
+        for _ in range(3):
+            async_runner.run_on_job_loop(_job(), keep_loop=True)
+        assert len(launches.browsers) == 1
+        assert launches.closed == ["ctx", "ctx", "ctx"]
+        async_runner.run_on_job_loop(_reset(), keep_loop=True)
+        assert launches.closed[-2:] == ["browser", "pw"]
+    finally:
+        async_runner._JOB_RUNNER.close()
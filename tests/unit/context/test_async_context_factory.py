@@ -0,0 +1,102 @@
+"""Unit tests for the async Playwright session factory."""
+
+# WHY: Async bundle must mirror the sync one without launching a real browser.
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from engine.automation.playwright.session import async_context_factory as acf
+from engine.automation.playwright.session.context_factory import FlowSessionSpec
+from engine.core.constants.session import SessionMode
+
+pytestmark = pytest.mark.unit
+
+
+class _FakeContext:
+    def __init__(self, events: list[str]) -> None:
+        self.events = events
+        self.kwargs: dict[str, Any] = {}
+        self.cookies: list[dict[str, Any]] = []
+
+    async def new_page(self) -> str:
+        self.events.append("new_page")
+        return f"page-{len(self.events)}"
+
+    async def add_cookies(self, cookies: list[dict[str, Any]]) -> None:
+        self.cookies.extend(cookies)
+
+    async def close(self) -> None:
+        self.events.append("context_close")
+
+
+class _FakeBrowser:
+    def __init__(self, events: list[str]) -> None:
+        self.events = events
+        self.context = _FakeContext(events)
+
+    async def new_context(self, **kwargs: Any) -> _FakeContext:
+        self.context.kwargs = kwargs
+        return self.context
+
+    async def close(self) -> None:
+        self.events.append("browser_close")
+
+
+class _FakePlaywright:
+    def __init__(self, events: list[str]) -> None:
+        self.events = events
+        self.browser = _FakeBrowser(events)
+        outer = self
+
+        class _Chromium:
+            async def launch(self, *, headless: bool) -> _FakeBrowser:
+                outer.events.append(f"launch:{headless}")
+                return outer.browser
+
+        self.chromium = _Chromium()
+
+    async def stop(self) -> None:
+        self.events.append("pw_stop")
+
+
+def test_async_bundle_lifecycle(monkeypatch: pytest.MonkeyPatch) -> None:
+    events: list[str] = []
+    fake_pw = _FakePlaywright(events)
+
+    class _Starter:
+        async def start(self) -> _FakePlaywright:
+            return fake_pw
+
+    monkeypatch.setattr(acf, "async_playwright", lambda: _Starter())
+    monkeypatch.setattr(acf, "make_seed", lambda seed=None: {"user_agent": "ua"})
+    monkeypatch.setattr(
+        acf.injectors, "load_cookie_files", lambda names: [{"name": "sid", "value": "1"}]
+    )
+
+    spec = FlowSessionSpec(mode=SessionMode.COOKIES_AUTH, secret_names=["demo"], page_reuse=False)
+
+    async def _scenario() -> None:
+        bundle = await acf.build_session_bundle_async(headless=True, spec=spec)
+        first = await acf.ensure_page_async(bundle, reuse=True)
+        again = await acf.ensure_page_async(bundle, reuse=True)
+        fresh = await acf.ensure_page_async(bundle, reuse=False)
+        assert first == again
+        assert fresh != first
+        assert bundle.context.kwargs["user_agent"] == "ua"
+        assert bundle.context.cookies == [{"name": "sid", "value": "1"}]
+        await acf.close_bundle_async(bundle)
+
+    asyncio.run(_scenario())
+
+    assert events == [
+        "launch:True",
+        "new_page",
+        "new_page",
+        "context_close",
+        "browser_close",
+        "pw_stop",
+    ]
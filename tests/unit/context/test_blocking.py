@@ -0,0 +1,130 @@
+# tests/unit/context/test_blocking.py
+
+"""Unit tests for per-page request blocking."""
+# WHY: Route handlers only run inside a browser; fakes drive them directly.
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from engine.automation.playwright.session import context_factory as cf
+from engine.automation.playwright.session.blocking import (
+    BlockPolicy,
+    effective_policy,
+    install_blocking,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class _FakeRoute:
+    def __init__(self) -> None:
+        self.outcome: str | None = None
+
+    def continue_(self) -> None:
+        self.outcome = "continue"
+
+    def abort(self, reason: str) -> None:
+        self.outcome = f"abort:{reason}"
+
+
+class _FakePage:
+    # WHY: Record the handlers Playwright would call so tests can fire them.
+    def __init__(self) -> None:
+        self.route_handler: Any = None
+        self.listeners: dict[str, Any] = {}
+
+    def route(self, pattern: str, handler: Any) -> None:
+        assert pattern == "**/*"
+        self.route_handler = handler
+
+    def on(self, event: str, handler: Any) -> None:
+        self.listeners[event] = handler
+
+    def request(self, url: str, rtype: str) -> str | None:
+        route = _FakeRoute()
+        self.route_handler(route, SimpleNamespace(url=url, resource_type=rtype))
+        return route.outcome
+
+    def respond(self, length: str | None) -> None:
+        headers = {} if length is None else {"content-length": length}
+        self.listeners["response"](SimpleNamespace(headers=headers))
+
+
+POLICY = BlockPolicy(
+    resource_types=frozenset({"image", "font"}),
+    url_patterns=("*://*.google-analytics.com/*",),
+)
+
+
+def test_blocks_by_type_and_url_glob() -> None:
+    page = _FakePage()
+    stats = install_blocking(page, POLICY)
+
+    assert page.request("https://shop.test/logo.png", "image") == "abort:blockedbyclient"
+    assert page.request("https://shop.test/a.woff2", "font") == "abort:blockedbyclient"
+    assert (
+        page.request("https://www.google-analytics.com/collect", "xhr") == "abort:blockedbyclient"
+    )
+    assert page.request("https://shop.test/", "document") == "continue"
+    assert page.request("https://shop.test/app.js", "script") == "continue"
+
+    page.respond("1200")
+    page.respond(None)
+    page.respond("garbage")
+
+    assert stats.drain() == {
+        "requests": 3,
+        "bytes": 1200,
+        "blocked": 3,
+        "blocked_by_type": {"image": 1, "font": 1, "url": 1},
+    }
+    assert stats.drain() == {"requests": 0, "bytes": 0, "blocked": 0, "blocked_by_type": {}}
+
+
+def test_effective_policy_kill_switch_and_empty() -> None:
+    on = SimpleNamespace(pw_block_resources=True)
+    off = SimpleNamespace(pw_block_resources=False)
+
+    assert effective_policy(POLICY, on) is POLICY
+    assert effective_policy(POLICY, off) is None
+    assert effective_policy(BlockPolicy(), on) is None
+    assert effective_policy(None, on) is None
+
+
+def test_ensure_page_installs_blocking_and_stats_follow_reuse() -> None:
+    pages: list[_FakePage] = []
+
+    class _Ctx:
+        def new_page(self) -> _FakePage:
+            pages.append(_FakePage())
+            return pages[-1]
+
+    bundle = cf.SessionBundle(pw=None, browser=None, context=_Ctx(), blocking=POLICY)
+
+    page = cf.ensure_page(bundle, reuse=True)
+    page.request("https://shop.test/x.png", "image")
+    assert cf.take_network_stats(bundle, page, keep=True)["blocked"] == 1
+    # Reused page keeps its counters installed, freshly reset for the next item.
+    assert cf.take_network_stats(bundle, page, keep=True)["blocked"] == 0
+
+    fresh = cf.ensure_page(bundle, reuse=False)
+    assert fresh is not page
+    assert fresh.route_handler is not None
+    assert cf.take_network_stats(bundle, fresh) is not None
+    assert cf.take_network_stats(bundle, fresh) is None
+
+
+def test_ensure_page_without_policy_does_not_route() -> None:
+    class _Ctx:
+        def new_page(self) -> _FakePage:
+            return _FakePage()
+
+    bundle = cf.SessionBundle(pw=None, browser=None, context=_Ctx())
+    page = cf.ensure_page(bundle, reuse=False)
+
+    assert page.route_handler is None
+    assert cf.take_network_stats(bundle, page) is None
@@ -0,0 +1,145 @@
+"""Unit tests for the warm browser pool."""
+
+# WHY: Fake Playwright objects keep lease/recycle rules testable without Chromium.
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from engine.automation.playwright.session import browser_pool, context_factory
+from engine.automation.playwright.session.browser_pool import BrowserPool
+from engine.automation.playwright.session.context_factory import FlowSessionSpec
+from engine.core.constants.session import SessionMode
+
+pytestmark = pytest.mark.unit
+
+
+class _Browser:
+    def __init__(self) -> None:
+        self.connected = True
+        self.closed = False
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def launches(monkeypatch: pytest.MonkeyPatch) -> list[_Browser]:
+    launched: list[_Browser] = []
+
+    def _launch(*, headless: bool) -> _Browser:
+        launched.append(_Browser())
+        return launched[-1]
+
+    pw = SimpleNamespace(chromium=SimpleNamespace(launch=_launch), stop=lambda: None)
+    monkeypatch.setattr(browser_pool, "sync_playwright", lambda: SimpleNamespace(start=lambda: pw))
+    yield launched
+    browser_pool.reset_browser_pool()
+
+
+def test_release_then_lease_reuses_browser(launches: list[_Browser]) -> None:
+    pool = BrowserPool(max_age_s=60, max_jobs=10)
+
+    first = pool.lease(headless=True)
+    pool.release(first)
+    second = pool.lease(headless=True)
+
+    assert second is first
+    assert len(launches) == 1
+    assert pool.stats()["hits"] == 1
+    assert pool.stats()["misses"] == 1
+
+
+def test_pool_is_keyed_by_launch_options(launches: list[_Browser]) -> None:
+    pool = BrowserPool(max_age_s=60, max_jobs=10)
+    pool.release(pool.lease(headless=True))
+
+    pool.lease(headless=False)
+
+    assert len(launches) == 2
+
+
+def test_recycles_on_max_jobs_and_disconnect(launches: list[_Browser]) -> None:
+    pool = BrowserPool(max_age_s=60, max_jobs=2)
+    lease = pool.lease(headless=True)
+    pool.release(lease)
+    lease = pool.lease(headless=True)  # second job hits the cap on release
+    pool.release(lease)
+    assert launches[0].closed is True
+
+    fresh = pool.lease(headless=True)
+    pool.release(fresh)
+    launches[1].connected = False
+    pool.lease(headless=True)
+
+    assert len(launches) == 3
+    assert pool.stats()["recycled"] == 2
+
+
+def test_get_browser_pool_is_per_thread(launches: list[_Browser]) -> None:
+    mine = browser_pool.get_browser_pool()
+    assert browser_pool.get_browser_pool() is mine
+    seen: list[object] = []
+
+    def _lane() -> None:
+        seen.extend([browser_pool.get_browser_pool(), browser_pool.get_browser_pool()])
+
+    t = threading.Thread(target=_lane)
+    t.start()
+    t.join()
+    assert seen[0] is seen[1]  # a lane thread keeps its own pool
+    assert seen[0] is not mine
+
+
+def test_pooled_bundle_closes_context_and_keeps_browser(
+    launches: list[_Browser], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    closed: list[str] = []
+    ctx = SimpleNamespace(close=lambda: closed.append("ctx"))
+    monkeypatch.setattr(context_factory.policy, "create_context", lambda b, p: ctx)
+    spec = FlowSessionSpec(mode=SessionMode.NON_AUTH, secret_names=[], page_reuse=False)
+    opts = {"max_age_s": 60, "max_jobs": 10}
+
+    for _ in range(3):
+        bundle = context_factory.build_session_bundle(headless=True, spec=spec, pool=opts)
+        assert bundle.lease is not None
+        context_factory.close_bundle(bundle)
+
+    assert len(launches) == 1
+    assert launches[0].closed is False
+    assert closed == ["ctx", "ctx", "ctx"]
+
+
+def test_failed_context_close_retires_pooled_browser(
+    launches: list[_Browser], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _close() -> None:
+        raise RuntimeError("target closed")
+
+    ctx = SimpleNamespace(close=_close)
+    monkeypatch.setattr(context_factory.policy, "create_context", lambda b, p: ctx)
+    spec = FlowSessionSpec(mode=SessionMode.NON_AUTH, secret_names=[], page_reuse=False)
+    opts = {"max_age_s": 60, "max_jobs": 10}
+
+    context_factory.close_bundle(
+        context_factory.build_session_bundle(headless=True, spec=spec, pool=opts)
+    )
+
+    assert launches[0].closed is True  # released as unhealthy, not kept warm
+    assert browser_pool.get_browser_pool().stats()["idle"] == 0
+
+
+def test_browser_pool_options_respects_flag() -> None:
+    assert browser_pool.browser_pool_options(SimpleNamespace(pw_browser_pool=False)) is None
+    opts = browser_pool.browser_pool_options(
+        SimpleNamespace(
+            pw_browser_pool=True, pw_browser_pool_max_age_s=5, pw_browser_pool_max_jobs=3
+        )
+    )
+    assert opts == {"max_age_s": 5, "max_jobs": 3}
@@ -0,0 +1,66 @@
+# tests/unit/core/test_timing.py
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from engine.core.timing import collect_timings, step, timed_step
+
+pytestmark = pytest.mark.unit
+
+
+# WHY: Stand-in page object; real ones drive Playwright.
+class _Page:
+    @timed_step("login")
+    def login(self) -> str:
+        with step("submit"):
+            pass
+        return "inventory"
+
+    @timed_step()
+    def add_to_cart(self) -> None:
+        raise RuntimeError("sold out")
+
+    @timed_step("navigate")
+    async def navigate(self) -> int:
+        await asyncio.sleep(0)
+        return 200
+
+
+def test_steps_nest_and_repeats_add_up() -> None:
+    page = _Page()
+    with collect_timings() as timings:
+        assert page.login() == "inventory"
+        page.login()
+
+    assert list(timings) == ["login.submit", "login"]
+    assert timings["login"] >= timings["login.submit"] >= 0
+
+
+def test_failed_step_is_still_timed() -> None:
+    with collect_timings() as timings, pytest.raises(RuntimeError):
+        _Page().add_to_cart()
+
+    assert "add_to_cart" in timings
+
+
+def test_outside_a_scope_steps_are_noops() -> None:
+    assert _Page().login() == "inventory"
+    with collect_timings() as timings:
+        pass
+    assert timings == {}
+
+
+def test_async_items_keep_separate_timings() -> None:
+    async def _item() -> dict[str, float]:
+        with collect_timings() as timings:
+            await _Page().navigate()
+        return timings
+
+    async def _main() -> list[dict[str, float]]:
+        return await asyncio.gather(_item(), _item())
+
+    first, second = asyncio.run(_main())
+    assert list(first) == list(second) == ["navigate"]
@@ -0,0 +1,222 @@
+# tests/unit/engine/flows/crawl_simple/test_http_first.py
+
+"""Unit tests for the HTTP-first CRAWL_SIMPLE path."""
+# WHY: MockTransport stands in for the network; a fake page records browser fallbacks.
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+
+from engine.automation.http import fetch_head
+from engine.core.constants.session import SessionMode
+from engine.flows.crawl_simple import hooks_async, run as crawl_run
+from engine.flows.crawl_simple.http_first import HttpFirstTarget
+from engine.flows.crawl_simple.input import CrawlSimpleInput
+from engine.flows.registry import FlowType, get_flow_adapter
+
+pytestmark = pytest.mark.unit
+
+HEAD = (
+    b"<!doctype html><html><head><meta charset='utf-8'>"
+    b"<title>\n  Caf&eacute;   Menu </title>"
+    b"<meta name='description' content='Daily specials'>"
+    b"<meta property='og:type' content='website'>"
+    b"</head>"
+)
+
+
+async def _chunks(*parts: bytes) -> AsyncIterator[bytes]:
+    for part in parts:
+        yield part
+
+
+def _client(handler: Callable[[httpx.Request], httpx.Response]) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler), follow_redirects=True)
+
+
+def _html(*parts: bytes, status: int = 200) -> httpx.Response:
+    return httpx.Response(
+        status, headers={"content-type": "text/html; charset=utf-8"}, content=_chunks(*parts)
+    )
+
+
+class _FakePage:
+    # WHY: Stands in for a Playwright page so fallbacks are observable without a browser.
+    url = "https://shop.test/"
+
+    def __init__(self) -> None:
+        self.visits: list[str] = []
+
+    async def goto(self, url: str, **kwargs: Any) -> Any:
+        self.visits.append(url)
+        return SimpleNamespace(status=200)
+
+    async def title(self) -> str:
+        return "Rendered"
+
+    async def evaluate(self, script: str) -> dict[str, str]:
+        return {}
+
+
+def _target(client: httpx.AsyncClient) -> tuple[HttpFirstTarget, list[_FakePage]]:
+    opened: list[_FakePage] = []
+
+    async def open_page() -> _FakePage:
+        opened.append(_FakePage())
+        return opened[-1]
+
+    return HttpFirstTarget(client=client, open_page=open_page), opened
+
+
+def test_fetch_head_stops_reading_at_end_of_head() -> None:
+    body = [b"<body>" + b"x" * 4096 for _ in range(50)]
+
+    async def scenario() -> Any:
+        async with _client(lambda req: _html(HEAD, *body)) as client:
+            return await fetch_head(client, "https://shop.test/")
+
+    snap = asyncio.run(scenario())
+
+    assert snap.title == "Café Menu"
+    assert snap.meta_tags == {"description": "Daily specials", "og:type": "website"}
+    assert snap.bytes_read < 4096
+
+
+def test_head_is_enough_no_browser() -> None:
+    async def scenario() -> tuple[Any, list[_FakePage]]:
+        async with _client(lambda req: _html(HEAD)) as client:
+            target, opened = _target(client)
+            return (
+                await crawl_run.run_item_async(CrawlSimpleInput(url="https://shop.test/"), target),
+                opened,
+            )
+
+    ar, opened = asyncio.run(scenario())
+
+    assert ar.ok
+    assert opened == []
+    assert ar.value["title"] == "Café Menu"
+    assert ar.value["http_status"] == 200
+    assert ar.value["final_url"] == "https://shop.test/"
+    assert ar.extras["fetch"]["via"] == "http"
+    assert "http_fetch" in ar.timings
+
+
+@pytest.mark.parametrize(
+    "response, reason",
+    [
+        (lambda: _html(b"<html><head><script src='app.js'></script></head>"), "js_title"),
+        (lambda: _html(b"<html><head></head><body>hi</body>"), "empty_head"),
+        (lambda: _html(HEAD, status=403), "blocked_status"),
+        (lambda: httpx.Response(200, json={"a": 1}), "not_html"),
+    ],
+)
+def test_falls_back_to_browser(response: Callable[[], httpx.Response], reason: str) -> None:
+    async def scenario() -> tuple[Any, list[_FakePage]]:
+        async with _client(lambda req: response()) as client:
+            target, opened = _target(client)
+            return (
+                await crawl_run.run_item_async(CrawlSimpleInput(url="https://shop.test/"), target),
+                opened,
+            )
+
+    ar, opened = asyncio.run(scenario())
+
+    assert ar.ok
+    assert ar.value["title"] == "Rendered"
+    assert [p.visits for p in opened] == [["https://shop.test/"]]
+    assert ar.extras["fetch"] == {"via": "browser", "fallback": reason}
+
+
+def test_transport_error_falls_back_and_retry_stays_on_browser() -> None:
+    calls: list[str] = []
+
+    def handler(req: httpx.Request) -> httpx.Response:
+        calls.append(str(req.url))
+        raise httpx.ConnectError("refused", request=req)
+
+    async def scenario() -> tuple[list[Any], list[_FakePage]]:
+        async with _client(handler) as client:
+            target, opened = _target(client)
+            item = CrawlSimpleInput(url="https://shop.test/")
+            first = await crawl_run.run_item_async(item, target)
+            second = await crawl_run.run_item_async(item, target)  # runner retry, same target
+            return [first, second], opened
+
+    (first, second), opened = asyncio.run(scenario())
+
+    assert first.extras["fetch"] == {"via": "browser", "fallback": "http_error:ConnectError"}
+    assert second.ok
+    assert len(calls) == 1
+    assert len(opened) == 1
+    assert opened[0].visits == ["https://shop.test/", "https://shop.test/"]
+
+
+def test_hooks_launch_browser_lazily(monkeypatch: pytest.MonkeyPatch) -> None:
+    built: list[Any] = []
+    settings = SimpleNamespace(
+        pw_headless=True, pw_tracing="off", http_first=True, http_head_max_bytes=1024
+    )
+    monkeypatch.setattr(hooks_async, "get_settings", lambda: settings)
+
+    async def fake_build(**kwargs: Any) -> Any:
+        # WHY: Count launches instead of starting Playwright.
+        await asyncio.sleep(0)
+        built.append(kwargs["spec"])
+        return SimpleNamespace(context=None, block_stats={})
+
+    async def fake_ensure(bundle: Any, reuse: bool) -> _FakePage:
+        return _FakePage()
+
+    monkeypatch.setattr(
+        "engine.automation.playwright.session.build_session_bundle_async", fake_build
+    )
+
+    async def fake_close(bundle: Any) -> None:
+        closed.append(bundle)
+
+    closed: list[Any] = []
+    monkeypatch.setattr("engine.automation.playwright.session.ensure_page_async", fake_ensure)
+    monkeypatch.setattr("engine.automation.playwright.session.close_bundle_async", fake_close)
+    spec = get_flow_adapter(FlowType.CRAWL_SIMPLE).spec
+    assert spec.http_first
+    assert spec.mode is SessionMode.NON_AUTH
+
+    async def scenario() -> dict[str, Any]:
+        ctx = await hooks_async.before_job({"spec": spec})
+        assert built == []
+        targets = [await hooks_async.before_item(ctx, {"url": "u"}) for _ in range(3)]
+        await asyncio.gather(*(t.browser_page() for t in targets))
+        await hooks_async.after_job(ctx, {})
+        return ctx
+
+    ctx = asyncio.run(scenario())
+
+    assert built == [spec]  # concurrent fallbacks share one launch
+    assert len(closed) == 1
+    assert ctx["http"] is None
+
+
+def test_kill_switch_keeps_browser_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    settings = SimpleNamespace(pw_headless=True, pw_tracing="off", http_first=False)
+    monkeypatch.setattr(hooks_async, "get_settings", lambda: settings)
+    bundle = SimpleNamespace(context=None, block_stats={})
+
+    async def fake_build(**kwargs: Any) -> Any:
+        return bundle
+
+    monkeypatch.setattr(
+        "engine.automation.playwright.session.build_session_bundle_async", fake_build
+    )
+    spec = get_flow_adapter(FlowType.CRAWL_SIMPLE).spec
+
+    ctx = asyncio.run(hooks_async.before_job({"spec": spec}))
+
+    assert ctx["bundle"] is bundle
+    assert ctx["http"] is None
@@ -0,0 +1,133 @@
+# tests/unit/engine/orchestration/test_event_bus.py
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+import pytest
+
+from engine.core.constants.flows import FlowType
+from engine.core.constants.statuses import ItemStatus, JobStatus
+from engine.orchestration.event_bus import EventBus, EventSink
+from engine.orchestration.events import ItemFinished, ItemRetried, JobFinished, JobStarted
+from engine.orchestration.sinks import (
+    ITEM_STEP_SECONDS,
+    ITEMS,
+    RETRIES,
+    JsonlFileSink,
+    PrometheusSink,
+)
+
+pytestmark = pytest.mark.unit
+
+
+# WHY: Holds its thread on a gate so the queue behind it fills up.
+class _GatedSink(EventSink):
+    name = "gated"
+
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+        self.seen: list[Any] = []
+        self.closed = False
+
+    def handle(self, events: list[Any]) -> None:
+        self.gate.wait(5)
+        self.seen.extend(events)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_publish_never_waits_on_a_slow_sink_and_keeps_newest() -> None:
+    bus = EventBus(max_queue=3)
+    sink = bus.add_sink(_GatedSink())
+    bus.publish(0)
+    time.sleep(0.05)  # first event is now held by the sink thread
+
+    t0 = time.perf_counter()
+    for n in range(1, 11):
+        bus.publish(n)
+    assert time.perf_counter() - t0 < 0.5
+    assert bus.dropped() == {"gated": 7}
+
+    sink.gate.set()
+    bus.close()
+    assert sink.seen == [0, 8, 9, 10]
+    assert sink.closed
+
+
+def test_failing_sink_does_not_starve_others() -> None:
+    class _Broken(EventSink):
+        name = "broken"
+
+        def handle(self, events: list[Any]) -> None:
+            raise RuntimeError("down")
+
+    bus = EventBus()
+    bus.add_sink(_Broken())
+    ok = bus.add_sink(_GatedSink())
+    ok.gate.set()
+    for n in range(5):
+        bus.publish(n)
+    bus.close()
+    assert ok.seen == [0, 1, 2, 3, 4]
+
+
+def test_jsonl_sink_appends_one_line_per_event(tmp_path: Path) -> None:
+    path = tmp_path / "events" / "run.jsonl"
+    bus = EventBus()
+    bus.add_sink(JsonlFileSink(path))
+    bus.publish(JobStarted(job_id="j1", flow=FlowType.CRAWL_SIMPLE))
+    bus.publish(ItemFinished(job_id="j1", item_index=0, status=ItemStatus.DONE, duration_ms=12.5))
+    bus.close()
+
+    lines = [orjson.loads(line) for line in path.read_bytes().splitlines()]
+    assert [line["type"] for line in lines] == ["JobStarted", "ItemFinished"]
+    assert lines[1]["status"] == "DONE"
+    assert lines[1]["duration_ms"] == 12.5
+    assert all("ts" in line for line in lines)
+
+
+def test_prometheus_sink_labels_items_with_job_flow() -> None:
+    flow = str(FlowType.CRAWL_SIMPLE)
+    done = ITEMS.labels(flow=flow, status="DONE", error_code="NONE")
+    timeout = ITEMS.labels(flow=flow, status="FAILED", error_code="TIMEOUT")
+    retries = RETRIES.labels(flow=flow)
+    before = (done._value.get(), timeout._value.get(), retries._value.get())
+    steps_before = _hist_count(flow, "navigate")
+
+    PrometheusSink().handle(
+        [
+            JobStarted(job_id="j2", flow=FlowType.CRAWL_SIMPLE),
+            ItemRetried(job_id="j2", item_index=0, attempt=1),
+            ItemFinished(
+                job_id="j2", item_index=0, status=ItemStatus.DONE, timings={"navigate": 0.4}
+            ),
+            ItemFinished(job_id="j2", item_index=1, status=ItemStatus.FAILED, error_code="TIMEOUT"),
+            JobFinished(job_id="j2", flow=FlowType.CRAWL_SIMPLE, status=JobStatus.DONE),
+        ]
+    )
+
+    after = (done._value.get(), timeout._value.get(), retries._value.get())
+    assert after == (before[0] + 1, before[1] + 1, before[2] + 1)
+    assert _hist_count(flow, "navigate") == steps_before + 1
+
+
+def _hist_count(flow: str, step: str) -> float:
+    for metric in ITEM_STEP_SECONDS.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_count") and sample.labels == {"flow": flow, "step": step}:
+                return sample.value
+    return 0.0
+
+
+def test_sink_without_handle_cannot_be_built() -> None:
+    class _NoHandle(EventSink):
+        name = "no_handle"
+
+    with pytest.raises(TypeError):
+        _NoHandle()  # type: ignore[abstract]
@@ -0,0 +1,197 @@
+# tests/unit/engine/orchestration/test_job_runner_async.py
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from engine.core.constants.flows import FlowType
+from engine.core.constants.session import ExecutionMode
+from engine.core.constants.statuses import ItemStatus
+from engine.core.errors import ErrorCode
+from engine.orchestration import runner
+
+
+class _InputModel(BaseModel):
+    url: str
+
+
+class _ActionResult:
+    def __init__(self, ok: bool, value: Any | None = None) -> None:
+        self.ok = ok
+        self.value = value
+        self.error_code = ErrorCode.NONE if ok else ErrorCode.TIMEOUT
+        self.error_message = None if ok else "soft"
+        self.timings: dict[str, float] | None = {"total": 0.0}
+        self.extras: dict[str, Any] | None = {}
+
+
+# WHY: Sync hooks keep validation/dedupe shared between engines.
+class _SyncHooks:
+    def __init__(self) -> None:
+        self.retry_calls: list[int] = []
+
+    def validate_input(self, raw: dict[str, Any]) -> None:
+        return None
+
+    def dedupe_key(self, raw: dict[str, Any]) -> str:
+        return raw["url"]
+
+    def on_retry(self, raw: dict[str, Any], attempt: int, exc: Exception) -> None:
+        self.retry_calls.append(attempt)
+
+    def on_error(self, raw: dict[str, Any], exc: Exception) -> None:
+        return None
+
+
+# WHY: Async hooks track page ownership and in-flight overlap on the loop.
+class _AsyncHooks:
+    def __init__(self) -> None:
+        self.jobs_opened = 0
+        self.pages_closed: list[Any] = []
+        self.summary: dict[str, int] | None = None
+
+    async def before_job(self, payload: dict[str, Any]) -> dict[str, Any]:
+        self.jobs_opened += 1
+        return {"pages": 0}
+
+    async def before_item(self, ctx: dict[str, Any], raw: dict[str, Any]) -> Any:
+        ctx["pages"] += 1
+        return f"page-{raw['url']}"
+
+    async def after_item(self, ctx: dict[str, Any], payload: dict[str, Any], page: Any) -> None:
+        self.pages_closed.append(page)
+        if "extras" in payload:
+            payload["extras"]["closed"] = page
+
+    async def after_job(self, ctx: dict[str, Any], summary: dict[str, int]) -> None:
+        self.summary = summary
+
+
+class _Adapter:
+    input_cls = _InputModel
+    spec = {"name": "async"}
+    execution = ExecutionMode.ASYNC
+
+    def __init__(self) -> None:
+        self.hooks = _SyncHooks()
+        self.async_hooks = _AsyncHooks()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.attempts: dict[str, int] = {}
+
+    def run_item(self, input_obj: _InputModel, page: Any) -> Any:
+        raise AssertionError("sync run_item must not be used for ASYNC flows")
+
+    async def run_item_async(self, input_obj: _InputModel, page: Any) -> _ActionResult:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            n = int(input_obj.url.rsplit("/", 1)[-1])
+            await asyncio.sleep(0.001 * (10 - n))
+            self.attempts[input_obj.url] = self.attempts.get(input_obj.url, 0) + 1
+            if n == 2 and self.attempts[input_obj.url] == 1:
+                return _ActionResult(ok=False)
+            return _ActionResult(ok=True, value={"n": n, "page": page})
+        finally:
+            self.in_flight -= 1
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def adapter(monkeypatch: pytest.MonkeyPatch) -> _Adapter:
+    adapter = _Adapter()
+    monkeypatch.setattr(runner, "get_flow_adapter", lambda flow: adapter)
+    return adapter
+
+
+def test_run_job_dispatches_async_flows(adapter, monkeypatch: pytest.MonkeyPatch) -> None:
+    class _Settings:
+        item_max_retries = 1
+        item_concurrency = 1
+        async_item_concurrency_max = 4
+
+    monkeypatch.setattr(runner, "get_settings", lambda: _Settings())
+
+    items = [{"url": f"https://example.com/{n}"} for n in range(6)]
+    items.append({"url": "https://example.com/0"})  # duplicate
+
+    results = runner.run_job(
+        flow=FlowType.CRAWL_SIMPLE,
+        items=items,
+        options={"job_id": "async-1", "concurrency": 10},
+    )
+
+    assert [r.status for r in results[:6]] == [ItemStatus.DONE] * 6
+    assert [r.output["n"] for r in results[:6]] == [0, 1, 2, 3, 4, 5]
+    assert results[6].status == ItemStatus.CANCELLED
+    assert results[6].error_code == ErrorCode.DEDUPED
+    assert results[2].retry_count == 1
+    assert adapter.hooks.retry_calls == [1]
+
+    assert adapter.async_hooks.jobs_opened == 1
+    assert 1 < adapter.max_in_flight <= 4
+    assert len(adapter.async_hooks.pages_closed) == 7
+    assert results[0].extras["closed"] == "page-https://example.com/0"
+    assert adapter.async_hooks.summary == {"done": 6, "failed": 0, "cancelled": 1}
+
+
+def test_run_job_async_default_is_one_in_flight(adapter, configure_runner_settings) -> None:
+    configure_runner_settings(0)
+
+    items = [{"url": f"https://example.com/{n}"} for n in range(3, 6)]
+    results = runner.run_job(flow=FlowType.CRAWL_SIMPLE, items=items, options={})
+
+    assert [r.status for r in results] == [ItemStatus.DONE] * 3
+    assert adapter.max_in_flight == 1
+
+
+# WHY: Full sync hook surface so the same adapter can run on the sync lanes.
+class _LaneHooks(_SyncHooks):
+    def __init__(self) -> None:
+        super().__init__()
+        self.jobs_opened = 0
+
+    def before_job(self, payload: dict[str, Any]) -> dict[str, Any]:
+        self.jobs_opened += 1
+        return {}
+
+    def before_item(self, ctx: dict[str, Any], raw: dict[str, Any]) -> Any:
+        return "sync-page"
+
+    def after_item(self, ctx: dict[str, Any], payload: dict[str, Any]) -> None:
+        return None
+
+    def after_job(self, ctx: dict[str, Any], summary: dict[str, int]) -> None:
+        return None
+
+
+def test_async_engine_off_runs_async_flows_on_sync_lanes(
+    adapter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class _Settings:
+        item_max_retries = 0
+        item_concurrency = 1
+        item_concurrency_max = 4
+        async_engine = False
+
+    monkeypatch.setattr(runner, "get_settings", lambda: _Settings())
+    adapter.hooks = _LaneHooks()
+    adapter.run_item = lambda input_obj, page: _ActionResult(ok=True, value={"page": page})
+
+    items = [{"url": f"https://example.com/{n}"} for n in range(4)]
+    results = runner.run_job(
+        flow=FlowType.CRAWL_SIMPLE, items=items, options={"job_id": "sync-1", "concurrency": 2}
+    )
+
+    assert [r.output["page"] for r in results] == ["sync-page"] * 4
+    assert adapter.hooks.jobs_opened == 2  # one per lane
+    assert adapter.async_hooks.jobs_opened == 0
+    assert runner.resolve_execution(adapter, _Settings()) == ExecutionMode.SYNC
+    _Settings.async_engine = True
+    assert runner.resolve_execution(adapter, _Settings()) == ExecutionMode.ASYNC
@@ -0,0 +1,270 @@
+# tests/unit/engine/orchestration/test_job_runner_concurrency.py
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from engine.core.constants.flows import FlowType
+from engine.core.constants.statuses import ItemStatus
+from engine.core.errors import ErrorCode
+from engine.orchestration import events, runner
+from engine.orchestration.event_bus import EventBus, EventSink
+
+
+class _InputModel(BaseModel):
+    url: str
+
+
+class _ActionResult:
+    def __init__(self, ok: bool, value: Any | None = None) -> None:
+        self.ok = ok
+        self.value = value
+        self.error_code = ErrorCode.NONE if ok else ErrorCode.TIMEOUT
+        self.error_message = None if ok else "flaky"
+        self.timings: dict[str, float] | None = {"total": 0.01}
+        self.extras: dict[str, Any] | None = {}
+
+
+# WHY: Record per-lane lifecycle so we can prove each lane owns its own job context.
+class _AdapterHooks:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.before_job_threads: list[str] = []
+        self.after_job_summaries: list[dict[str, int]] = []
+        self.after_item_statuses: list[ItemStatus] = []
+        self.retry_calls: list[int] = []
+
+    def before_job(self, payload: dict[str, Any]) -> dict[str, Any]:
+        with self.lock:
+            self.before_job_threads.append(threading.current_thread().name)
+        return {"thread": threading.current_thread().name}
+
+    def validate_input(self, raw: dict[str, Any]) -> None:
+        if not raw["url"].startswith("https://"):
+            raise ValueError("invalid_url")
+
+    def dedupe_key(self, raw: dict[str, Any]) -> str:
+        return raw["url"]
+
+    def before_item(self, ctx: dict[str, Any], raw: dict[str, Any]) -> object:
+        # Pages must come from the lane that owns the context.
+        assert ctx["thread"] == threading.current_thread().name
+        return object()
+
+    def on_retry(self, raw: dict[str, Any], attempt: int, exc: Exception) -> None:
+        with self.lock:
+            self.retry_calls.append(attempt)
+
+    def on_error(self, raw: dict[str, Any], exc: Exception) -> None:
+        return None
+
+    def after_item(self, ctx: dict[str, Any], payload: dict[str, Any]) -> None:
+        with self.lock:
+            self.after_item_statuses.append(payload["status"])
+        if "extras" in payload:
+            payload["extras"]["lane"] = ctx["thread"]
+
+    def after_job(self, ctx: dict[str, Any], summary: dict[str, int]) -> None:
+        with self.lock:
+            self.after_job_summaries.append(summary)
+
+
+class _Adapter:
+    input_cls = _InputModel
+    spec = {"name": "lanes"}
+
+    def __init__(self) -> None:
+        self.hooks = _AdapterHooks()
+        self._flaky_seen: set[str] = set()
+        self._lock = threading.Lock()
+
+    def run_item(self, input_obj: _InputModel, page: object) -> _ActionResult:
+        # Later items finish first so ordering must come from idx, not completion.
+        n = int(input_obj.url.rsplit("/", 1)[-1])
+        time.sleep(0.002 * (10 - n))
+        if input_obj.url.endswith("/5"):
+            with self._lock:
+                first = input_obj.url not in self._flaky_seen
+                self._flaky_seen.add(input_obj.url)
+            if first:
+                return _ActionResult(ok=False)
+        return _ActionResult(ok=True, value={"n": n})
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def adapter(monkeypatch: pytest.MonkeyPatch) -> _Adapter:
+    adapter = _Adapter()
+    monkeypatch.setattr(runner, "get_flow_adapter", lambda flow: adapter)
+    return adapter
+
+
+def test_run_job_lanes_keep_order_dedupe_and_retries(adapter, configure_runner_settings) -> None:
+    configure_runner_settings(1)
+
+    items = [{"url": f"https://example.com/{n}"} for n in range(8)]
+    items.insert(3, {"url": "https://example.com/1"})  # duplicate of idx 1
+    items.insert(6, {"url": "ftp://bad"})  # invalid
+
+    results = runner.run_job(
+        flow=FlowType.CRAWL_SIMPLE,
+        items=items,
+        options={"job_id": "lanes-1", "concurrency": 3},
+    )
+
+    assert len(results) == len(items)
+    assert results[3].status == ItemStatus.CANCELLED
+    assert results[3].error_code == ErrorCode.DEDUPED
+    assert results[6].status == ItemStatus.FAILED
+    done = [r for r in results if r.status == ItemStatus.DONE]
+    assert [r.output["n"] for r in done] == [0, 1, 2, 3, 4, 5, 6, 7]
+    assert next(r for r in done if r.output["n"] == 5).retry_count == 1
+    assert all(r.extras.get("lane") for r in done)
+
+    assert len(adapter.hooks.before_job_threads) == 3
+    assert len(adapter.hooks.after_job_summaries) == 3
+    assert sum(s["done"] for s in adapter.hooks.after_job_summaries) == 8
+    assert len(adapter.hooks.after_item_statuses) == len(items)
+    assert adapter.hooks.retry_calls == [1]
+
+
+def test_run_job_concurrency_is_capped(adapter, monkeypatch: pytest.MonkeyPatch) -> None:
+    class _Settings:
+        item_max_retries = 0
+        item_concurrency = 2
+        item_concurrency_max = 2
+
+    monkeypatch.setattr(runner, "get_settings", lambda: _Settings())
+
+    items = [{"url": f"https://example.com/{n}"} for n in range(4)]
+    results = runner.run_job(
+        flow=FlowType.CRAWL_SIMPLE, items=items, options={"job_id": "cap", "concurrency": 50}
+    )
+
+    assert [r.status for r in results] == [ItemStatus.DONE] * 4
+    assert len(adapter.hooks.before_job_threads) == 2
+
+
+def test_run_job_lanes_reuse_threads_across_jobs(
+    adapter, configure_runner_settings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    configure_runner_settings(0)
+    # WHY: Earlier tests grew the shared lane set; start from a fresh one.
+    monkeypatch.setattr(runner, "_LANES", None)
+    monkeypatch.setattr(runner, "_LANES_SIZE", 0)
+    items = [{"url": f"https://example.com/{n}"} for n in range(6)]
+
+    for n in range(3):
+        runner.run_job(
+            flow=FlowType.CRAWL_SIMPLE, items=items, options={"job_id": f"j{n}", "concurrency": 2}
+        )
+
+    # Thread-bound browser pools only pay off when the next job lands on the same threads.
+    assert len(adapter.hooks.before_job_threads) == 6
+    assert len(set(adapter.hooks.before_job_threads)) <= 2
+
+
+def test_resolve_concurrency_falls_back_on_bad_option() -> None:
+    class _Settings:
+        item_concurrency = 2
+        item_concurrency_max = 4
+
+    assert runner._resolve_concurrency({"concurrency": "x"}, _Settings(), 10) == 2
+    assert runner._resolve_concurrency({"concurrency": 0}, _Settings(), 10) == 1
+    assert runner._resolve_concurrency({}, _Settings(), 1) == 1
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_run_job_streams_each_result_once(adapter, configure_runner_settings, concurrency) -> None:
+    configure_runner_settings(1)
+    streamed: dict[int, ItemStatus] = {}
+    lock = threading.Lock()
+
+    def _on_result(idx: int, result: Any) -> None:
+        with lock:
+            assert idx not in streamed
+            streamed[idx] = result.status
+
+    items = [{"url": f"https://example.com/{n}"} for n in range(4)] + [{"url": "ftp://bad"}]
+    results = runner.run_job(
+        flow=FlowType.CRAWL_SIMPLE,
+        items=items,
+        options={"job_id": "stream", "concurrency": concurrency},
+        on_result=_on_result,
+    )
+
+    assert streamed == {idx: r.status for idx, r in enumerate(results)}
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_run_job_resume_skips_completed_and_keeps_dedupe(
+    adapter, configure_runner_settings, concurrency
+) -> None:
+    configure_runner_settings(1)
+    stored = runner.ItemResult(status=ItemStatus.DONE, output={"n": 1, "stored": True})
+    streamed: list[int] = []
+    items = [
+        {"url": "https://example.com/0"},
+        {"url": "https://example.com/1"},
+        {"url": "https://example.com/1"},  # duplicate of a resumed item
+        {"url": "https://example.com/3"},
+    ]
+
+    results = runner.run_job(
+        flow=FlowType.CRAWL_SIMPLE,
+        items=items,
+        options={"job_id": "resume", "concurrency": concurrency},
+        on_result=lambda idx, _: streamed.append(idx),
+        completed={1: stored},
+    )
+
+    assert results[1] is stored
+    assert results[2].error_code == ErrorCode.DEDUPED
+    assert sorted(streamed) == [0, 2, 3]
+    assert len(adapter.hooks.after_item_statuses) == 3
+
+
+# WHY: Sinks see batches on their own thread; a broken one must not starve the others.
+class _BrokenSink(EventSink):
+    name = "broken"
+
+    def handle(self, events: list[Any]) -> None:
+        raise RuntimeError("sink down")
+
+
+class _RecordingSink(EventSink):
+    name = "recording"
+
+    def __init__(self) -> None:
+        self.seen: list[str] = []
+
+    def handle(self, events: list[Any]) -> None:
+        self.seen.extend(type(e).__name__ for e in events)
+
+
+def test_run_job_events_reach_sinks(adapter, configure_runner_settings, monkeypatch) -> None:
+    configure_runner_settings(1)
+    bus = EventBus(max_queue=100)
+    monkeypatch.setattr(events, "get_event_bus", lambda: bus)
+    bus.add_sink(_BrokenSink())
+    sink = bus.add_sink(_RecordingSink())
+
+    runner.run_job(
+        flow=FlowType.CRAWL_SIMPLE,
+        items=[{"url": "https://example.com/1"}, {"url": "https://example.com/2"}],
+        options={"job_id": "evt", "concurrency": 2},
+    )
+    bus.close()  # drain
+
+    seen = sink.seen
+    assert seen[0] == "JobStarted"
+    assert seen[-1] == "JobFinished"
+    assert seen.count("ItemStarted") == seen.count("ItemFinished") == 2
+    assert seen.count("SessionOpened") == seen.count("SessionClosed") == 2
@@ -9,9 +9,9 @@ import pytest
 from pydantic import BaseModel
 
 from engine.core.constants.flows import FlowType
-from engine.core.constants.statuses import ItemStatus
+from engine.core.constants.statuses import ItemStatus, JobStatus
 from engine.core.errors import ErrorCode
-from engine.orchestration import runner
+from engine.orchestration import events, runner
 
 
 # WHY: Track retry/error callbacks to assert retry orchestration decisions.
@@ -103,3 +103,37 @@ def test_run_job_retries_until_exhausted(monkeypatch, configure_runner_settings)
     assert adapter.hooks.retry_calls == [({"url": "https://example.com"}, 1)]
     assert adapter.hooks.error_calls == []
     assert not responses
+
+
+def test_run_job_publishes_retry_and_timing_events(monkeypatch, configure_runner_settings) -> None:
+    configure_runner_settings(1)
+    responses: deque[_Response] = deque(
+        [
+            _Response(ok=False, error_code=ErrorCode.TIMEOUT, error_message="retry me"),
+            _Response(ok=False, error_code=ErrorCode.UNKNOWN, error_message="still bad"),
+        ]
+    )
+    adapter = _Adapter(responses)
+    monkeypatch.setattr(runner, "get_flow_adapter", lambda flow: adapter)
+    published: list[Any] = []
+    # WHY: A stand-in bus keeps events in-thread, so asserts need no draining.
+    monkeypatch.setattr(
+        events, "get_event_bus", lambda: type("_Bus", (), {"publish": published.append})()
+    )
+
+    runner.run_job(
+        flow=FlowType.CRAWL_SIMPLE,
+        items=[{"url": "https://example.com"}],
+        options={"job_id": "job-evt"},
+    )
+
+    retried = [e for e in published if isinstance(e, events.ItemRetried)]
+    assert [(e.attempt, e.error_code, e.error_message) for e in retried] == [
+        (1, str(ErrorCode.TIMEOUT), "retry me")
+    ]
+    finished = next(e for e in published if isinstance(e, events.ItemFinished))
+    assert finished.retry_count == 1
+    assert finished.timings == {"duration": 0.5}
+    assert finished.duration_ms >= 0
+    job_done = next(e for e in published if isinstance(e, events.JobFinished))
+    assert job_done.status == JobStatus.FAILED
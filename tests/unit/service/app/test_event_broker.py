@@ -0,0 +1,90 @@
+# tests/unit/service/app/test_event_broker.py
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from service.app.event_broker import JobEventBroker
+from service.db.models import Base, Job, JobItem
+
+pytestmark = pytest.mark.unit
+
+
+async def _scenario(db_path: Path) -> tuple[list[list[str]], int]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as db:
+        db.add(Job(id="j", flow_type="CRAWL_SIMPLE", status="RUNNING"))
+        db.add_all(JobItem(id=f"i{n}", job_id="j", idx=n, status="PENDING") for n in range(3))
+        await db.commit()
+
+    broker = JobEventBroker(factory, tail_s=0.05)
+    watchers = [broker.subscribe("j", since=0) for _ in range(3)]
+    producers = len(broker._producers)
+    # WHY: Relayed NOTIFY payloads are filtered; only starts pass, finishes come from the tail.
+    broker.publish_threadsafe({"type": "ItemFinished", "job_id": "j", "item_index": 9})
+    broker.publish_threadsafe({"type": "ItemStarted", "job_id": "j", "item_index": 1})
+
+    async with factory() as db:
+        await db.execute(update(Job).values(version=1, status="DONE"))
+        await db.execute(update(JobItem).where(JobItem.idx == 1).values(version=1, status="DONE"))
+        await db.commit()
+
+    streams: list[list[str]] = []
+    for q in watchers:
+        got: list[str] = []
+        while not got or not got[-1].startswith("JobFinished"):
+            payload = await asyncio.wait_for(q.get(), timeout=2)
+            got.append(f"{payload['type']}:{payload.get('item_index', '')}")
+        streams.append(got)
+    await asyncio.sleep(0)
+    for q in watchers:
+        broker.unsubscribe("j", q)
+    await broker.close()
+    await engine.dispose()
+    return streams, producers
+
+
+def test_broker_fans_out_one_tail_to_every_watcher(tmp_path: Path) -> None:
+    streams, producers = asyncio.run(_scenario(tmp_path / "events.db"))
+
+    assert producers == 1
+    assert streams == [["ItemStarted:1", "ItemFinished:1", "JobFinished:"]] * 3
+
+
+def test_slow_watcher_drops_oldest() -> None:
+    async def _run() -> list[int]:
+        broker = JobEventBroker(lambda: None, queue_size=2)  # type: ignore[arg-type,return-value]
+        q = broker.subscribe("j", since=0)
+        for n in range(5):
+            broker.publish("j", {"type": "ItemStarted", "item_index": n})
+        broker.unsubscribe("j", q)
+        return [q.get_nowait()["item_index"] for _ in range(q.qsize())]
+
+    assert asyncio.run(_run()) == [3, 4]
+
+
+def test_failed_tail_ends_every_stream() -> None:
+    class _BrokenSession:
+        async def __aenter__(self) -> _BrokenSession:
+            raise RuntimeError("db down")
+
+        async def __aexit__(self, *exc: object) -> None:
+            return None
+
+    async def _run() -> tuple[list[str], int, int]:
+        # WHY: A session factory that always fails drives the tail into its error path.
+        broker = JobEventBroker(_BrokenSession, tail_s=0.05)  # type: ignore[arg-type]
+        watchers = [broker.subscribe("j", since=0) for _ in range(2)]
+        got = [(await asyncio.wait_for(q.get(), timeout=2))["type"] for q in watchers]
+        await asyncio.sleep(0)
+        return got, broker.watchers("j"), len(broker._producers)
+
+    assert asyncio.run(_run()) == (["StreamClosed", "StreamClosed"], 0, 0)
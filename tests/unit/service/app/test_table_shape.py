@@ -0,0 +1,28 @@
+# tests/unit/service/app/test_table_shape.py
+
+from __future__ import annotations
+
+import pytest
+
+from service.app.utils.table_shape import build_table, timings_view
+
+pytestmark = pytest.mark.unit
+
+
+def test_timings_view_nests_dotted_steps_under_their_parent() -> None:
+    flat = {"login.submit": 0.41234, "login": 0.9, "add_to_cart": 0.2, "total": 1.23456}
+
+    assert timings_view(flat) == {
+        "total": 1.235,
+        "login": {"submit": 0.412, "total": 0.9},
+        "add_to_cart": 0.2,
+    }
+
+
+def test_build_table_shows_steps_in_timings_column() -> None:
+    rows = [{"idx": 0, "status": "DONE", "timings": {"navigate": 0.5, "total": 0.7}}]
+
+    columns, shaped = build_table(rows)
+
+    assert "timings" in columns
+    assert shaped[0]["timings"] == {"total": 0.7, "navigate": 0.5}
@@ -0,0 +1,45 @@
+# tests/unit/service/db/test_migrations.py
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, inspect
+
+from service.db.migrations import ensure_columns, ensure_indexes
+from service.db.models import Base, JobItem
+
+pytestmark = pytest.mark.unit
+
+
+def test_ensure_indexes_adds_composites_to_legacy_tables() -> None:
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    # WHY: Simulate a database created before the composite indexes existed.
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_job_items_job_id_idx")
+        conn.exec_driver_sql("DROP INDEX ix_jobs_status_created_at")
+
+    ensure_indexes(engine)
+    ensure_indexes(engine)  # idempotent
+
+    insp = inspect(engine)
+    items = {ix["name"]: ix["column_names"] for ix in insp.get_indexes(JobItem.__tablename__)}
+    jobs = {ix["name"] for ix in insp.get_indexes("jobs")}
+    assert items["ix_job_items_job_id_idx"] == ["job_id", "idx"]
+    assert items["ix_job_items_job_id_status"] == ["job_id", "status"]
+    assert {"ix_jobs_status_created_at", "ix_jobs_created_at_id"} <= jobs
+
+
+def test_ensure_columns_adds_version_with_default() -> None:
+    engine = create_engine("sqlite:///:memory:", future=True)
+    with engine.begin() as conn:
+        # WHY: Pre-version schema; only the columns the migration must keep.
+        conn.exec_driver_sql("CREATE TABLE jobs (id VARCHAR PRIMARY KEY, status VARCHAR)")
+        conn.exec_driver_sql("INSERT INTO jobs VALUES ('j1', 'DONE')")
+        conn.exec_driver_sql("CREATE TABLE job_items (id VARCHAR PRIMARY KEY, job_id VARCHAR)")
+
+    ensure_columns(engine)
+
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT version FROM jobs").scalar() == 0
+    assert "version" in {c["name"] for c in inspect(engine).get_columns("job_items")}
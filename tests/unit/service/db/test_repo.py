@@ -0,0 +1,127 @@
+# tests/unit/service/db/test_repo.py
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from service.db.models import Base, Job, JobItem
+from service.db.repo import (
+    count_items_by_status,
+    decode_cursor,
+    encode_cursor,
+    items_page_stmt,
+    page_items,
+    page_jobs,
+)
+
+pytestmark = pytest.mark.unit
+
+
+async def _walk(limit: int, **filters: str) -> list[list[str]]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    t0 = datetime(2026, 1, 1, tzinfo=UTC)
+    pages: list[list[str]] = []
+    async with factory() as db:
+        # j1..j3 share a timestamp: the id tie-breaker must keep pages disjoint.
+        for n, minutes in enumerate([0, 1, 1, 1, 2]):
+            status = "DONE" if n % 2 else "PENDING"
+            db.add(
+                Job(
+                    id=f"j{n}",
+                    flow_type="CRAWL_SIMPLE",
+                    status=status,
+                    created_at=t0 + timedelta(minutes=minutes),
+                )
+            )
+        await db.commit()
+
+        cursor = None
+        while True:
+            rows, cursor = await page_jobs(db, limit=limit, cursor=cursor, **filters)
+            pages.append([r.id for r in rows])
+            if cursor is None:
+                break
+    await engine.dispose()
+    return pages
+
+
+def test_page_jobs_is_newest_first_and_stable_on_ties() -> None:
+    assert asyncio.run(_walk(2)) == [["j4", "j3"], ["j2", "j1"], ["j0"]]
+
+
+def test_page_jobs_applies_filters_with_cursor() -> None:
+    assert asyncio.run(_walk(1, status="DONE")) == [["j3"], ["j1"]]
+
+
+def test_cursor_roundtrip_and_rejects_garbage() -> None:
+    ts = datetime(2026, 1, 1, 12, 30, tzinfo=UTC)
+
+    assert decode_cursor(encode_cursor(ts, "abc")) == (ts, "abc")
+    for bad in ("", "!!", encode_cursor(ts, "x")[:-3]):
+        with pytest.raises(ValueError, match="invalid_cursor"):
+            decode_cursor(bad)
+
+
+def test_count_items_by_status_groups_in_one_query() -> None:
+    async def _run() -> dict[str, int]:
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with factory() as db:
+            db.add(Job(id="j", flow_type="CRAWL_SIMPLE", status="RUNNING"))
+            for idx, status in enumerate(["DONE", "DONE", "FAILED", "PENDING"]):
+                db.add(JobItem(id=f"i{idx}", job_id="j", idx=idx, status=status))
+            await db.commit()
+            counts = await count_items_by_status(db, "j")
+        await engine.dispose()
+        return counts
+
+    assert asyncio.run(_run()) == {"DONE": 2, "FAILED": 1, "PENDING": 1}
+
+
+def test_items_page_stmt_reads_only_requested_columns() -> None:
+    sql = str(items_page_stmt("j", ["status"], statuses=["FAILED"], limit=10, after_idx=3))
+
+    assert "job_items.idx, job_items.status" in sql
+    for blob in ("input", "output", "timings", "extras"):
+        assert f"job_items.{blob}" not in sql
+    assert "job_items.idx >" in sql
+
+
+def test_page_items_walks_keyset_pages_with_status_filter() -> None:
+    async def _run() -> list[tuple[list[dict], int | None]]:
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        pages: list[tuple[list[dict], int | None]] = []
+        async with factory() as db:
+            db.add(Job(id="j", flow_type="CRAWL_SIMPLE", status="RUNNING"))
+            for idx in range(7):
+                status = "FAILED" if idx % 2 else "DONE"
+                db.add(JobItem(id=f"i{idx}", job_id="j", idx=idx, status=status))
+            await db.commit()
+            after = None
+            while True:
+                rows, after = await page_items(
+                    db, "j", ["status"], statuses=["DONE"], limit=2, after_idx=after
+                )
+                pages.append((rows, after))
+                if after is None:
+                    break
+        await engine.dispose()
+        return pages
+
+    pages = asyncio.run(_run())
+
+    assert [[r["idx"] for r in rows] for rows, _ in pages] == [[0, 2], [4, 6]]
+    assert [after for _, after in pages] == [2, None]
+    assert pages[0][0][0] == {"idx": 0, "status": "DONE"}
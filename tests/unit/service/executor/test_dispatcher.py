@@ -0,0 +1,101 @@
+# tests/unit/service/executor/test_dispatcher.py
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import pytest
+
+from engine.core.constants.statuses import JobStatus
+from service.executor import dispatcher as dispatcher_mod, scheduler
+
+pytestmark = pytest.mark.unit
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def rollback(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_dispatcher_runs_a_pass_per_wake(monkeypatch: pytest.MonkeyPatch) -> None:
+    ran = threading.Event()
+    calls: list[Any] = []
+
+    def _schedule(db: Any) -> None:
+        # WHY: Record passes without a DB; the loop only needs a session to hand over.
+        calls.append(db)
+        ran.set()
+
+    monkeypatch.setattr(scheduler, "schedule_jobs", _schedule)
+    d = dispatcher_mod.Dispatcher(_Session, tick_s=60).start()
+    try:
+        d.wake()
+        assert ran.wait(2)
+    finally:
+        d.stop()
+
+    assert len(calls) == 1
+    assert calls[0].closed is True
+
+
+def test_dispatcher_falls_back_to_tick(monkeypatch: pytest.MonkeyPatch) -> None:
+    ran = threading.Event()
+    monkeypatch.setattr(scheduler, "schedule_jobs", lambda db: ran.set())
+
+    d = dispatcher_mod.Dispatcher(_Session, tick_s=0.1).start()
+    try:
+        assert ran.wait(2)  # no wake() at all
+    finally:
+        d.stop()
+
+
+def test_request_schedule_wakes_running_dispatcher(monkeypatch: pytest.MonkeyPatch) -> None:
+    woken: list[bool] = []
+
+    class _D:
+        def wake(self) -> None:
+            woken.append(True)
+
+    monkeypatch.setattr(dispatcher_mod, "_DISPATCHER", _D())
+    monkeypatch.setattr(scheduler, "schedule_jobs", lambda db: pytest.fail("inline pass"))
+
+    dispatcher_mod.request_schedule(object())  # type: ignore[arg-type]
+
+    assert woken == [True]
+
+
+def test_request_schedule_runs_inline_without_dispatcher(
+    db_session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[Any] = []
+    monkeypatch.setattr(dispatcher_mod, "_DISPATCHER", None)
+    monkeypatch.setattr(scheduler, "schedule_jobs", calls.append)
+
+    dispatcher_mod.request_schedule(db_session)
+
+    assert calls == [db_session]
+
+
+def test_schedule_jobs_fills_all_free_slots_in_one_pass(
+    db_session, make_job, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class _Settings:
+        executor_max_workers = 3
+
+    spawned: list[str] = []
+    monkeypatch.setattr(scheduler, "get_settings", lambda: _Settings())
+    monkeypatch.setattr(scheduler, "_spawn_worker", lambda job_id: spawned.append(job_id) or 1)
+    for n in range(5):
+        make_job(f"job-{n}", JobStatus.PENDING)
+
+    scheduler.schedule_jobs(db_session)
+
+    assert len(spawned) == 3
+    assert scheduler._running_jobs_count(db_session) == 3
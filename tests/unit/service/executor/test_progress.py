@@ -0,0 +1,58 @@
+# tests/unit/service/executor/test_progress.py
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from engine.core.constants.statuses import ItemStatus, JobStatus
+from engine.orchestration.events import ItemFinished, ItemStarted
+from service.db.models import Base, Job, JobItem
+from service.executor.progress import DbProgressSink
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def factory(tmp_path: Path) -> Generator[sessionmaker[Session], None, None]:
+    engine = create_engine(f"sqlite:///{tmp_path / 'progress.db'}", future=True)
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True)
+    db = SessionLocal()
+    db.add(Job(id="job-1", flow_type="CRAWL_SIMPLE", status=str(JobStatus.RUNNING)))
+    db.add(JobItem(id="it-0", job_id="job-1", idx=0, status=str(ItemStatus.PENDING)))
+    # WHY: Already finished by the result sink before the late start event arrives.
+    db.add(JobItem(id="it-1", job_id="job-1", idx=1, status=str(ItemStatus.DONE)))
+    db.add(JobItem(id="it-2", job_id="job-1", idx=2, status=str(ItemStatus.PENDING)))
+    db.commit()
+    db.close()
+    yield SessionLocal
+    engine.dispose()
+
+
+def test_started_items_become_running_without_clobbering_finished(factory) -> None:
+    DbProgressSink(factory).handle(
+        [
+            ItemStarted(job_id="job-1", item_index=0),
+            ItemStarted(job_id="job-1", item_index=1),
+            ItemFinished(job_id="job-1", item_index=1, status=ItemStatus.DONE),
+        ]
+    )
+
+    db = factory()
+    try:
+        items = {i.idx: (i.status, i.version) for i in db.query(JobItem).all()}
+        job = db.get(Job, "job-1")
+        assert job is not None
+        assert job.version == 1
+        assert items == {
+            0: (str(ItemStatus.RUNNING), 1),
+            1: (str(ItemStatus.DONE), 0),
+            2: (str(ItemStatus.PENDING), 0),
+        }
+    finally:
+        db.close()
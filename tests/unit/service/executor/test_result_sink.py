@@ -0,0 +1,156 @@
+# tests/unit/service/executor/test_result_sink.py
+
+from __future__ import annotations
+
+import time
+from collections.abc import Generator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from engine.core.constants.statuses import ItemStatus, JobStatus
+from engine.core.errors import ErrorCode
+from engine.core.models.item_result import ItemResult
+from service.db.models import Base, Job, JobItem
+from service.executor.result_sink import ResultSink, finalize_job, load_item_ids, write_results
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def factory(tmp_path: Path) -> Generator[sessionmaker[Session], None, None]:
+    # WHY: File-backed SQLite so the flusher thread sees the same database.
+    engine = create_engine(f"sqlite:///{tmp_path / 'sink.db'}", future=True)
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True)
+    db = SessionLocal()
+    db.add(Job(id="job-1", flow_type="CRAWL_SIMPLE", status=str(JobStatus.RUNNING)))
+    for idx in range(5):
+        db.add(JobItem(id=f"it-{idx}", job_id="job-1", idx=idx, status=str(ItemStatus.PENDING)))
+    db.commit()
+    db.close()
+    yield SessionLocal
+    engine.dispose()
+
+
+def _done(n: int) -> ItemResult:
+    return ItemResult(status=ItemStatus.DONE, error_code=ErrorCode.NONE, output={"n": n})
+
+
+def _snapshot(factory: sessionmaker[Session]) -> tuple[Job, dict[int, str]]:
+    db = factory()
+    try:
+        job = db.get(Job, "job-1")
+        items = {i.idx: i.status for i in db.query(JobItem).all()}
+        assert job is not None
+        return job, items
+    finally:
+        db.close()
+
+
+def test_size_trigger_flushes_batch_and_counters(factory) -> None:
+    sink = ResultSink(factory, "job-1", batch_size=2, flush_interval_s=60).start()
+
+    sink.emit(0, _done(0))
+    assert _snapshot(factory)[1][0] == str(ItemStatus.PENDING)
+    sink.emit(1, _done(1))
+
+    job, items = _snapshot(factory)
+    assert items[0] == items[1] == str(ItemStatus.DONE)
+    assert job.count_done == 2
+    sink.close()
+
+
+def test_time_trigger_makes_partial_results_visible(factory) -> None:
+    sink = ResultSink(factory, "job-1", batch_size=100, flush_interval_s=0.05).start()
+    sink.emit(2, ItemResult(status=ItemStatus.FAILED, error_code=ErrorCode.TIMEOUT))
+
+    deadline = time.monotonic() + 2
+    while _snapshot(factory)[1][2] != str(ItemStatus.FAILED) and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    job, _ = _snapshot(factory)
+    assert job.count_failed == 1
+    sink.close()
+
+
+def test_close_backfills_unstreamed_results_without_double_counting(factory) -> None:
+    sink = ResultSink(factory, "job-1", batch_size=100, flush_interval_s=60).start()
+    results = [_done(n) for n in range(4)] + [
+        ItemResult(status=ItemStatus.CANCELLED, error_code=ErrorCode.DEDUPED)
+    ]
+    sink.emit(0, results[0])
+    sink.emit(0, results[0])  # duplicate emits are ignored
+
+    sink.close(results)
+
+    job, items = _snapshot(factory)
+    assert job.count_done == 4
+    assert job.count_cancelled == 1
+    assert set(items.values()) == {str(ItemStatus.DONE), str(ItemStatus.CANCELLED)}
+
+    db = factory()
+    try:
+        assert finalize_job(db, "job-1", total=5) == JobStatus.CANCELLED
+    finally:
+        db.close()
+
+
+def test_write_results_stamps_items_with_bumped_job_version(factory) -> None:
+    now = datetime.now(UTC)
+    ids = {idx: f"it-{idx}" for idx in range(5)}
+    with factory() as db:
+        write_results(db, "job-1", [(0, _done(0), now), (1, _done(1), now)], ids)
+        write_results(db, "job-1", [(3, _done(3), now)], ids)
+
+    with factory() as db:
+        job = db.get(Job, "job-1")
+        versions = {i.idx: i.version for i in db.query(JobItem).all()}
+    assert job is not None
+    assert job.version == 2
+    assert versions == {0: 1, 1: 1, 2: 0, 3: 2, 4: 0}
+
+
+def test_finalize_job_bumps_version(factory) -> None:
+    db = factory()
+    try:
+        finalize_job(db, "job-1", 5)
+    finally:
+        db.close()
+
+    job, _ = _snapshot(factory)
+    assert job.version == 1  # status change alone must invalidate the job's ETag
+
+
+def test_write_results_and_finalize_apply_cancelled_priority(factory) -> None:
+    # WHY: Dedupe cancellation next to a success: the rollup must report the job CANCELLED.
+    now = datetime.now(UTC)
+    results = [
+        ItemResult(status=ItemStatus.DONE, error_code=ErrorCode.NONE, output={"value": 1}),
+        ItemResult(status=ItemStatus.CANCELLED, error_code=ErrorCode.DEDUPED, error_message="skip"),
+    ]
+    with factory() as db:
+        write_results(
+            db, "job-1", [(i, r, now) for i, r in enumerate(results)], load_item_ids(db, "job-1")
+        )
+        assert finalize_job(db, "job-1", total=len(results)) == JobStatus.CANCELLED
+
+    with factory() as db:
+        job = db.get(Job, "job-1")
+        done = db.get(JobItem, "it-0")
+        cancelled = db.get(JobItem, "it-1")
+    assert job is not None
+    assert done is not None
+    assert cancelled is not None
+    assert (job.count_done, job.count_cancelled, job.count_failed) == (1, 1, 0)
+    assert job.finished_at is not None
+    assert job.worker_pid is None
+    assert done.status == str(ItemStatus.DONE)
+    assert done.output == {"value": 1}
+    assert done.finished_at is not None
+    assert cancelled.status == str(ItemStatus.CANCELLED)
+    assert cancelled.error_code == ErrorCode.DEDUPED
+    assert cancelled.error_message == "skip"
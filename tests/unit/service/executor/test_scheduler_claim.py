@@ -0,0 +1,95 @@
+# tests/unit/service/executor/test_scheduler_claim.py
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from engine.core.constants.statuses import JobStatus
+from service.db.models import Job
+from service.executor import scheduler
+
+pytestmark = pytest.mark.unit
+
+
+class _Settings:
+    executor_max_workers = 3
+
+
+@pytest.fixture
+def pending_jobs(db_session: Session) -> list[str]:
+    now = datetime.now(UTC)
+    ids = [f"job-{n}" for n in range(5)]
+    for n, job_id in enumerate(ids):
+        db_session.add(
+            Job(
+                id=job_id,
+                flow_type="CRAWL_SIMPLE",
+                status=str(JobStatus.PENDING),
+                created_at=now + timedelta(seconds=n),
+            )
+        )
+    db_session.commit()
+    return ids
+
+
+def test_batch_claim_is_one_update_and_fifo(
+    db_session: Session, pending_jobs: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    statements: list[str] = []
+    spawned: list[str] = []
+
+    def _record(conn: Any, cursor: Any, stmt: str, *args: Any) -> None:
+        statements.append(stmt)
+
+    # WHY: Count round trips at the cursor level to prove the claim is one statement.
+    event.listen(db_session.get_bind(), "before_cursor_execute", _record)
+    monkeypatch.setattr(scheduler, "get_settings", lambda: _Settings())
+    monkeypatch.setattr(scheduler, "_spawn_worker", lambda job_id: spawned.append(job_id) or 7)
+
+    scheduler.schedule_jobs(db_session)
+
+    claim_updates = [s for s in statements if s.startswith("UPDATE jobs SET status")]
+    assert len(claim_updates) == 1
+    assert "RETURNING" in claim_updates[0]
+    assert sorted(spawned) == pending_jobs[:3]
+
+
+def test_fallback_loop_without_returning(
+    db_session: Session, pending_jobs: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    spawned: list[str] = []
+    monkeypatch.setattr(db_session.get_bind().dialect, "update_returning", False)
+    monkeypatch.setattr(scheduler, "get_settings", lambda: _Settings())
+    monkeypatch.setattr(scheduler, "_spawn_worker", lambda job_id: spawned.append(job_id) or 7)
+
+    scheduler.schedule_jobs(db_session)
+
+    assert spawned == pending_jobs[:3]
+
+
+def test_spawn_failure_releases_untried_claims(
+    db_session: Session, pending_jobs: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+
+    def _spawn(job_id: str) -> int:
+        calls.append(job_id)
+        if len(calls) == 2:
+            raise RuntimeError("spawn failed")
+        return 7
+
+    monkeypatch.setattr(scheduler, "get_settings", lambda: _Settings())
+    monkeypatch.setattr(scheduler, "_spawn_worker", _spawn)
+
+    with pytest.raises(RuntimeError):
+        scheduler.schedule_jobs(db_session)
+
+    statuses = dict(db_session.query(Job.id, Job.status).all())
+    assert statuses[calls[0]] == str(JobStatus.RUNNING)
+    assert statuses[calls[1]] == str(JobStatus.RUNNING)  # failed spawn waits for reconcile
+    assert list(statuses.values()).count(str(JobStatus.PENDING)) == 3
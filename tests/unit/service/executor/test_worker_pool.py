@@ -0,0 +1,182 @@
+# tests/unit/service/executor/test_worker_pool.py
+
+from __future__ import annotations
+
+import io
+import itertools
+import queue
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from engine.core.constants.statuses import ItemStatus, JobStatus
+from service.db.models import Job, JobItem
+from service.executor import pool as pool_mod, scheduler
+
+pytestmark = pytest.mark.unit
+
+_pids = itertools.count(100)
+
+
+class _Stdout:
+    """Blocking line source; None closes the stream like a process exit."""
+
+    def __init__(self) -> None:
+        self.lines: queue.Queue[str | None] = queue.Queue()
+
+    def __iter__(self) -> Iterator[str]:
+        while (line := self.lines.get(timeout=5)) is not None:
+            yield line
+
+
+class _Proc:
+    def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003 - mirrors Popen
+        self.pid = next(_pids)
+        self.stdin = io.StringIO()
+        self.stdout = _Stdout()
+
+    def wait(self, timeout: float | None = None) -> int:
+        self.stdout.lines.put(None)
+        return 0
+
+    def kill(self) -> None:
+        self.stdout.lines.put(None)
+
+    def terminate(self) -> None:
+        self.terminated = True
+        self.stdout.lines.put(None)
+
+
+def _make_pool(monkeypatch, size: int) -> tuple[pool_mod.WorkerPool, dict[str, list], dict]:
+    calls: dict[str, list] = {"done": [], "lost": [], "released": []}
+    events = {"done": threading.Event(), "lost": threading.Event()}
+
+    def _done(job_id: str) -> None:
+        calls["done"].append(job_id)
+        events["done"].set()
+
+    def _lost(pid: int, job_ids: set[str]) -> None:
+        calls["lost"].append((pid, job_ids))
+        events["lost"].set()
+
+    # WHY: Fake processes keep the stdin/stdout protocol observable without spawning Python.
+    monkeypatch.setattr(pool_mod.subprocess, "Popen", _Proc)
+
+    def _released(pid: int, job_ids: set[str]) -> None:
+        calls["released"].append((pid, job_ids))
+
+    wp = pool_mod.WorkerPool(
+        size, on_job_done=_done, on_worker_lost=_lost, on_jobs_released=_released
+    )
+    return wp, calls, events
+
+
+def test_dispatch_prefers_idle_worker_and_done_frees_it(monkeypatch) -> None:
+    wp, calls, events = _make_pool(monkeypatch, size=2)
+    wp.start()
+
+    first = wp.dispatch("job-a")
+    second = wp.dispatch("job-b")
+    assert first != second  # least-busy choice spreads jobs
+
+    proc = next(w.proc for w in wp._workers if w.pid == first)
+    assert proc.stdin.getvalue() == "job-a\n"
+
+    proc.stdout.lines.put(f"{pool_mod.DONE_MARK} job-a\n")
+    assert events["done"].wait(2)
+    assert calls["done"] == ["job-a"]
+    assert wp.dispatch("job-c") == first
+
+    wp.stop()
+
+
+def test_worker_exit_reports_lost_jobs_and_respawns(monkeypatch) -> None:
+    wp, calls, events = _make_pool(monkeypatch, size=1)
+    wp.start()
+    pid = wp.dispatch("job-x")
+
+    wp._workers[0].proc.stdout.lines.put(None)  # e.g. SIGTERM from cancel
+    assert events["lost"].wait(2)
+
+    assert calls["lost"] == [(pid, {"job-x"})]
+    assert len(wp.pids()) == 1
+    assert wp.pids()[0] != pid
+    wp.stop()
+
+
+def test_cancel_queued_job_leaves_the_worker_running(monkeypatch) -> None:
+    wp, calls, _ = _make_pool(monkeypatch, size=1)
+    wp.start()
+    wp.dispatch("job-a")
+    wp.dispatch("job-b")
+
+    assert wp.cancel("job-b") is False
+    assert list(wp._workers[0].busy) == ["job-a"]
+    assert not getattr(wp._workers[0].proc, "terminated", False)
+    assert calls["released"] == []
+    wp.stop()
+
+
+def test_cancel_running_job_releases_the_queue_then_terminates(monkeypatch) -> None:
+    wp, calls, events = _make_pool(monkeypatch, size=1)
+    wp.start()
+    pid = wp.dispatch("job-a")
+    wp.dispatch("job-b")
+    wp.dispatch("job-c")
+
+    assert wp.cancel("job-a") is True
+    assert calls["released"] == [(pid, {"job-b", "job-c"})]
+    assert events["lost"].wait(2)
+    assert calls["lost"] == [(pid, {"job-a"})]  # only the cancelled job is lost
+    assert wp.cancel("job-unknown") is False
+    wp.stop()
+
+
+def test_dispatch_without_running_pool_raises(monkeypatch) -> None:
+    wp, _, _ = _make_pool(monkeypatch, size=1)
+    with pytest.raises(RuntimeError):
+        wp.dispatch("job-z")
+
+
+def test_spawn_worker_uses_pool_when_running(monkeypatch) -> None:
+    class _Pool:
+        def dispatch(self, job_id: str) -> int:
+            return 777
+
+    monkeypatch.setattr(scheduler, "get_worker_pool", lambda: _Pool())
+    assert scheduler._spawn_worker("job-1") == 777
+
+
+def test_fail_lost_jobs_only_touches_running_rows_of_that_pid(
+    db_session, make_job, make_item
+) -> None:
+    running = make_job("job-run", JobStatus.RUNNING)
+    running.worker_pid = 55
+    done = make_job("job-done", JobStatus.DONE)
+    done.worker_pid = None
+    db_session.commit()
+    make_item("job-run", "it-1", 0, ItemStatus.PENDING)
+
+    scheduler.fail_lost_jobs(db_session, 55, {"job-run", "job-done"})
+
+    assert db_session.get(Job, "job-run").status == str(JobStatus.FAILED)
+    assert db_session.get(Job, "job-done").status == str(JobStatus.DONE)
+    item = db_session.get(JobItem, "it-1")
+    assert item.status == str(ItemStatus.CANCELLED)
+    assert item.error_code == "SYSTEM_FAILURE"
+
+
+def test_requeue_worker_jobs_returns_queued_rows_to_pending(db_session, make_job) -> None:
+    queued = make_job("job-q", JobStatus.RUNNING)
+    queued.worker_pid = 55
+    other = make_job("job-other", JobStatus.RUNNING)
+    other.worker_pid = 66
+    db_session.commit()
+
+    scheduler.requeue_worker_jobs(db_session, 55, {"job-q", "job-other"})
+    db_session.expire_all()
+
+    row = db_session.get(Job, "job-q")
+    assert (row.status, row.worker_pid) == (str(JobStatus.PENDING), None)
+    assert db_session.get(Job, "job-other").status == str(JobStatus.RUNNING)